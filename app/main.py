@@ -88,7 +88,7 @@ except Exception as e:
     raise
 
 try:
-    from app.routes.monitor import StatsTrackingMiddleware, _load_stats
+    from app.routes.monitor import StatsTrackingMiddleware, _check_stats_session, _schedule_stats_reset
 except Exception as e:
     logger.error(f"Failed to import StatsTrackingMiddleware: {e}")
     logger.error(traceback.format_exc())
@@ -146,8 +146,10 @@ except Exception as e:
 async def startup_event():
     """Detect app restart and reset stats on startup."""
     try:
-        # Call _load_stats() to trigger restart detection immediately on app startup
-        _load_stats()
+        # Restart detection runs once per worker instead of on every stats load
+        _check_stats_session()
+        # Schedule the 3-hour error reset instead of checking it per request
+        _schedule_stats_reset()
     except Exception as e:
         # Don't crash app startup if stats loading fails
         logger.error(f"Failed to load stats on startup: {e}")
@@ -8,19 +8,30 @@ logger = logging.getLogger(__name__)
 
 try:
     from fastapi import APIRouter, Request, HTTPException, status, Depends
-    from fastapi.security import HTTPBasic, HTTPBasicCredentials
-    from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+    from fastapi.security import HTTPBasic
+    from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
     from starlette.middleware.base import BaseHTTPMiddleware
-    from typing import List, Dict, Any, Optional
+    from typing import List, Dict, Any, Optional, Tuple
     import psutil
     import os
+    import pickle
     import time
     import json
+    import re
+    import asyncio
     import fcntl
+    import functools
+    import gzip
+    import itertools
+    import mmap
+    import struct
     import subprocess
     import shutil
     import threading
+    from collections import deque, namedtuple
+    from contextlib import contextmanager
     from datetime import datetime
+    from urllib.parse import parse_qs, quote
     from pathlib import Path
 except Exception as e:
     logger.error(f"Failed to import standard libraries: {e}")
@@ -39,43 +50,127 @@ router = APIRouter()
 # HTTP Basic Authentication security instance
 security = HTTPBasic()
 
-def verify_dashboard_credentials(credentials: HTTPBasicCredentials = Depends(security)):
+# Cache of successful dashboard logins (Authorization header digest -> (username, validated_at))
+# so HTML pages don't re-validate on every request; failures are never cached
+_auth_cache = {
+    "entries": {},
+    "lock": threading.Lock()
+}
+AUTH_CACHE_TTL = 60  # Seconds; rotated credentials take effect within a minute
+AUTH_CACHE_MAXSIZE = 256
+
+async def verify_dashboard_credentials(request: Request):
     """Verify dashboard credentials using HTTP Basic Authentication.
     
     This dependency function is used by protected HTML endpoints to authenticate users.
     It triggers the browser's native authentication dialog when credentials are missing or invalid.
+    Successful logins are cached by a digest of the raw Authorization header, so repeat
+    requests from the same browser skip the Basic decoding as well as the validation.
     
     Args:
-        credentials: HTTP Basic Auth credentials from the security dependency
+        request: Incoming request carrying the Authorization header
         
     Returns:
         str: Username if credentials are valid
         
     Raises:
-        HTTPException: 401 with WWW-Authenticate header if credentials are invalid
+        HTTPException: 401 with WWW-Authenticate header if credentials are missing or invalid
     """
     from app.services.auth import validate_dashboard_credentials
     
+    # Key by a digest of the header - plaintext credentials are never stored
+    authorization = request.headers.get("authorization")
+    cache_key = None
+    current_time = time.time()
+    if authorization:
+        cache_key = hashlib.blake2b(authorization.encode('utf-8'), digest_size=16).digest()
+        with _auth_cache["lock"]:
+            cached = _auth_cache["entries"].get(cache_key)
+            if cached is not None and current_time - cached[1] < AUTH_CACHE_TTL:
+                return cached[0]
+    
+    # Cache miss: decode the header (raises the 401 challenge if missing or malformed)
+    credentials = await security(request)
     if not validate_dashboard_credentials(credentials.username, credentials.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Basic"},
         )
+    
+    with _auth_cache["lock"]:
+        entries = _auth_cache["entries"]
+        entries.pop(cache_key, None)
+        entries[cache_key] = (credentials.username, current_time)
+        # Evict oldest entries beyond the size limit (dicts keep insertion order)
+        while len(entries) > AUTH_CACHE_MAXSIZE:
+            del entries[next(iter(entries))]
     return credentials.username
 
-# File-based stats storage (shared across workers)
-STATS_FILE = Path("/var/run/frl-python-api/stats.json")
+# File-based stats storage (shared across workers). Pickled rather than JSON: the
+# request buckets and response-time window load and dump several times faster in
+# binary, and deques round-trip without list conversion. The file is only written
+# by this app under /var/run, so unpickling it is trusted input.
+STATS_FILE = Path("/var/run/frl-python-api/stats.pkl")
+STATS_PICKLE_PROTOCOL = 5
 STATS_LOCK_FILE = Path("/var/run/frl-python-api/stats.lock")
+STATS_RESET_INTERVAL = 10800  # Reset error counts every 3 hours
+_stats_reset_timer = {"timer": None, "lock": threading.Lock()}
+# Requests over the last 5 minutes are counted in per-second buckets (a fixed-size
+# ring indexed by unix second), so the persisted window doesn't grow with traffic
+REQUEST_WINDOW_SECONDS = 300
+REQUEST_TIMES_MAXLEN = 100  # Response times kept for the average
+
+# Shared-memory hot counters (total_requests, errors) - avoids JSON round-trips
+# for the two monotonic counters. The segment is keyed by master PID, so a
+# Gunicorn restart starts from fresh counters.
+COUNTERS_DIR = Path("/dev/shm") if Path("/dev/shm").is_dir() else STATS_FILE.parent
+COUNTERS_FILE_PREFIX = "frl-stats-"
+COUNTERS_LAYOUT = struct.Struct("=QQ")  # total_requests, errors
+
+# Gunicorn master PID as seen by this worker; constant for the worker's lifetime
+# (None in dev mode). Refreshed when /monitor/workers rescans processes.
+_MASTER_PID: Optional[int] = None
+_MASTER_PID_RESOLVED = False
+
+_counters = {
+    "mm": None,
+    "fd": None,
+    "pid": None,  # Process that opened the mapping (re-opened after fork)
+    "lock": threading.Lock()
+}
 
 # Cache for system metrics (reduces file I/O and process enumeration)
 _system_metrics_cache = {
     "data": None,
     "timestamp": 0,
-    "lock": threading.Lock(),
-    "cpu_baseline_set": False  # Track if CPU baseline has been established
+    "lock": threading.Lock()
 }
 SYSTEM_METRICS_CACHE_TTL = 0.5  # Cache for 0.5 seconds
+# Prime psutil's CPU counter so the first request doesn't sleep to take a measurement
+psutil.cpu_percent(interval=None)
+
+# Serialized payloads of the polled JSON endpoints (/stats, /workers, /dashboard, /health).
+# Concurrent dashboard clients within SNAPSHOT_TTL share one build and one encode per worker.
+_snapshot_cache = {
+    "entries": {},  # name -> (timestamp, data, body, Server-Sent Events frame of body, ETag of body)
+    "locks": {}  # name -> (event loop, asyncio.Lock) - single-flight rebuilds
+}
+SNAPSHOT_TTL = 0.5  # Matches the dashboard cadence; also the staleness bound of every served snapshot
+
+# Server-Sent Events streams of the snapshots (one connection per open page instead of polling)
+STREAM_INTERVAL = 0.5  # Seconds between snapshot checks
+STREAM_KEEPALIVE_INTERVAL = 15.0  # Comment line sent when nothing changed, keeps proxies from timing out
+STREAM_MAX_DURATION = 300.0  # Streams end after this long; EventSource reconnects (lets workers restart cleanly)
+
+# Cache for the stats file existence/size shown in the development diagnostics
+_stats_file_info_cache = {
+    "timestamp": 0,
+    "exists": False,
+    "size": 0,
+    "lock": threading.Lock()
+}
+STATS_FILE_INFO_CACHE_TTL = 1.0  # Cache for 1 second
 
 # Cache for process enumeration (reduces CPU overhead)
 _process_enumeration_cache = {
@@ -83,12 +178,31 @@ _process_enumeration_cache = {
     "timestamp": 0,
     "lock": threading.Lock()
 }
-PROCESS_ENUMERATION_CACHE_TTL = 0.5  # Cache for 0.5 seconds
+PROCESS_ENUMERATION_CACHE_TTL = 5.0  # Cache for 5 seconds (invalidated early when a worker exits)
+
+# Reused psutil.Process objects keyed by PID (keeps cpu_percent baselines and
+# avoids re-reading /proc for every call). Entries are validated with
+# is_running(), which also detects PID reuse via create_time.
+_proc_cache: Dict[int, psutil.Process] = {}
+_proc_cache_lock = threading.Lock()
+# Previous (utime+stime ticks, wall time) per worker PID for CPU percent deltas
+_cpu_times_prev: Dict[int, Tuple[int, float]] = {}
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+BYTES_TO_MB = 1.0 / (1024 ** 2)
+BYTES_TO_GB = 1.0 / (1024 ** 3)
+
+# Last discovered Gunicorn master; survives the enumeration cache TTL and is
+# re-validated by reading /proc/<pid>/cmdline instead of scanning every process
+_master_pid_cache = {"pid": None, "cmdline": None}
 
 # Log file configuration
 LOG_FILE_PATH = os.getenv("LOG_FILE_PATH", "/var/log/frl-python-api/app.log")
 USE_JOURNALCTL = os.getenv("USE_JOURNALCTL", "false").lower() == "true"
 
+# Diagnostic output in /stats is only included in development
+IS_DEVELOPMENT = os.getenv("ENVIRONMENT", "production").lower() == "development"
+
 
 def _find_journalctl_path() -> str:
     """Find the path to journalctl executable."""
@@ -122,213 +236,503 @@ except Exception as e:
     logger.error(traceback.format_exc())
     JOURNALCTL_PATH = "journalctl"  # Fallback
 
-# Initialize stats file if it doesn't exist
-try:
-    if not STATS_FILE.exists():
+_paths_ready = False  # Set once the stats directory and lock file exist
+
+# Lock file descriptor opened once per process (flock needs a separate open file
+# description per worker, so it is re-opened after fork). Threads in the same
+# process share it, so _LOCK_FD_THREAD_LOCK serializes them.
+_LOCK_FD: Optional[int] = None
+_LOCK_FD_THREAD_LOCK = threading.Lock()
+
+
+def _ensure_stats_paths():
+    """Create the stats directory and lock file once (re-run after a failed open)."""
+    global _paths_ready
+    if _paths_ready:
+        return
+    STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STATS_LOCK_FILE.touch(exist_ok=True)
+    _paths_ready = True
+
+
+def _reset_stats_paths():
+    """Forget the stats paths and lock fd so the next call re-creates/re-opens them."""
+    global _paths_ready, _LOCK_FD
+    _paths_ready = False
+    if _LOCK_FD is not None:
         try:
-            # Ensure directory exists
-            STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            
-            initial_stats = {
-                "total_requests": 0,
-                "request_times": [],
-                "errors": 0,
-                "start_time": time.time(),
-                "last_minute_requests": [],
-                "last_reset_time": time.time(),
-                "app_session_id": None,  # Will be set on first load based on master PID
-            }
-            with open(STATS_FILE, 'w') as f:
-                json.dump(initial_stats, f)
-        except Exception as e:
-            logger.error(f"Failed to initialize stats file {STATS_FILE}: {e}")
-            logger.error(traceback.format_exc())
-except Exception as e:
-    logger.error(f"Error checking stats file: {e}")
-    logger.error(traceback.format_exc())
+            os.close(_LOCK_FD)
+        except OSError:
+            pass
+        _LOCK_FD = None
+
+
+def _reopen_lock_fd_after_fork():
+    """Drop the parent's lock fd in a forked worker; it is re-opened lazily."""
+    global _LOCK_FD, _LOCK_FD_THREAD_LOCK
+    _LOCK_FD_THREAD_LOCK = threading.Lock()
+    _reset_stats_paths()
+
+
+os.register_at_fork(after_in_child=_reopen_lock_fd_after_fork)
+
+
+@contextmanager
+def _stats_lock_fd():
+    """Yield the process-wide stats lock fd, held exclusively by the calling thread."""
+    global _LOCK_FD
+    with _LOCK_FD_THREAD_LOCK:
+        if _LOCK_FD is None:
+            _ensure_stats_paths()
+            _LOCK_FD = os.open(str(STATS_LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        yield _LOCK_FD
+
+
+def _master_pid() -> Optional[int]:
+    """Get the Gunicorn master PID, resolving it on first use."""
+    global _MASTER_PID, _MASTER_PID_RESOLVED
+    if not _MASTER_PID_RESOLVED:
+        _, _MASTER_PID = _get_gunicorn_processes()
+        _MASTER_PID_RESOLVED = True
+    return _MASTER_PID
+
+
+def _get_counters_map() -> mmap.mmap:
+    """Get the shared counters mapping, opening it on first use in this process."""
+    if _counters["mm"] is not None and _counters["pid"] == os.getpid():
+        return _counters["mm"]
+
+    with _counters["lock"]:
+        if _counters["mm"] is not None and _counters["pid"] == os.getpid():
+            return _counters["mm"]
+
+        # All workers share the same master PID; fall back to our own PID in dev mode
+        master_pid = _master_pid()
+        session_id = master_pid if master_pid is not None else os.getpid()
+        counters_path = COUNTERS_DIR / f"{COUNTERS_FILE_PREFIX}{session_id}"
+
+        fd = os.open(str(counters_path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < COUNTERS_LAYOUT.size:
+                # Extends with zero bytes; never truncates counters another worker wrote
+                os.ftruncate(fd, COUNTERS_LAYOUT.size)
+            mm = mmap.mmap(fd, COUNTERS_LAYOUT.size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        except Exception:
+            os.close(fd)
+            raise
+
+        _counters["mm"] = mm
+        _counters["fd"] = fd
+        _counters["pid"] = os.getpid()
+
+        # Remove segments left behind by previous app sessions
+        for stale_path in COUNTERS_DIR.glob(f"{COUNTERS_FILE_PREFIX}*"):
+            if stale_path != counters_path:
+                try:
+                    stale_pid = int(stale_path.name[len(COUNTERS_FILE_PREFIX):])
+                    if not psutil.pid_exists(stale_pid):
+                        stale_path.unlink()
+                except (ValueError, OSError):
+                    continue
+
+        return mm
+
+
+def _read_counters():
+    """Read (total_requests, errors) from the shared counters segment."""
+    try:
+        return COUNTERS_LAYOUT.unpack_from(_get_counters_map())
+    except Exception as e:
+        logger.error(f"Error reading request counters: {e}")
+        return 0, 0
+
+
+def _increment_counters(requests: int = 1, errors: int = 0):
+    """Atomically increment the shared request/error counters."""
+    try:
+        mm = _get_counters_map()
+        with _counters["lock"]:
+            fcntl.flock(_counters["fd"], fcntl.LOCK_EX)
+            try:
+                total_requests, error_count = COUNTERS_LAYOUT.unpack_from(mm)
+                COUNTERS_LAYOUT.pack_into(mm, 0, total_requests + requests, error_count + errors)
+            finally:
+                fcntl.flock(_counters["fd"], fcntl.LOCK_UN)
+    except Exception as e:
+        logger.error(f"Error updating request counters: {e}")
+
+
+def _reset_error_counter():
+    """Reset the shared error counter (total_requests is kept)."""
+    try:
+        mm = _get_counters_map()
+        with _counters["lock"]:
+            fcntl.flock(_counters["fd"], fcntl.LOCK_EX)
+            try:
+                total_requests, _ = COUNTERS_LAYOUT.unpack_from(mm)
+                COUNTERS_LAYOUT.pack_into(mm, 0, total_requests, 0)
+            finally:
+                fcntl.flock(_counters["fd"], fcntl.LOCK_UN)
+    except Exception as e:
+        logger.error(f"Error resetting error counter: {e}")
+
+
+def _materialize_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Make sure the sliding windows have their in-memory shapes (pickled ones are kept as-is)."""
+    request_times = stats.get("request_times")
+    if not isinstance(request_times, deque) or request_times.maxlen != REQUEST_TIMES_MAXLEN:
+        stats["request_times"] = deque(request_times or [], maxlen=REQUEST_TIMES_MAXLEN)
+    buckets = stats.get("request_buckets")
+    if not isinstance(buckets, list) or len(buckets) != REQUEST_WINDOW_SECONDS:
+        stats["request_buckets"] = [0] * REQUEST_WINDOW_SECONDS
+        stats["request_buckets_second"] = 0
+        # Migration: fold request timestamps from files written before the buckets
+        for timestamp in stats.pop("last_minute_requests", None) or []:
+            _record_recent_request(stats, timestamp)
+    if "request_time_sum" not in stats:
+        # Migration: running sum for files written before it was tracked
+        stats["request_time_sum"] = sum(stats["request_times"])
+    return stats
+
+
+def _with_counters(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay the shared-memory counters onto a stats dict loaded from file."""
+    stats["total_requests"], stats["errors"] = _read_counters()
+    return stats
 
 
 def _load_stats() -> Dict[str, Any]:
     """Load stats from file with locking.
     
-    Also handles 3-hour automatic reset of error counts and migration of stats format.
+    Restart detection and the 3-hour error reset run outside the request path
+    (see _check_stats_session and _schedule_stats_reset).
     """
     try:
-        # Ensure lock file exists
-        STATS_LOCK_FILE.touch(exist_ok=True)
+        # Ensure directory and lock file exist (no-op after the first call)
+        _ensure_stats_paths()
         
         # Check if file exists first (without lock to avoid unnecessary locking)
         if STATS_FILE.exists():
             # File exists - read with shared lock first
-            with open(STATS_LOCK_FILE, 'r+') as lock_file:
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH)  # Shared lock for reading
+            with _stats_lock_fd() as lock_fd:
+                fcntl.flock(lock_fd, fcntl.LOCK_SH)  # Shared lock for reading
                 try:
-                    with open(STATS_FILE, 'r') as f:
-                        stats = json.load(f)
+                    stats = _read_stats_file()
                 finally:
-                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-            
-            current_time = time.time()
-            
-            # Migration: Add missing fields if needed
-            needs_migration = False
-            if "last_reset_time" not in stats:
-                stats["last_reset_time"] = current_time
-                needs_migration = True
-            if "app_session_id" not in stats:
-                stats["app_session_id"] = None  # Will trigger reset below
-                needs_migration = True
-            
-            if needs_migration:
-                # Save migrated stats (will use exclusive lock in _save_stats)
-                _save_stats(stats)
-                # Continue to session check below (will reset if app_session_id is None)
-            
-            # Check if app session ID matches (app restart detection using master PID)
-            # Get current master PID - all workers share the same master PID
-            _, current_master_pid = _get_gunicorn_processes()
-            stored_session_id = stats.get("app_session_id")
-            
-            # If master PID not found (e.g., dev mode), skip restart detection
-            if current_master_pid is not None:
-                if stored_session_id is None:
-                    # First time setting session ID (migration or new install)
-                    # Need exclusive lock to update
-                    with open(STATS_LOCK_FILE, 'r+') as lock_file:
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)  # Exclusive lock for writing
-                        try:
-                            # Reload stats and set session ID
-                            with open(STATS_FILE, 'r') as f:
-                                stats = json.load(f)
-                            
-                            if stats.get("app_session_id") is None:
-                                stats["app_session_id"] = current_master_pid
-                                with open(STATS_FILE, 'w') as f:
-                                    json.dump(stats, f)
-                        finally:
-                            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-                elif stored_session_id != current_master_pid:
-                    # App has restarted - reset error-related counters
-                    # Need exclusive lock to reset - use double-check pattern
-                    with open(STATS_LOCK_FILE, 'r+') as lock_file:
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)  # Exclusive lock for writing
-                        try:
-                            # Double-check: reload stats in case another process already reset
-                            with open(STATS_FILE, 'r') as f:
-                                stats = json.load(f)
-                            
-                            # Get master PID again and check if reset is still needed
-                            _, current_master_pid = _get_gunicorn_processes()
-                            stored_session_id = stats.get("app_session_id")
-                            if current_master_pid is not None and stored_session_id is not None and stored_session_id != current_master_pid:
-                                # Reset error-related counters on app restart
-                                stats["errors"] = 0
-                                stats["total_requests"] = 0
-                                stats["request_times"] = []
-                                stats["last_minute_requests"] = []
-                                stats["last_reset_time"] = current_time
-                                stats["start_time"] = current_time
-                                stats["app_session_id"] = current_master_pid
-                                
-                                # Save reset stats
-                                with open(STATS_FILE, 'w') as f:
-                                    json.dump(stats, f)
-                                logger.info(f"Reset error counts on app restart. Errors: 0, Total requests: 0")
-                        finally:
-                            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-            
-            # Check if 3 hours (10800 seconds) have passed since last reset
-            time_since_reset = current_time - stats.get("last_reset_time", current_time)
-            if time_since_reset >= 10800:  # 3 hours
-                # Need exclusive lock to reset - use double-check pattern
-                with open(STATS_LOCK_FILE, 'r+') as lock_file:
-                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)  # Exclusive lock for writing
-                    try:
-                        # Double-check: reload stats in case another process already reset
-                        with open(STATS_FILE, 'r') as f:
-                            stats = json.load(f)
-                        
-                        # Check again if reset is still needed
-                        time_since_reset = current_time - stats.get("last_reset_time", current_time)
-                        if time_since_reset >= 10800:
-                            # Reset error-related counters (keep total_requests for cumulative count)
-                            stats["errors"] = 0
-                            stats["request_times"] = []
-                            stats["last_reset_time"] = current_time
-                            # Keep start_time, total_requests, and last_minute_requests unchanged
-                            
-                            # Save reset stats
-                            with open(STATS_FILE, 'w') as f:
-                                json.dump(stats, f)
-                            logger.info(f"Reset error counts after 3 hours. Errors: 0")
-                    finally:
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
             
-            return stats
+            return _with_counters(_materialize_stats(stats))
         else:
             # File doesn't exist - create it with exclusive lock
-            with open(STATS_LOCK_FILE, 'r+') as lock_file:
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)  # Exclusive lock for writing
+            with _stats_lock_fd() as lock_fd:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)  # Exclusive lock for writing
                 try:
                     # Double-check file doesn't exist (another process might have created it)
                     if STATS_FILE.exists():
-                        with open(STATS_FILE, 'r') as f:
-                            return json.load(f)
-                    
-                    # Create directory if it doesn't exist
-                    STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
+                        return _with_counters(_materialize_stats(_read_stats_file()))
                     
                     # Initialize stats
                     initial_stats = {
                         "total_requests": 0,
                         "request_times": [],
+                        "request_time_sum": 0,
                         "errors": 0,
                         "start_time": time.time(),
-                        "last_minute_requests": [],
+                        "request_buckets": [0] * REQUEST_WINDOW_SECONDS,
+                        "request_buckets_second": 0,
                         "last_reset_time": time.time(),
                         "app_session_id": None,  # Will be set on first load based on master PID
                     }
                     
                     # Create file
-                    with open(STATS_FILE, 'w') as f:
-                        json.dump(initial_stats, f)
+                    _write_stats_file(initial_stats)
                     logger.info(f"Created stats file: {STATS_FILE}")
-                    return initial_stats
+                    return _with_counters(_materialize_stats(initial_stats))
                 finally:
-                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
     except Exception as e:
+        if isinstance(e, FileNotFoundError):
+            # Stats directory or lock file was removed - recreate on next call
+            _reset_stats_paths()
         logger.error(f"Error loading stats: {e}")
         return {
             "total_requests": 0,
             "request_times": [],
+            "request_time_sum": 0,
             "errors": 0,
             "start_time": time.time(),
-            "last_minute_requests": [],
+            "request_buckets": [0] * REQUEST_WINDOW_SECONDS,
+            "request_buckets_second": 0,
             "last_reset_time": time.time(),
             "app_session_id": None,  # Will be set on first load based on master PID
         }
 
 
+def _read_stats_file() -> Dict[str, Any]:
+    """Read the stats dict from STATS_FILE (caller must hold the lock)."""
+    with open(STATS_FILE, 'rb') as f:
+        return pickle.load(f)
+
+
+def _write_stats_file(stats: Dict[str, Any]):
+    """Write stats to STATS_FILE atomically (caller must hold the exclusive lock).
+    
+    total_requests and errors live in the shared counters segment and are not persisted.
+    """
+    stats = {k: v for k, v in stats.items() if k not in ("total_requests", "errors")}
+    tmp_path = STATS_FILE.with_name(STATS_FILE.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(stats, f, protocol=STATS_PICKLE_PROTOCOL)
+    os.replace(tmp_path, STATS_FILE)
+
+
+# Initialize stats file if it doesn't exist
+try:
+    _ensure_stats_paths()
+    if not STATS_FILE.exists():
+        try:
+            initial_stats = {
+                "total_requests": 0,
+                "request_times": [],
+                "request_time_sum": 0,
+                "errors": 0,
+                "start_time": time.time(),
+                "request_buckets": [0] * REQUEST_WINDOW_SECONDS,
+                "request_buckets_second": 0,
+                "last_reset_time": time.time(),
+                "app_session_id": None,  # Will be set on first load based on master PID
+            }
+            _write_stats_file(initial_stats)
+        except Exception as e:
+            logger.error(f"Failed to initialize stats file {STATS_FILE}: {e}")
+            logger.error(traceback.format_exc())
+except Exception as e:
+    logger.error(f"Error checking stats file: {e}")
+    logger.error(traceback.format_exc())
+
+
 def _save_stats(stats: Dict[str, Any]):
     """Save stats to file with locking."""
     try:
-        # Ensure directory exists
-        STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure directory and lock file exist (no-op after the first call)
+        _ensure_stats_paths()
         
-        # Ensure lock file exists
-        STATS_LOCK_FILE.touch(exist_ok=True)
-        
-        with open(STATS_LOCK_FILE, 'r+') as lock_file:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)  # Exclusive lock for writing
+        with _stats_lock_fd() as lock_fd:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)  # Exclusive lock for writing
             try:
-                with open(STATS_FILE, 'w') as f:
-                    json.dump(stats, f)
+                _write_stats_file(stats)
             finally:
-                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
     except Exception as e:
+        if isinstance(e, FileNotFoundError):
+            # Stats directory or lock file was removed - recreate on next call
+            _reset_stats_paths()
         logger.error(f"Error saving stats to {STATS_FILE}: {e}")
 
 
+def _check_stats_session():
+    """Migrate the stats format and detect app restarts via the Gunicorn master PID.
+    
+    The master PID is constant for a worker's lifetime, so this runs once at
+    worker startup instead of on every stats load.
+    """
+    try:
+        stats = _load_stats()
+        current_time = time.time()
+        
+        # Migration: Add missing fields if needed
+        needs_migration = False
+        if "last_reset_time" not in stats:
+            stats["last_reset_time"] = current_time
+            needs_migration = True
+        if "app_session_id" not in stats:
+            stats["app_session_id"] = None  # Will trigger reset below
+            needs_migration = True
+        
+        if needs_migration:
+            # Save migrated stats (will use exclusive lock in _save_stats)
+            _save_stats(stats)
+            # Continue to session check below (will reset if app_session_id is None)
+        
+        # Check if app session ID matches (app restart detection using master PID)
+        # Get current master PID - all workers share the same master PID
+        current_master_pid = _master_pid()
+        stored_session_id = stats.get("app_session_id")
+        
+        # If master PID not found (e.g., dev mode), skip restart detection
+        if current_master_pid is not None:
+            if stored_session_id is None:
+                # First time setting session ID (migration or new install)
+                # Need exclusive lock to update
+                with _stats_lock_fd() as lock_fd:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX)  # Exclusive lock for writing
+                    try:
+                        # Reload stats and set session ID
+                        stats = _read_stats_file()
+                        
+                        if stats.get("app_session_id") is None:
+                            stats["app_session_id"] = current_master_pid
+                            _write_stats_file(stats)
+                    finally:
+                        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            elif stored_session_id != current_master_pid:
+                # App has restarted - reset error-related counters
+                # Need exclusive lock to reset - use double-check pattern
+                with _stats_lock_fd() as lock_fd:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX)  # Exclusive lock for writing
+                    try:
+                        # Double-check: reload stats in case another process already reset
+                        stats = _read_stats_file()
+                        
+                        # Check if reset is still needed
+                        stored_session_id = stats.get("app_session_id")
+                        if current_master_pid is not None and stored_session_id is not None and stored_session_id != current_master_pid:
+                            # Reset error-related counters on app restart
+                            stats["errors"] = 0
+                            stats["total_requests"] = 0
+                            stats["request_times"] = []
+                            stats["request_time_sum"] = 0
+                            stats["request_buckets"] = [0] * REQUEST_WINDOW_SECONDS
+                            stats["request_buckets_second"] = 0
+                            stats["last_reset_time"] = current_time
+                            stats["start_time"] = current_time
+                            stats["app_session_id"] = current_master_pid
+                            
+                            # Save reset stats
+                            _write_stats_file(stats)
+                            logger.info(f"Reset error counts on app restart. Errors: 0, Total requests: 0")
+                    finally:
+                        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    except Exception as e:
+        logger.error(f"Error checking stats session: {e}")
+
+
+def _reset_stats_if_due() -> float:
+    """Reset error counts if 3 hours have passed since the last reset.
+    
+    Returns:
+        The (possibly updated) last_reset_time
+    """
+    current_time = time.time()
+    last_reset_time = current_time
+    try:
+        # Need exclusive lock to reset - use double-check pattern (another worker's timer may fire first)
+        with _stats_lock_fd() as lock_fd:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)  # Exclusive lock for writing
+            try:
+                # Double-check: reload stats in case another process already reset
+                stats = _read_stats_file()
+                
+                # Check if reset is due
+                last_reset_time = stats.get("last_reset_time", current_time)
+                time_since_reset = current_time - last_reset_time
+                if time_since_reset >= STATS_RESET_INTERVAL:
+                    # Reset error-related counters (keep total_requests for cumulative count)
+                    stats["errors"] = 0
+                    stats["request_times"] = []
+                    stats["request_time_sum"] = 0
+                    stats["last_reset_time"] = last_reset_time = current_time
+                    # Keep start_time, total_requests, and request_buckets unchanged
+                    
+                    # Save reset stats
+                    _write_stats_file(stats)
+                    _reset_error_counter()
+                    logger.info(f"Reset error counts after 3 hours. Errors: 0")
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    except Exception as e:
+        logger.error(f"Error resetting stats: {e}")
+    return last_reset_time
+
+
+def _run_scheduled_stats_reset():
+    """Timer callback: reset if due, then schedule the next check."""
+    _schedule_stats_reset(_reset_stats_if_due())
+
+
+def _schedule_stats_reset(last_reset_time: Optional[float] = None):
+    """Schedule the next 3-hour error reset on a daemon timer (one per worker)."""
+    if last_reset_time is None:
+        last_reset_time = _load_stats().get("last_reset_time", time.time())
+    delay = max(0, STATS_RESET_INTERVAL - (time.time() - last_reset_time))
+    
+    with _stats_reset_timer["lock"]:
+        if _stats_reset_timer["timer"] is not None:
+            _stats_reset_timer["timer"].cancel()
+        timer = threading.Timer(delay, _run_scheduled_stats_reset)
+        timer.daemon = True
+        timer.start()
+        _stats_reset_timer["timer"] = timer
+
+
+def _advance_request_buckets(stats: Dict[str, Any], current_second: int):
+    """Zero the buckets of seconds that left the window since the newest recorded second."""
+    buckets = stats["request_buckets"]
+    elapsed = current_second - stats["request_buckets_second"]
+    if elapsed <= 0:
+        return
+    if elapsed >= REQUEST_WINDOW_SECONDS:
+        buckets[:] = [0] * REQUEST_WINDOW_SECONDS
+    else:
+        for second in range(current_second - elapsed + 1, current_second + 1):
+            buckets[second % REQUEST_WINDOW_SECONDS] = 0
+    stats["request_buckets_second"] = current_second
+
+
+def _record_recent_request(stats: Dict[str, Any], current_time: float):
+    """Count a request in the bucket for its second.
+    
+    Only buckets for seconds that expired since the last request are cleared, so
+    the cost doesn't depend on how many requests the window holds.
+    """
+    current_second = int(current_time)
+    _advance_request_buckets(stats, current_second)
+    # A slightly older timestamp (another worker recorded a later second first) still
+    # belongs to its own bucket while it is inside the window
+    if stats["request_buckets_second"] - current_second < REQUEST_WINDOW_SECONDS:
+        stats["request_buckets"][current_second % REQUEST_WINDOW_SECONDS] += 1
+
+
+def _count_recent_requests(stats: Dict[str, Any], current_time: float) -> int:
+    """Number of requests in the last REQUEST_WINDOW_SECONDS, without modifying stats."""
+    buckets = stats["request_buckets"]
+    current_second = int(current_time)
+    elapsed = current_second - stats["request_buckets_second"]
+    if elapsed >= REQUEST_WINDOW_SECONDS:
+        return 0
+    total = sum(buckets)
+    # Buckets for seconds since the newest recorded one still hold counts from a full window ago
+    for second in range(current_second - elapsed + 1, current_second + 1):
+        total -= buckets[second % REQUEST_WINDOW_SECONDS]
+    return total
+
+
+def _record_response_time(stats: Dict[str, Any], response_time: float):
+    """Append a response time, keeping only the most recent REQUEST_TIMES_MAXLEN.
+    
+    Maintains request_time_sum alongside so the average is O(1).
+    """
+    request_times = stats.get("request_times")
+    if not isinstance(request_times, deque) or request_times.maxlen != REQUEST_TIMES_MAXLEN:
+        request_times = deque(request_times or [], maxlen=REQUEST_TIMES_MAXLEN)
+        stats["request_times"] = request_times
+        stats["request_time_sum"] = sum(request_times)
+    request_time_sum = stats.get("request_time_sum", 0)
+    if len(request_times) == REQUEST_TIMES_MAXLEN:
+        # The append below evicts the oldest value
+        request_time_sum -= request_times[0]
+    request_times.append(response_time)
+    stats["request_time_sum"] = request_time_sum + response_time
+
+
+def _average_response_time(stats: Dict[str, Any]) -> float:
+    """Average of the stored response times (already capped at REQUEST_TIMES_MAXLEN)."""
+    request_times = stats.get("request_times")
+    if not request_times:
+        return 0
+    return max(stats.get("request_time_sum", 0), 0) / len(request_times)
+
+
 def _update_stats(update_func):
     """Atomically update stats."""
     stats = _load_stats()
@@ -336,12 +740,18 @@ def _update_stats(update_func):
     _save_stats(stats)
 
 
+_MONITOR_PREFIX = "/monitor"
+_MONITOR_PREFIX_LEN = len(_MONITOR_PREFIX)
+
+
 class StatsTrackingMiddleware(BaseHTTPMiddleware):
     """Middleware to track request statistics."""
     
     async def dispatch(self, request: Request, call_next):
         # Skip tracking for monitoring endpoints to avoid recursion
-        if request.url.path.startswith("/monitor"):
+        # (raw ASGI scope path avoids building request.url on every request)
+        path = request.scope.get("path", "")
+        if path[:_MONITOR_PREFIX_LEN] == _MONITOR_PREFIX:
             return await call_next(request)
         
         # Record request start time
@@ -352,50 +762,34 @@ class StatsTrackingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
         except Exception as e:
             # Track errors
+            _increment_counters(requests=1, errors=1)
+            
             def update_error(stats):
-                stats["errors"] += 1
-                stats["total_requests"] += 1
-                current_time = time.time()
-                stats["last_minute_requests"].append(current_time)
-                # Clean old timestamps (older than 5 minutes)
-                stats["last_minute_requests"] = [
-                    t for t in stats["last_minute_requests"]
-                    if current_time - t < 300
-                ]
+                _record_recent_request(stats, time.time())
             _update_stats(update_error)
             raise
         
         # Calculate response time
         response_time = time.time() - start_time
         
+        # Update hot counters in shared memory (only 5xx server errors count, not 4xx client errors)
+        _increment_counters(requests=1, errors=1 if response.status_code >= 500 else 0)
+        
         # Update stats atomically
         def update_stats(stats):
-            stats["total_requests"] += 1
-            current_time = time.time()
-            stats["last_minute_requests"].append(current_time)
-            # Clean old timestamps (older than 5 minutes)
-            stats["last_minute_requests"] = [
-                t for t in stats["last_minute_requests"]
-                if current_time - t < 300
-            ]
+            _record_recent_request(stats, time.time())
             
             # Track response time (keep last 100)
-            stats["request_times"].append(response_time)
-            if len(stats["request_times"]) > 100:
-                stats["request_times"] = stats["request_times"][-100:]
-            
-            # Track errors (only 5xx server errors, not 4xx client errors)
-            if response.status_code >= 500:
-                stats["errors"] += 1
+            _record_response_time(stats, response_time)
         
         _update_stats(update_stats)
         
         # Log request at INFO level (visible in logs page)
-        logger.info(f"{request.method} {request.url.path} - {response.status_code} - {response_time:.3f}s")
+        logger.info("%s %s - %s - %.3fs", request.method, path, response.status_code, response_time)
         
         # Log errors at WARNING level for visibility
         if response.status_code >= 400:
-            logger.warning(f"Request error: {request.method} {request.url.path} - Status {response.status_code} - {response_time:.3f}s")
+            logger.warning("Request error: %s %s - Status %s - %.3fs", request.method, path, response.status_code, response_time)
         
         return response
 
@@ -417,32 +811,132 @@ def _get_gunicorn_processes():
         return result
 
 
+def _invalidate_process_enumeration_cache():
+    """Force the next _get_gunicorn_processes() call to rescan (e.g. a cached worker exited)."""
+    with _process_enumeration_cache["lock"]:
+        _process_enumeration_cache["data"] = None
+
+
+def _get_process(pid: int) -> Optional[psutil.Process]:
+    """Get a cached psutil.Process for pid, or None if the process is gone."""
+    with _proc_cache_lock:
+        proc = _proc_cache.get(pid)
+        if proc is not None:
+            try:
+                if proc.is_running():
+                    return proc
+            except psutil.Error:
+                pass
+            del _proc_cache[pid]
+        
+        try:
+            proc = psutil.Process(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+        _proc_cache[pid] = proc
+        return proc
+
+
+def _prune_process_cache(live_pids):
+    """Drop cached Process objects for PIDs that are no longer tracked."""
+    with _proc_cache_lock:
+        for pid in list(_proc_cache):
+            if pid not in live_pids:
+                del _proc_cache[pid]
+
+
+def _read_proc_cmdline(pid: int) -> Optional[bytes]:
+    """Read the raw cmdline of a process from /proc, or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _get_cached_master_pid() -> Optional[int]:
+    """Return the cached master PID if it still refers to the same Gunicorn master."""
+    cached_pid = _master_pid_cache["pid"]
+    if cached_pid is None:
+        return None
+    cmdline = _read_proc_cmdline(cached_pid)
+    if cmdline and b'gunicorn' in cmdline and cmdline == _master_pid_cache["cmdline"]:
+        return cached_pid
+    _master_pid_cache["pid"] = None
+    _master_pid_cache["cmdline"] = None
+    return None
+
+
+def _sample_worker_cpu(pid: int, now: float):
+    """Sample CPU percent and RSS for a worker from a single /proc/<pid>/stat read.
+    
+    CPU percent is the utime+stime delta since the previous sample of the same PID
+    divided by elapsed wall time (first sample returns 0, like psutil's baseline).
+    
+    Returns:
+        Tuple of (cpu_percent, rss_bytes)
+    
+    Raises:
+        psutil.NoSuchProcess: If the process no longer exists
+    """
+    try:
+        with open(f"/proc/{pid}/stat", 'rb') as f:
+            data = f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        raise psutil.NoSuchProcess(pid)
+    
+    # Fields after "(comm)" start at field 3 (state); utime/stime are fields 14/15, rss is field 24
+    fields = data[data.rfind(b')') + 2:].split()
+    cpu_ticks = int(fields[11]) + int(fields[12])
+    rss_bytes = int(fields[21]) * PAGE_SIZE
+    
+    cpu_percent = 0.0
+    previous = _cpu_times_prev.get(pid)
+    if previous is not None:
+        prev_ticks, prev_time = previous
+        elapsed = now - prev_time
+        if elapsed > 0:
+            cpu_percent = round((cpu_ticks - prev_ticks) / CLOCK_TICKS / elapsed * 100, 1)
+    _cpu_times_prev[pid] = (cpu_ticks, now)
+    return cpu_percent, rss_bytes
+
+
+def _cmdline_has(cmdline_lower: List[str], needle: str) -> bool:
+    """Check whether any (lowercased) cmdline argument contains needle."""
+    return any(needle in arg for arg in cmdline_lower)
+
+
 def _get_gunicorn_processes_uncached():
     """Find Gunicorn master and worker processes (uncached implementation)."""
     processes = []
     master_pid = None
+    master_proc = None
+    
+    # Reuse the previously found master while its cmdline still matches
+    master_pid = _get_cached_master_pid()
     
     # Strategy 1: Look for process with 'gunicorn' and 'app.main:app' in cmdline
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'ppid', 'create_time']):
-        try:
-            pinfo = proc.info
-            cmdline = pinfo.get('cmdline', [])
-            
-            if not cmdline:
-                continue
+    if not master_pid:
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            try:
+                pinfo = proc.info
+                cmdline = pinfo.get('cmdline', [])
                 
-            cmdline_str = ' '.join(str(arg) for arg in cmdline).lower()
-            
-            # Check if this is a Gunicorn master process
-            if 'gunicorn' in cmdline_str and 'app.main:app' in cmdline_str:
-                master_pid = pinfo['pid']
-                break
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
+                if not cmdline:
+                    continue
+                    
+                cmdline_lower = [arg.lower() for arg in cmdline]
+                
+                # Check if this is a Gunicorn master process
+                if _cmdline_has(cmdline_lower, 'gunicorn') and _cmdline_has(cmdline_lower, 'app.main:app'):
+                    master_pid = pinfo['pid']
+                    break
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
     
     # Strategy 2: If not found, look for gunicorn process with proc_name 'frl-python-api'
     if not master_pid:
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'ppid', 'create_time']):
+        for proc in psutil.process_iter(['pid', 'cmdline']):
             try:
                 pinfo = proc.info
                 cmdline = pinfo.get('cmdline', [])
@@ -450,22 +944,21 @@ def _get_gunicorn_processes_uncached():
                 if not cmdline:
                     continue
                     
-                cmdline_str = ' '.join(str(arg) for arg in cmdline).lower()
+                cmdline_lower = [arg.lower() for arg in cmdline]
                 
-                if 'gunicorn' in cmdline_str:
+                if _cmdline_has(cmdline_lower, 'gunicorn'):
                     # Check if it's the master (has proc_name or no gunicorn parent)
                     try:
-                        parent = psutil.Process(pinfo['pid']).parent()
+                        parent = proc.parent()
                         parent_cmdline = parent.cmdline() if parent else []
-                        parent_str = ' '.join(str(arg) for arg in parent_cmdline).lower()
                         
                         # Master process typically doesn't have a gunicorn parent
-                        if 'gunicorn' not in parent_str:
+                        if not any('gunicorn' in arg.lower() for arg in parent_cmdline):
                             master_pid = pinfo['pid']
                             break
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         # If we can't check parent, assume it might be master
-                        if 'frl-python-api' in cmdline_str or 'gunicorn_config' in cmdline_str:
+                        if _cmdline_has(cmdline_lower, 'frl-python-api') or _cmdline_has(cmdline_lower, 'gunicorn_config'):
                             master_pid = pinfo['pid']
                             break
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
@@ -474,24 +967,38 @@ def _get_gunicorn_processes_uncached():
     # Get worker processes from master
     if master_pid:
         try:
-            master_proc = psutil.Process(master_pid)
+            if master_proc is None:
+                master_proc = _get_process(master_pid)
+            if master_proc is None:
+                raise psutil.NoSuchProcess(master_pid)
             # Get all child processes (workers)
             for child in master_proc.children(recursive=False):
                 try:
-                    create_time = child.create_time()
-                    mem_info = child.memory_info()
+                    child = _get_process(child.pid) or child
+                    with child.oneshot():
+                        create_time = child.create_time()
+                        mem_info = child.memory_info()
+                        child_status = child.status()
                     
                     processes.append({
                         "pid": child.pid,
                         "cpu_percent": 0,  # Will be updated in get_workers
-                        "memory_mb": round(mem_info.rss / 1024 / 1024, 2),
+                        "memory_mb": round(mem_info.rss * BYTES_TO_MB, 2),
                         "uptime_seconds": int(time.time() - create_time),
-                        "status": child.status()
+                        "status": child_status
                     })
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+            master_pid = None
+    
+    if master_pid and master_pid != _master_pid_cache["pid"]:
+        _master_pid_cache["cmdline"] = _read_proc_cmdline(master_pid)
+        _master_pid_cache["pid"] = master_pid if _master_pid_cache["cmdline"] else None
+    elif not master_pid:
+        _master_pid_cache["pid"] = None
+        _master_pid_cache["cmdline"] = None
+    _prune_process_cache({master_pid, *(p["pid"] for p in processes)})
     
     return processes, master_pid
 
@@ -510,14 +1017,34 @@ def _generate_log_hash(timestamp: str, message: str, module: Optional[str] = Non
     Returns:
         Hex digest of the hash (64 characters)
     """
-    # Combine timestamp and message for hash
-    hash_input = f"{timestamp}|{message}"
-    if module:
-        hash_input = f"{timestamp}|{module}|{message}"
+    return _log_hash_digest(timestamp, message, module).hex()
+
+
+# Larger than the 5000 entries get_log_details scans, so a repeated lookup is served
+# entirely from the cache instead of LRU-evicting every entry in scan order
+LOG_HASH_CACHE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=LOG_HASH_CACHE_SIZE)
+def _log_hash_digest(timestamp: str, message: str, module: Optional[str] = None) -> bytes:
+    """Raw SHA256 digest of a log entry, memoized for repeated log detail lookups."""
+    return _log_hash_obj(timestamp, message, module).digest()
+
+
+def _log_hash_obj(timestamp: str, message: str, module: Optional[str] = None):
+    """Build the SHA256 hash object behind _generate_log_hash.
     
-    # Generate SHA256 hash
-    hash_obj = hashlib.sha256(hash_input.encode('utf-8'))
-    return hash_obj.hexdigest()
+    Feeds "timestamp|module|message" (or "timestamp|message") incrementally to skip
+    the joined copy. Must stay SHA256: the logs page computes the same hash in the
+    browser via crypto.subtle.digest('SHA-256'), which has no BLAKE2/xxhash support.
+    """
+    hash_obj = hashlib.sha256(timestamp.encode('utf-8'))
+    hash_obj.update(b'|')
+    if module:
+        hash_obj.update(module.encode('utf-8'))
+        hash_obj.update(b'|')
+    hash_obj.update(message.encode('utf-8'))
+    return hash_obj
 
 
 def _parse_log_line(line: str) -> Dict[str, str]:
@@ -545,18 +1072,31 @@ def _parse_log_line(line: str) -> Dict[str, str]:
         }
 
 
-def _extract_log_level(line: str) -> str:
+# Level keywords in priority order ("ERR" also matches ERROR, "WARN" also matches WARNING)
+_LOG_LEVEL_KEYWORD_RE = re.compile(r'ERR|WARN|INFO|DEBUG', re.IGNORECASE)
+_LOG_LEVEL_KEYWORD_RANK = {"ERR": 0, "WARN": 1, "INFO": 2, "DEBUG": 3}
+_LOG_LEVEL_BY_RANK = ("ERROR", "WARNING", "INFO", "DEBUG")
+
+
+def _extract_log_level(line: str) -> str:
     """Extract log level from journalctl output or log line."""
-    line_upper = line.upper()
-    if "ERROR" in line_upper or "ERR" in line_upper:
-        return "ERROR"
-    elif "WARNING" in line_upper or "WARN" in line_upper:
-        return "WARNING"
-    elif "INFO" in line_upper:
+    # Single case-insensitive pass; no uppercase copy of the line
+    best_rank = None
+    for match in _LOG_LEVEL_KEYWORD_RE.finditer(line):
+        rank = _LOG_LEVEL_KEYWORD_RANK[match.group().upper()]
+        if rank == 0:
+            return "ERROR"
+        if best_rank is None or rank < best_rank:
+            best_rank = rank
+    if best_rank is None:
         return "INFO"
-    elif "DEBUG" in line_upper:
-        return "DEBUG"
-    return "INFO"
+    return _LOG_LEVEL_BY_RANK[best_rank]
+
+
+# Precompiled patterns for journalctl level extraction (runs once per log line)
+_HTTP_2XX_STATUS_RE = re.compile(r'\s(2\d{2})\s*$')
+_MODULE_LEVEL_RE = re.compile(r'\s-\s+(\w+)\s+-\s+(ERROR|WARNING|INFO|DEBUG)\s+-\s+', re.IGNORECASE)
+_SIMPLE_LEVEL_RE = re.compile(r'^\s*(ERROR|WARNING|INFO|DEBUG)\s+-\s+', re.IGNORECASE)
 
 
 def _extract_journalctl_log_level(line: str) -> str:
@@ -573,14 +1113,11 @@ def _extract_journalctl_log_level(line: str) -> str:
     Returns:
         Log level (ERROR, WARNING, INFO, DEBUG)
     """
-    import re
-    
     # Step 1: Check for HTTP access logs with 2xx status codes
-    if 'HTTP/' in line:
-        # Look for status codes like " 200", " 201", " 202", " 204" at end of line or before whitespace
-        status_match = re.search(r'\s(2\d{2})\s*$', line)
-        if status_match:
-            return "INFO"
+    # Look for status codes like " 200", " 201", " 202", " 204" at end of line or before whitespace
+    stripped = line.rstrip()
+    if stripped[-3:-2] == '2' and 'HTTP/' in line and _HTTP_2XX_STATUS_RE.search(stripped):
+        return "INFO"
     
     # Step 2: Extract log level from actual message content (after the colon)
     # Format: TIMESTAMP LEVEL PRIORITY HOSTNAME SERVICE[PID]: ACTUAL_LOG_MESSAGE
@@ -591,11 +1128,11 @@ def _extract_journalctl_log_level(line: str) -> str:
         message_part = line[colon_index + 1:].strip()
         # Look for log level patterns in the message: " - LEVEL - " or "LEVEL - "
         # Pattern: timestamp - module - LEVEL - message
-        level_match = re.search(r'\s-\s+(\w+)\s+-\s+(ERROR|WARNING|INFO|DEBUG)\s+-\s+', message_part, re.IGNORECASE)
+        level_match = _MODULE_LEVEL_RE.search(message_part)
         if level_match:
             return level_match.group(2).upper()
         # Also check for simpler pattern: "LEVEL - message"
-        simple_level_match = re.search(r'^\s*(ERROR|WARNING|INFO|DEBUG)\s+-\s+', message_part, re.IGNORECASE)
+        simple_level_match = _SIMPLE_LEVEL_RE.search(message_part)
         if simple_level_match:
             return simple_level_match.group(1).upper()
         # Fall back to keyword search in the message part
@@ -625,6 +1162,59 @@ def _extract_journalctl_log_level(line: str) -> str:
     return _extract_log_level(line)
 
 
+# Subset of psutil.virtual_memory() fields used by the stats endpoints
+_MemInfo = namedtuple("_MemInfo", ["total", "available", "percent", "used", "free"])
+_MEMINFO_RE = re.compile(rb'^(MemTotal|MemFree|MemAvailable|Buffers|Cached|SReclaimable):\s+(\d+)', re.MULTILINE)
+
+
+def _read_meminfo():
+    """Read memory usage straight from /proc/meminfo (psutil fallback off Linux).
+    
+    Computes used/percent the same way psutil does on Linux.
+    """
+    try:
+        with open("/proc/meminfo", 'rb') as f:
+            data = f.read()
+    except OSError:
+        return psutil.virtual_memory()
+    
+    fields = {name: int(value) * 1024 for name, value in _MEMINFO_RE.findall(data)}
+    total = fields.get(b'MemTotal')
+    if not total:
+        return psutil.virtual_memory()
+    free = fields.get(b'MemFree', 0)
+    cached = fields.get(b'Cached', 0) + fields.get(b'SReclaimable', 0)
+    available = fields.get(b'MemAvailable', free + fields.get(b'Buffers', 0) + cached)
+    used = total - free - fields.get(b'Buffers', 0) - cached
+    if used < 0:
+        used = total - free
+    percent = round((total - available) / total * 100, 1)
+    return _MemInfo(total=total, available=available, percent=percent, used=used, free=free)
+
+
+def _get_stats_file_info() -> Tuple[bool, int]:
+    """Get whether the stats file exists and its size, cached briefly.
+    
+    Returns:
+        Tuple of (exists, size_in_bytes)
+    """
+    current_time = time.time()
+    
+    with _stats_file_info_cache["lock"]:
+        if current_time - _stats_file_info_cache["timestamp"] >= STATS_FILE_INFO_CACHE_TTL:
+            # One stat() call answers both questions
+            try:
+                size = STATS_FILE.stat().st_size
+                exists = True
+            except FileNotFoundError:
+                size = 0
+                exists = False
+            _stats_file_info_cache["exists"] = exists
+            _stats_file_info_cache["size"] = size
+            _stats_file_info_cache["timestamp"] = current_time
+        return _stats_file_info_cache["exists"], _stats_file_info_cache["size"]
+
+
 def _get_cached_system_metrics():
     """Get system metrics with caching to reduce file I/O and process enumeration."""
     current_time = time.time()
@@ -640,19 +1230,10 @@ def _get_cached_system_metrics():
         workers, _ = _get_gunicorn_processes()
         active_workers = len([w for w in workers if w.get('status') == 'running'])
         
-        # Get system CPU and memory usage
-        # For first call, use small interval to establish measurement
-        # For subsequent calls, use cached value (interval=0)
-        if not _system_metrics_cache["cpu_baseline_set"]:
-            # First call: establish baseline with small measurement
-            psutil.cpu_percent(interval=None)  # Reset internal counter
-            cpu_percent = psutil.cpu_percent(interval=0.1)  # Measure over 0.1s
-            _system_metrics_cache["cpu_baseline_set"] = True
-        else:
-            # Subsequent calls: use cached value (non-blocking)
-            cpu_percent = psutil.cpu_percent(interval=0)
+        # Non-blocking: CPU usage since the previous call (baseline primed at import)
+        cpu_percent = psutil.cpu_percent(interval=None)
         cpu_count = psutil.cpu_count()
-        mem = psutil.virtual_memory()
+        mem = _read_meminfo()
         disk = psutil.disk_usage('/')
         
         # Cache the metrics
@@ -668,24 +1249,149 @@ def _get_cached_system_metrics():
         return _system_metrics_cache["data"]
 
 
+def _collect_workers():
+    """Enumerate workers and sample their CPU/memory (blocking; run in a thread)."""
+    global _MASTER_PID, _MASTER_PID_RESOLVED
+    workers, master_pid = _get_gunicorn_processes()
+    _MASTER_PID, _MASTER_PID_RESOLVED = master_pid, True
+    
+    # Update CPU percentages (non-blocking, one /proc read per worker)
+    now = time.time()
+    for worker in workers:
+        try:
+            worker['cpu_percent'], rss_bytes = _sample_worker_cpu(worker['pid'], now)
+            worker['memory_mb'] = round(rss_bytes * BYTES_TO_MB, 2)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
+            worker['status'] = 'dead'
+            # Cached worker list is stale - rescan on the next call
+            _invalidate_process_enumeration_cache()
+    
+    # Forget samples for workers that are gone
+    live_pids = {worker['pid'] for worker in workers}
+    for pid in list(_cpu_times_prev):
+        if pid not in live_pids:
+            del _cpu_times_prev[pid]
+    
+    return workers, master_pid
+
+
+def _render_json(data: Dict[str, Any]) -> bytes:
+    """Encode a payload exactly like JSONResponse does."""
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _snapshot_lock(name: str) -> asyncio.Lock:
+    """Get the rebuild lock for a snapshot, created on (and bound to) the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _snapshot_cache["locks"].get(name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Lock())
+        _snapshot_cache["locks"][name] = entry
+    return entry[1]
+
+
+async def _get_snapshot(name: str, build) -> Tuple[Dict[str, Any], bytes]:
+    """Get a payload and its JSON encoding, rebuilt at most once per SNAPSHOT_TTL.
+    
+    Requests that arrive while a rebuild is running wait for it instead of
+    repeating the work.
+    
+    Args:
+        name: Snapshot name
+        build: Coroutine function producing the payload dict
+        
+    Returns:
+        Tuple of (payload, encoded_payload)
+    """
+    entry = _snapshot_cache["entries"].get(name)
+    if entry is not None and time.time() - entry[0] < SNAPSHOT_TTL:
+        return entry[1], entry[2]
+    
+    async with _snapshot_lock(name):
+        # Another request may have rebuilt it while we waited
+        entry = _snapshot_cache["entries"].get(name)
+        if entry is not None and time.time() - entry[0] < SNAPSHOT_TTL:
+            return entry[1], entry[2]
+        data = await build()
+        body = _render_json(data)
+        # Framed once here so open streams send the shared bytes as-is
+        event = b"data: " + body + b"\n\n"
+        # Hashed once here so polling clients can revalidate with If-None-Match
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        _snapshot_cache["entries"][name] = (time.time(), data, body, event, etag)
+        return data, body
+
+
+async def _get_snapshot_event(name: str, build) -> bytes:
+    """Get a snapshot as a ready-to-send Server-Sent Events data frame."""
+    await _get_snapshot(name, build)
+    return _snapshot_cache["entries"][name][3]
+
+
+async def _snapshot_response(request: Request, name: str, build) -> Response:
+    """Serve a cached snapshot's pre-encoded JSON, or a bodyless 304 if the client has it."""
+    _, body = await _get_snapshot(name, build)
+    etag = _snapshot_cache["entries"][name][4]
+    # no-cache: the browser must revalidate every poll, never reuse a stale snapshot
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _snapshot_events(request: Request, name: str, build):
+    """Yield Server-Sent Events frames carrying a snapshot whenever it is rebuilt.
+    
+    Every open stream shares the snapshot cache, so N viewers still cost one build per
+    SNAPSHOT_TTL; frames are only sent when the encoded payload changed.
+    """
+    # Ask EventSource to reconnect quickly when the stream ends
+    yield b"retry: 1000\n\n"
+    started = time.monotonic()
+    last_event = None
+    last_sent = started
+    while time.monotonic() - started < STREAM_MAX_DURATION:
+        if await request.is_disconnected():
+            break
+        try:
+            event = await _get_snapshot_event(name, build)
+        except Exception as e:
+            logger.error(f"Error building {name} snapshot for stream: {e}")
+            event = None
+        # Same object means no rebuild since the last tick; skip comparing the bytes
+        if event is not None and event is not last_event and event != last_event:
+            last_event = event
+            last_sent = time.monotonic()
+            yield event
+        elif time.monotonic() - last_sent >= STREAM_KEEPALIVE_INTERVAL:
+            last_sent = time.monotonic()
+            yield b": keepalive\n\n"
+        await asyncio.sleep(STREAM_INTERVAL)
+
+
+def _snapshot_stream_response(request: Request, name: str, build) -> StreamingResponse:
+    """Stream a snapshot as text/event-stream."""
+    return StreamingResponse(
+        _snapshot_events(request, name, build),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable Nginx response buffering for this stream
+        }
+    )
+
+
 @router.get("/workers", response_class=JSONResponse)
-async def get_workers():
+async def get_workers(request: Request):
     """Get Gunicorn worker process information."""
+    return await _snapshot_response(request, "workers", _build_workers_payload)
+
+
+async def _build_workers_payload() -> Dict[str, Any]:
+    """Build the /workers payload."""
     try:
-        workers, master_pid = _get_gunicorn_processes()
-        
-        # Update CPU percentages (non-blocking)
-        for worker in workers:
-            try:
-                proc = psutil.Process(worker['pid'])
-                # Establish baseline (non-blocking)
-                proc.cpu_percent(interval=None)
-                # Get cached CPU percentage (non-blocking)
-                worker['cpu_percent'] = proc.cpu_percent(interval=0)
-                mem_info = proc.memory_info()
-                worker['memory_mb'] = round(mem_info.rss / 1024 / 1024, 2)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                worker['status'] = 'dead'
+        # /proc reads run in a thread so the dashboard can overlap them with get_stats
+        workers, master_pid = await asyncio.to_thread(_collect_workers)
         
         return {
             "master_pid": master_pid,
@@ -703,38 +1409,37 @@ async def get_workers():
 
 
 @router.get("/stats", response_class=JSONResponse)
-async def get_stats():
+async def get_stats(request: Request):
     """Get request statistics and performance metrics."""
+    return await _snapshot_response(request, "stats", _build_stats_payload)
+
+
+@router.get("/stats/stream")
+async def stream_stats(request: Request):
+    """Stream stats (same payload as /stats) as Server-Sent Events."""
+    return _snapshot_stream_response(request, "stats", _build_stats_payload)
+
+
+async def _build_stats_payload() -> Dict[str, Any]:
+    """Build the /stats payload."""
     try:
-        # Load stats from shared file
-        stats = _load_stats()
+        # Load stats from shared file (in a thread - file I/O and locking)
+        stats = await asyncio.to_thread(_load_stats)
         current_time = time.time()
         
-        # Clean old request times periodically (every 10 requests, not every request)
-        # Use modulo on request count to determine when to clean
-        should_clean = stats.get("total_requests", 0) % 10 == 0
-        if should_clean:
-            original_count = len(stats["last_minute_requests"])
-            stats["last_minute_requests"] = [
-                t for t in stats["last_minute_requests"]
-                if current_time - t < 300
-            ]
-            # Only save if cleaning actually removed items
-            if len(stats["last_minute_requests"]) < original_count:
-                _save_stats(stats)
+        # Bind the fields used below once instead of re-indexing the dict
+        total_requests = stats.get("total_requests", 0)
+        errors = stats.get("errors", 0)
+        start_time = stats["start_time"]
         
-        # Calculate average response time
-        avg_response_time = 0
-        if stats["request_times"]:
-            recent_times = stats["request_times"][-100:]  # Last 100 requests
-            avg_response_time = sum(recent_times) / len(recent_times) if recent_times else 0
+        # Calculate average response time (last 100 requests)
+        avg_response_time = _average_response_time(stats)
         
         # Calculate error rate
-        total_requests = stats["total_requests"]
-        error_rate = stats["errors"] / total_requests if total_requests > 0 else 0
+        error_rate = errors / total_requests if total_requests > 0 else 0
         
         # Get cached system metrics (reduces file I/O and process enumeration)
-        cached_metrics = _get_cached_system_metrics()
+        cached_metrics = await asyncio.to_thread(_get_cached_system_metrics)
         active_workers = cached_metrics["active_workers"]
         cpu_percent = cached_metrics["cpu_percent"]
         cpu_count = cached_metrics["cpu_count"]
@@ -742,46 +1447,46 @@ async def get_stats():
         disk = cached_metrics["disk"]
         
         # Calculate average requests per minute (based on last 5 minutes)
-        requests_per_minute = round(len(stats["last_minute_requests"]) / 5, 2) if stats["last_minute_requests"] else 0
+        recent_requests = _count_recent_requests(stats, current_time)
+        requests_per_minute = round(recent_requests / (REQUEST_WINDOW_SECONDS / 60), 2)
         
         result = {
             "total_requests": total_requests,
-            "errors": stats["errors"],
+            "errors": errors,
             "requests_per_minute": requests_per_minute,
             "average_response_time_ms": round(avg_response_time * 1000, 2),
             "error_rate": round(error_rate, 4),
             "active_workers": active_workers,
-            "uptime_seconds": int(current_time - stats["start_time"]),
+            "uptime_seconds": int(current_time - start_time),
             "system": {
                 "cpu_percent": round(cpu_percent, 2),
                 "cpu_count": cpu_count,
                 "memory_percent": round(mem.percent, 2),
-                "memory_total_gb": round(mem.total / 1024 / 1024 / 1024, 2),
-                "memory_used_gb": round(mem.used / 1024 / 1024 / 1024, 2),
-                "memory_available_gb": round(mem.available / 1024 / 1024 / 1024, 2),
+                "memory_total_gb": round(mem.total * BYTES_TO_GB, 2),
+                "memory_used_gb": round(mem.used * BYTES_TO_GB, 2),
+                "memory_available_gb": round(mem.available * BYTES_TO_GB, 2),
                 "disk_percent": round(disk.percent, 2),
-                "disk_total_gb": round(disk.total / 1024 / 1024 / 1024, 2),
-                "disk_used_gb": round(disk.used / 1024 / 1024 / 1024, 2),
-                "disk_free_gb": round(disk.free / 1024 / 1024 / 1024, 2)
+                "disk_total_gb": round(disk.total * BYTES_TO_GB, 2),
+                "disk_used_gb": round(disk.used * BYTES_TO_GB, 2),
+                "disk_free_gb": round(disk.free * BYTES_TO_GB, 2)
             },
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
         
         # Add diagnostic info only in development mode
-        if os.getenv("ENVIRONMENT", "production").lower() == "development":
-            stats_file_exists = STATS_FILE.exists()
-            stats_file_size = STATS_FILE.stat().st_size if stats_file_exists else 0
+        if IS_DEVELOPMENT:
+            stats_file_exists, stats_file_size = _get_stats_file_info()
             result["_diagnostic"] = {
                 "stats_file_exists": stats_file_exists,
                 "stats_file_path": str(STATS_FILE),
                 "stats_file_size": stats_file_size,
-                "raw_total_requests": stats.get("total_requests", 0),
-                "raw_errors": stats.get("errors", 0),
+                "raw_total_requests": total_requests,
+                "raw_errors": errors,
                 "raw_request_times_count": len(stats.get("request_times", [])),
-                "raw_last_minute_count": len(stats.get("last_minute_requests", []))
+                "raw_last_minute_count": recent_requests
             }
         
-        logger.info(f"Stats response: total_requests={total_requests}")
+        logger.info("Stats response: total_requests=%s", total_requests)
         return result
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
@@ -814,22 +1519,8 @@ async def get_metrics():
         stats = _load_stats()
         current_time = time.time()
         
-        # Clean old request times periodically (same as /stats endpoint)
-        should_clean = stats.get("total_requests", 0) % 10 == 0
-        if should_clean:
-            original_count = len(stats["last_minute_requests"])
-            stats["last_minute_requests"] = [
-                t for t in stats["last_minute_requests"]
-                if current_time - t < 300
-            ]
-            if len(stats["last_minute_requests"]) < original_count:
-                _save_stats(stats)
-        
-        # Calculate average response time
-        avg_response_time = 0
-        if stats["request_times"]:
-            recent_times = stats["request_times"][-100:]
-            avg_response_time = sum(recent_times) / len(recent_times) if recent_times else 0
+        # Calculate average response time (last 100 requests)
+        avg_response_time = _average_response_time(stats)
         
         # Calculate error rate
         total_requests = stats["total_requests"]
@@ -840,7 +1531,7 @@ async def get_metrics():
         active_workers = cached_metrics["active_workers"]
         
         # Calculate average requests per minute
-        requests_per_minute = round(len(stats["last_minute_requests"]) / 5, 2) if stats["last_minute_requests"] else 0
+        requests_per_minute = round(_count_recent_requests(stats, current_time) / (REQUEST_WINDOW_SECONDS / 60), 2)
         
         # Return only requested fields
         return {
@@ -867,12 +1558,59 @@ async def get_metrics():
 
 
 @router.get("/dashboard", response_class=JSONResponse)
-async def get_dashboard():
+async def get_dashboard(request: Request):
     """Get dashboard data (combined stats and workers)."""
+    return await _snapshot_response(request, "dashboard", _build_dashboard_payload)
+
+
+@router.get("/dashboard/stream")
+async def stream_dashboard(request: Request):
+    """Stream dashboard data (same payload as /dashboard) as Server-Sent Events."""
+    return _snapshot_stream_response(request, "dashboard", _build_dashboard_payload)
+
+
+# Shared answer to OPTIONS on the dashboard routes: no auth and no other work runs.
+# The monitor is served same-origin, so no CORS headers are granted.
+_DASHBOARD_OPTIONS_RESPONSE = Response(status_code=204, headers={"Allow": "GET, OPTIONS"})
+
+
+@router.options("/dashboard")
+@router.options("/dashboard/stream")
+@router.options("/dashboard/page")
+async def dashboard_options():
+    """Answer OPTIONS (including CORS preflight) before authentication."""
+    return _DASHBOARD_OPTIONS_RESPONSE
+
+
+async def _build_dashboard_payload() -> Dict[str, Any]:
+    """Build the /dashboard payload from the /stats and /workers snapshots."""
     try:
-        # Get stats and workers data
-        stats_data = await get_stats()
-        workers_data = await get_workers()
+        # Get stats and workers data concurrently (both offload their blocking work to threads)
+        stats_snapshot, workers_snapshot = await asyncio.gather(
+            _get_snapshot("stats", _build_stats_payload),
+            _get_snapshot("workers", _build_workers_payload),
+            return_exceptions=True
+        )
+        stats_data = stats_snapshot if isinstance(stats_snapshot, Exception) else stats_snapshot[0]
+        workers_data = workers_snapshot if isinstance(workers_snapshot, Exception) else workers_snapshot[0]
+        if isinstance(stats_data, Exception):
+            logger.error(f"Error getting dashboard stats: {stats_data}")
+            stats_data = {
+                "error": str(stats_data),
+                "total_requests": 0,
+                "requests_per_minute": 0,
+                "average_response_time_ms": 0,
+                "error_rate": 0,
+                "active_workers": 0
+            }
+        if isinstance(workers_data, Exception):
+            logger.error(f"Error getting dashboard workers: {workers_data}")
+            workers_data = {
+                "error": str(workers_data),
+                "master_pid": None,
+                "total_workers": 0,
+                "workers": []
+            }
         
         return {
             "stats": stats_data,
@@ -910,49 +1648,125 @@ async def get_dashboard():
         }
 
 
+WORKER_DETAIL_LIST_LIMIT = 50  # Max open files / connections listed per worker
+# Cheap per-process fields fetched in one as_dict() batch (read under oneshot(), so the
+# shared /proc/<pid>/stat and status reads happen once)
+WORKER_DETAIL_BATCH_ATTRS = ["name", "status", "create_time", "cmdline", "cpu_times", "memory_info", "io_counters"]
+WORKER_DETAIL_REQUIRED_ATTRS = ("name", "status", "create_time", "cmdline")
+
+
+def _probe_psutil_fields():
+    """Detect once which optional psutil fields this platform provides.
+    
+    The answer doesn't change for the lifetime of the interpreter, so get_worker_details
+    branches on the resulting module-level flags instead of probing with hasattr per call.
+    
+    Returns:
+        Tuple of (has_children_cpu, has_mem_full, mem_full_fields, has_thread_times)
+    """
+    has_children_cpu = False
+    has_thread_times = False
+    mem_full_fields = ()
+    try:
+        me = psutil.Process()
+        has_children_cpu = hasattr(me.cpu_times(), 'children_user')
+        threads = me.threads()
+        has_thread_times = bool(threads) and hasattr(threads[0], 'user_time')
+        if hasattr(me, 'memory_full_info'):
+            mem_full_fields = tuple(
+                f for f in ('shared', 'text', 'data') if hasattr(me.memory_info(), f)
+            )
+    except (psutil.Error, OSError):
+        pass
+    return has_children_cpu, hasattr(psutil.Process, 'memory_full_info'), mem_full_fields, has_thread_times
+
+
+_HAS_CHILDREN_CPU, _HAS_MEM_FULL, _MEM_FULL_FIELDS, _HAS_THREAD_TIMES = _probe_psutil_fields()
+
+
+def _iter_open_files(pid: int):
+    """Lazily yield regular files open by pid (same filter as psutil's open_files()).
+    
+    Reading /proc/<pid>/fd lazily lets callers stop early instead of resolving every fd.
+    
+    Raises:
+        psutil.NoSuchProcess / psutil.AccessDenied: If the fd directory can't be read
+    """
+    fd_dir = f"/proc/{pid}/fd"
+    try:
+        entries = os.scandir(fd_dir)
+    except FileNotFoundError:
+        raise psutil.NoSuchProcess(pid)
+    except PermissionError:
+        raise psutil.AccessDenied(pid)
+    with entries:
+        for entry in entries:
+            try:
+                path = os.readlink(entry.path)
+            except OSError:
+                continue
+            if path.startswith('/') and os.path.isfile(path):
+                yield {"path": path, "fd": int(entry.name)}
+
+
 @router.get("/worker/{pid}", response_class=JSONResponse)
 async def get_worker_details(pid: int):
     """Get detailed information about a specific worker process."""
     try:
-        proc = psutil.Process(pid)
+        proc = _get_process(pid)
+        if proc is None:
+            raise psutil.NoSuchProcess(pid)
+        
+        # Cheap fields in one batch; fields we may not read come back as None
+        info = proc.as_dict(attrs=WORKER_DETAIL_BATCH_ATTRS)
+        if any(info[attr] is None for attr in WORKER_DETAIL_REQUIRED_ATTRS):
+            raise psutil.AccessDenied(pid)
         
         # Basic process info
         proc_info = {
             "pid": pid,
-            "name": proc.name(),
-            "status": proc.status(),
-            "create_time": proc.create_time(),
-            "uptime_seconds": int(time.time() - proc.create_time()),
-            "cmdline": proc.cmdline(),
+            "name": info["name"],
+            "status": info["status"],
+            "create_time": info["create_time"],
+            "uptime_seconds": int(time.time() - info["create_time"]),
+            "cmdline": info["cmdline"],
         }
         
         # CPU info
-        try:
-            cpu_times = proc.cpu_times()
+        cpu_times = info["cpu_times"]
+        if cpu_times is not None:
             proc_info["cpu_times"] = {
                 "user": round(cpu_times.user, 2),
                 "system": round(cpu_times.system, 2),
-                "children_user": round(cpu_times.children_user, 2) if hasattr(cpu_times, 'children_user') else 0,
-                "children_system": round(cpu_times.children_system, 2) if hasattr(cpu_times, 'children_system') else 0,
+                "children_user": round(cpu_times.children_user, 2) if _HAS_CHILDREN_CPU else 0,
+                "children_system": round(cpu_times.children_system, 2) if _HAS_CHILDREN_CPU else 0,
             }
-            proc_info["cpu_percent"] = proc.cpu_percent(interval=0.1)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            try:
+                # Non-blocking: usage since the previous call on the cached Process object
+                # (_get_process keeps it between requests); the first call per PID returns 0.0
+                proc_info["cpu_percent"] = proc.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                proc_info["cpu_percent"] = 0
+        else:
             proc_info["cpu_times"] = None
             proc_info["cpu_percent"] = 0
         
-        # Memory info
-        try:
-            mem_info = proc.memory_info()
-            mem_full = proc.memory_full_info() if hasattr(proc, 'memory_full_info') else None
+        # Memory info (memory_full_info walks smaps, so it stays out of the batch)
+        mem_info = info["memory_info"]
+        if mem_info is not None:
             proc_info["memory"] = {
-                "rss_mb": round(mem_info.rss / 1024 / 1024, 2),
-                "vms_mb": round(mem_info.vms / 1024 / 1024, 2),
+                "rss_mb": round(mem_info.rss * BYTES_TO_MB, 2),
+                "vms_mb": round(mem_info.vms * BYTES_TO_MB, 2),
             }
+            try:
+                mem_full = proc.memory_full_info() if _HAS_MEM_FULL else None
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                mem_full = None
             if mem_full:
-                proc_info["memory"]["shared_mb"] = round(mem_full.shared / 1024 / 1024, 2) if hasattr(mem_full, 'shared') else 0
-                proc_info["memory"]["text_mb"] = round(mem_full.text / 1024 / 1024, 2) if hasattr(mem_full, 'text') else 0
-                proc_info["memory"]["data_mb"] = round(mem_full.data / 1024 / 1024, 2) if hasattr(mem_full, 'data') else 0
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                for field in ('shared', 'text', 'data'):
+                    value = getattr(mem_full, field) if field in _MEM_FULL_FIELDS else 0
+                    proc_info["memory"][f"{field}_mb"] = round(value * BYTES_TO_MB, 2)
+        else:
             proc_info["memory"] = None
         
         # Child processes
@@ -977,8 +1791,8 @@ async def get_worker_details(pid: int):
             proc_info["threads"] = [
                 {
                     "id": t.id,
-                    "user_time": round(t.user_time, 2) if hasattr(t, 'user_time') else 0,
-                    "system_time": round(t.system_time, 2) if hasattr(t, 'system_time') else 0,
+                    "user_time": round(t.user_time, 2) if _HAS_THREAD_TIMES else 0,
+                    "system_time": round(t.system_time, 2) if _HAS_THREAD_TIMES else 0,
                 }
                 for t in threads
             ]
@@ -987,24 +1801,22 @@ async def get_worker_details(pid: int):
             proc_info["threads"] = []
             proc_info["num_threads"] = 0
         
-        # Open files
+        # Open files (bounded scan of /proc/<pid>/fd - stops after the first 50 regular files)
         try:
-            open_files = proc.open_files()
-            proc_info["open_files"] = [
-                {
-                    "path": f.path,
-                    "fd": f.fd if hasattr(f, 'fd') else None,
-                }
-                for f in open_files[:50]  # Limit to first 50
-            ]
-            proc_info["num_open_files"] = len(open_files)
+            open_files = list(itertools.islice(_iter_open_files(pid), WORKER_DETAIL_LIST_LIMIT + 1))
+            proc_info["open_files_truncated"] = len(open_files) > WORKER_DETAIL_LIST_LIMIT
+            proc_info["open_files"] = open_files[:WORKER_DETAIL_LIST_LIMIT]
+            proc_info["num_open_files"] = len(proc_info["open_files"])  # At least this many when truncated
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             proc_info["open_files"] = []
             proc_info["num_open_files"] = 0
+            proc_info["open_files_truncated"] = False
         
         # Network connections
         try:
-            connections = proc.connections(kind='inet')
+            # psutil parses the socket tables in one go; only the first 50 are converted
+            get_connections = getattr(proc, 'net_connections', None) or proc.connections
+            connections = get_connections(kind='inet')
             proc_info["connections"] = [
                 {
                     "fd": c.fd if hasattr(c, 'fd') and c.fd else None,
@@ -1014,23 +1826,25 @@ async def get_worker_details(pid: int):
                     "raddr": f"{c.raddr.ip}:{c.raddr.port}" if c.raddr else None,
                     "status": c.status if hasattr(c, 'status') else None,
                 }
-                for c in connections[:50]  # Limit to first 50
+                for c in itertools.islice(connections, WORKER_DETAIL_LIST_LIMIT)
             ]
             proc_info["num_connections"] = len(connections)
+            proc_info["connections_truncated"] = len(connections) > WORKER_DETAIL_LIST_LIMIT
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             proc_info["connections"] = []
             proc_info["num_connections"] = 0
+            proc_info["connections_truncated"] = False
         
         # I/O statistics
-        try:
-            io_counters = proc.io_counters()
+        io_counters = info["io_counters"]
+        if io_counters is not None:
             proc_info["io"] = {
                 "read_count": io_counters.read_count,
                 "write_count": io_counters.write_count,
-                "read_bytes_mb": round(io_counters.read_bytes / 1024 / 1024, 2),
-                "write_bytes_mb": round(io_counters.write_bytes / 1024 / 1024, 2),
+                "read_bytes_mb": round(io_counters.read_bytes * BYTES_TO_MB, 2),
+                "write_bytes_mb": round(io_counters.write_bytes * BYTES_TO_MB, 2),
             }
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        else:
             proc_info["io"] = None
         
         return proc_info
@@ -1052,9 +1866,53 @@ async def get_worker_details(pid: int):
         }
 
 
+# Worker details served by /worker/{pid}/bundle are reused for this long per PID
+# (the detail page's refresh interval for them); system metrics come from the
+# shared /stats snapshot
+WORKER_BUNDLE_DETAIL_TTL = 5.0
+_worker_bundle_cache = {}  # pid -> (timestamp, encoded worker details)
+
+
+@router.get("/worker/{pid}/bundle", response_class=JSONResponse)
+async def get_worker_bundle(pid: int):
+    """Get system metrics and a worker's details in one response (worker detail page)."""
+    now = time.time()
+    entry = _worker_bundle_cache.get(pid)
+    if entry is None or now - entry[0] >= WORKER_BUNDLE_DETAIL_TTL:
+        # Drop expired entries so only workers currently being viewed stay cached
+        for cached_pid, (timestamp, _) in list(_worker_bundle_cache.items()):
+            if now - timestamp >= WORKER_BUNDLE_DETAIL_TTL:
+                del _worker_bundle_cache[cached_pid]
+        # Encoded once per refresh; the 0.5 s polls in between reuse the bytes
+        entry = (now, _render_json(await get_worker_details(pid)))
+        _worker_bundle_cache[pid] = entry
+    
+    try:
+        stats, _ = await _get_snapshot("stats", _build_stats_payload)
+        system = stats.get("system")
+    except Exception as e:
+        logger.error(f"Error getting stats for worker bundle: {e}")
+        system = None
+    
+    # Spliced from pre-encoded parts instead of returning a dict, which FastAPI
+    # would walk with jsonable_encoder and re-encode on every poll
+    body = b"".join((
+        b'{"system":', json.dumps(system, separators=(",", ":")).encode("utf-8"),
+        b',"worker":', entry[1],
+        b',"worker_updated":', repr(entry[0]).encode("ascii"),
+        b"}"
+    ))
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/health", response_class=JSONResponse)
-async def get_health():
+async def get_health(request: Request):
     """Get system health status."""
+    return await _snapshot_response(request, "health", _build_health_payload)
+
+
+async def _build_health_payload() -> Dict[str, Any]:
+    """Build the /health payload."""
     try:
         # Check database connectivity
         db_healthy = False
@@ -1092,6 +1950,181 @@ async def get_health():
         }
 
 
+TAIL_BLOCK_SIZE = 64 * 1024  # Block size for reading log files backwards
+
+
+def _iter_lines_reverse(path: Path):
+    """Yield the lines of a file newest-first, reading backwards in blocks.
+    
+    Only as much of the file as the caller consumes is read. Lines are decoded as
+    UTF-8 with errors ignored (like the previous readlines()).
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        if position == 0:
+            return
+        remainder = b''
+        first_block = True
+        while position > 0:
+            read_size = min(TAIL_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            if first_block:
+                # A trailing newline does not start another line
+                if chunk.endswith(b'\n'):
+                    chunk = chunk[:-1]
+                first_block = False
+            lines = chunk.split(b'\n')
+            # The first piece may continue in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode('utf-8', errors='ignore')
+        yield remainder.decode('utf-8', errors='ignore')
+
+
+def _tail_file(path: Path, n: int) -> List[str]:
+    """Return the last n lines of a file, reading backwards from the end.
+    
+    Only the tail of the file is read, so cost scales with n rather than file size.
+    """
+    if n <= 0:
+        lines = list(_iter_lines_reverse(path))
+    else:
+        lines = list(itertools.islice(_iter_lines_reverse(path), n))
+    lines.reverse()
+    return lines
+
+
+# Message keyword every line classified at that level contains (see _extract_journalctl_log_level).
+# Lowercase patterns make journalctl --grep case-insensitive. INFO is also the default level for
+# lines without any keyword, so it (and anything unknown) can't be prefiltered.
+_JOURNALCTL_LEVEL_GREP = {"ERROR": "err", "WARNING": "warn", "DEBUG": "debug"}
+JOURNALCTL_TIMEOUT = 5.0  # Seconds a journalctl query may run
+# --grep with -n walks back until it has enough matches, which for a rare level can mean the
+# whole journal; past this budget the query falls back to tailing and filtering in Python
+JOURNALCTL_GREP_TIMEOUT = 2.0
+
+
+async def _exec_journalctl(cmd: List[str], timeout: float = JOURNALCTL_TIMEOUT) -> subprocess.CompletedProcess:
+    """Run journalctl without blocking the event loop.
+    
+    Args:
+        cmd: journalctl command line
+        timeout: Seconds to wait before killing journalctl
+        
+    Returns:
+        CompletedProcess with decoded stdout/stderr
+        
+    Raises:
+        asyncio.TimeoutError: If journalctl takes longer than timeout (the process is killed)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return subprocess.CompletedProcess(
+        cmd, proc.returncode, stdout.decode(errors="ignore"), stderr.decode(errors="ignore")
+    )
+
+
+async def _run_journalctl(cmd: List[str], level: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run a journalctl query, prefiltering by log level inside journalctl when possible.
+    
+    The service logs with SyslogLevel=info, so journal priorities (-p) don't reflect the
+    application's log levels; instead --grep drops lines that can't match before they are
+    serialized and piped back. Callers still apply the exact level check per line. A grep
+    that outlives JOURNALCTL_GREP_TIMEOUT (rare level, long journal) falls back to the
+    plain tail.
+    
+    Args:
+        cmd: journalctl command line
+        level: Optional level filter requested by the client
+        
+    Returns:
+        CompletedProcess with text stdout/stderr
+        
+    Raises:
+        asyncio.TimeoutError: If journalctl takes longer than JOURNALCTL_TIMEOUT seconds
+    """
+    pattern = _JOURNALCTL_LEVEL_GREP.get(level.upper()) if level else None
+    if pattern:
+        grep_cmd = cmd + ["--grep", pattern]
+        try:
+            result = await _exec_journalctl(grep_cmd, JOURNALCTL_GREP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"journalctl --grep {pattern} timed out; filtering the tail instead")
+            return await _exec_journalctl(cmd)
+        if result.returncode == 0:
+            return result
+        # Newer journalctl exits 1 without a message when nothing matched
+        if not result.stderr.strip():
+            return subprocess.CompletedProcess(grep_cmd, 0, "", "")
+        # journalctl built without PCRE2 rejects --grep; fall back to filtering in Python
+        if "pattern" not in result.stderr.lower():
+            return result
+    return await _exec_journalctl(cmd)
+
+
+def _iter_recent_logs(limit: int):
+    """Yield recent log entries newest-first, parsed like get_logs() entries.
+    
+    Stops reading (or terminates journalctl) as soon as the caller stops iterating.
+    Blocking: the journalctl read is synchronous so it can end early, so only iterate
+    this from a worker thread (see _find_log_by_digest), never on the event loop.
+    
+    Raises:
+        FileNotFoundError: If journalctl or the log file is missing
+        RuntimeError: If journalctl fails before producing any output
+    """
+    if USE_JOURNALCTL:
+        if not os.path.exists(JOURNALCTL_PATH) or not os.access(JOURNALCTL_PATH, os.X_OK):
+            raise FileNotFoundError(f"journalctl not found at {JOURNALCTL_PATH}")
+        
+        # -r: newest entries first, so a recent match ends the read early
+        cmd = [JOURNALCTL_PATH, "-u", "frl-python-api", "-n", str(limit), "--no-pager", "-o", "short-iso", "-r"]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # Same budget as the get_logs/get_worker_logs queries
+        kill_timer = threading.Timer(JOURNALCTL_TIMEOUT, proc.kill)
+        kill_timer.start()
+        produced = False
+        try:
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if not line.strip():
+                    continue
+                produced = True
+                yield {
+                    "timestamp": line[:19] if len(line) > 19 else "",
+                    "level": _extract_journalctl_log_level(line),
+                    "message": line[20:] if len(line) > 20 else line
+                }
+            proc.wait()
+            if proc.returncode != 0 and not produced:
+                error_msg = proc.stderr.read().strip() or f"journalctl returned code {proc.returncode}"
+                raise RuntimeError(f"Failed to read logs from journalctl: {error_msg}")
+        finally:
+            kill_timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+    else:
+        log_path = Path(LOG_FILE_PATH)
+        if not log_path.exists():
+            raise FileNotFoundError(f"Log file not found: {LOG_FILE_PATH}")
+        for line in itertools.islice(_iter_lines_reverse(log_path), limit):
+            line = line.strip()
+            if line:
+                yield _parse_log_line(line)
+
+
 @router.get("/logs", response_class=JSONResponse)
 async def get_logs(limit: int = 1000, level: Optional[str] = None):
     """Get application logs."""
@@ -1112,7 +2145,7 @@ async def get_logs(limit: int = 1000, level: Optional[str] = None):
             cmd = [JOURNALCTL_PATH, "-u", "frl-python-api", "-n", str(limit), "--no-pager", "-o", "short-iso"]
             
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+                result = await _run_journalctl(cmd, level)
                 if result.returncode == 0:
                     lines = result.stdout.strip().split('\n')
                     for line in lines:
@@ -1148,7 +2181,7 @@ async def get_logs(limit: int = 1000, level: Optional[str] = None):
                         "suggestion": suggestion,
                         "source": "journalctl"
                     }
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 return {
                     "error": "journalctl command timed out after 5 seconds",
                     "logs": [],
@@ -1159,21 +2192,19 @@ async def get_logs(limit: int = 1000, level: Optional[str] = None):
             # Read from log file
             log_path = Path(LOG_FILE_PATH)
             if log_path.exists():
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    # Get last N lines
-                    lines = lines[-limit:] if len(lines) > limit else lines
+                # Get last N lines (reads backwards from the end instead of the whole file)
+                lines = _tail_file(log_path, limit)
+                
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
                     
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        # Parse log line
-                        log_entry = _parse_log_line(line)
-                        if level and log_entry.get('level', '').upper() != level.upper():
-                            continue
-                        logs.append(log_entry)
+                    # Parse log line
+                    log_entry = _parse_log_line(line)
+                    if level and log_entry.get('level', '').upper() != level.upper():
+                        continue
+                    logs.append(log_entry)
             else:
                 return {
                     "error": f"Log file not found: {LOG_FILE_PATH}",
@@ -1233,7 +2264,7 @@ async def get_worker_logs(pid: int, limit: int = 1000, level: Optional[str] = No
             ]
             
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+                result = await _run_journalctl(cmd, level)
                 if result.returncode == 0:
                     lines = result.stdout.strip().split('\n')
                     for line in lines:
@@ -1270,7 +2301,7 @@ async def get_worker_logs(pid: int, limit: int = 1000, level: Optional[str] = No
                         "suggestion": suggestion,
                         "source": "journalctl"
                     }
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 return {
                     "error": f"journalctl command timed out after 5 seconds for PID {pid}",
                     "logs": [],
@@ -1282,32 +2313,30 @@ async def get_worker_logs(pid: int, limit: int = 1000, level: Optional[str] = No
             # Read from log file and filter by PID
             log_path = Path(LOG_FILE_PATH)
             if log_path.exists():
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    # Get last N lines (we'll filter by PID after)
-                    lines = lines[-limit*2:] if len(lines) > limit*2 else lines
+                # Get last N lines (we'll filter by PID after)
+                lines = _tail_file(log_path, limit * 2)
+                
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
                     
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        # Check if line contains PID (format: "PID:12345" or "[12345]")
-                        pid_str = str(pid)
-                        if pid_str not in line:
-                            continue
-                        
-                        # Parse log line
-                        log_entry = _parse_log_line(line)
-                        if level and log_entry.get('level', '').upper() != level.upper():
-                            continue
-                        
-                        # Add PID info to entry
-                        log_entry['pid'] = pid
-                        logs.append(log_entry)
-                        
-                        if len(logs) >= limit:
-                            break
+                    # Check if line contains PID (format: "PID:12345" or "[12345]")
+                    pid_str = str(pid)
+                    if pid_str not in line:
+                        continue
+                    
+                    # Parse log line
+                    log_entry = _parse_log_line(line)
+                    if level and log_entry.get('level', '').upper() != level.upper():
+                        continue
+                    
+                    # Add PID info to entry
+                    log_entry['pid'] = pid
+                    logs.append(log_entry)
+                    
+                    if len(logs) >= limit:
+                        break
             else:
                 return {
                     "error": f"Log file not found: {LOG_FILE_PATH}",
@@ -1359,6 +2388,40 @@ def _extract_traceback(message: str) -> Optional[str]:
     return message[traceback_start:].strip()
 
 
+# Patterns for _extract_metadata_from_message (compiled once; runs for every log detail view)
+_PID_RE = re.compile(r'(?:PID[:\s]+|\[)(\d+)(?:\]|$)')
+_FILE_LINE_RE = re.compile(r'File\s+"([^"]+)",\s*line\s+(\d+)')
+_QUERY_STRING_RES = [
+    re.compile(r'query[_\s]*string[:\s]+(\?[^\s]+)', re.IGNORECASE),  # "query_string: ?param=value"
+    re.compile(r'query[_\s]*params[:\s]+(\?[^\s]+)', re.IGNORECASE),  # "query_params: ?param=value"
+    re.compile(r'(\?[a-zA-Z0-9_\-\.=&%]+)', re.IGNORECASE),  # Standalone query string pattern
+    re.compile(r'URL[:\s]+[^\s]*(\?[^\s]+)', re.IGNORECASE),  # "URL: ...?param=value"
+]
+_JSON_QUERY_RES = [
+    re.compile(r'["\']query[_\s]*string["\']\s*:\s*["\'](\?[^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'["\']query["\']\s*:\s*["\'](\?[^"\']+)["\']', re.IGNORECASE),
+]
+_POST_TEXT_RES = [
+    re.compile(r'post[_\s]*data[:\s]+(\{[^}]+\})', re.IGNORECASE),  # "post_data: {...}"
+    re.compile(r'POST[_\s]*data[:\s]+(\{[^}]+\})', re.IGNORECASE),  # "POST data: {...}"
+    re.compile(r'form[_\s]*data[:\s]+(\{[^}]+\})', re.IGNORECASE),  # "form_data: {...}"
+    re.compile(r'POST[_\s]*variables[:\s]+(\{[^}]+\})', re.IGNORECASE),  # "POST variables: {...}"
+    re.compile(r'post[_\s]*body[:\s]+(\{[^}]+\})', re.IGNORECASE),  # "post_body: {...}"
+]
+_JSON_POST_RES = [
+    re.compile(r'["\']post[_\s]*data["\']\s*:\s*(\{[^}]+\})', re.IGNORECASE),
+    re.compile(r'["\']form[_\s]*data["\']\s*:\s*(\{[^}]+\})', re.IGNORECASE),
+    re.compile(r'["\']POST["\']\s*:\s*(\{[^}]+\})', re.IGNORECASE),
+    re.compile(r'["\']post[_\s]*variables["\']\s*:\s*(\{[^}]+\})', re.IGNORECASE),
+]
+_FORM_ENCODED_RE = re.compile(r'(?:post[_\s]*data|form[_\s]*data|POST[_\s]*body)[:\s]+([a-zA-Z0-9_\-\.=&%]+(?:&[a-zA-Z0-9_\-\.=&%]+)+)', re.IGNORECASE)
+_STANDALONE_FORM_RE = re.compile(r'\b([a-zA-Z0-9_\-\.]+=[a-zA-Z0-9_\-\.%]+(?:&[a-zA-Z0-9_\-\.]+=[a-zA-Z0-9_\-\.%]+)+)\b')
+_DICT_RES = [
+    re.compile(r"\{'[^']+':\s*'[^']*'(?:,\s*'[^']+':\s*'[^']*')*\}"),  # Single quotes
+    re.compile(r'\{"[^"]+":\s*"[^"]*"(?:,\s*"[^"]+":\s*"[^"]*")*\}'),  # Double quotes
+]
+
+
 def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     """Extract metadata from log message if available.
     
@@ -1377,8 +2440,7 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
         return metadata
     
     # Try to extract PID (common patterns: "PID:12345" or "[12345]")
-    import re
-    pid_match = re.search(r'(?:PID[:\s]+|\[)(\d+)(?:\]|$)', message)
+    pid_match = _PID_RE.search(message)
     if pid_match:
         try:
             metadata['pid'] = int(pid_match.group(1))
@@ -1386,7 +2448,7 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
             pass
     
     # Try to extract file path and line number (pattern: "File \"path\", line 123")
-    file_match = re.search(r'File\s+"([^"]+)",\s*line\s+(\d+)', message)
+    file_match = _FILE_LINE_RE.search(message)
     if file_match:
         metadata['file_path'] = file_match.group(1)
         try:
@@ -1397,15 +2459,8 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     # Try to extract query string from log message
     # Look for patterns like "query_string: ?param=value" or "?param=value&param2=value2"
     # or "query_params: {...}" or URL patterns with query strings
-    query_string_patterns = [
-        r'query[_\s]*string[:\s]+(\?[^\s]+)',  # "query_string: ?param=value"
-        r'query[_\s]*params[:\s]+(\?[^\s]+)',  # "query_params: ?param=value"
-        r'(\?[a-zA-Z0-9_\-\.=&%]+)',  # Standalone query string pattern
-        r'URL[:\s]+[^\s]*(\?[^\s]+)',  # "URL: ...?param=value"
-    ]
-    
-    for pattern in query_string_patterns:
-        query_match = re.search(pattern, message, re.IGNORECASE)
+    for pattern in _QUERY_STRING_RES:
+        query_match = pattern.search(message)
         if query_match:
             query_string = query_match.group(1)
             # Clean up the query string (remove trailing punctuation if any)
@@ -1415,13 +2470,8 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     
     # Also try to extract query string from JSON-like structures in the message
     # Look for patterns like '"query_string": "?param=value"' or '"query": "?param=value"'
-    json_query_patterns = [
-        r'["\']query[_\s]*string["\']\s*:\s*["\'](\?[^"\']+)["\']',
-        r'["\']query["\']\s*:\s*["\'](\?[^"\']+)["\']',
-    ]
-    
-    for pattern in json_query_patterns:
-        json_query_match = re.search(pattern, message, re.IGNORECASE)
+    for pattern in _JSON_QUERY_RES:
+        json_query_match = pattern.search(message)
         if json_query_match:
             query_string = json_query_match.group(1)
             metadata['query_string'] = query_string
@@ -1429,19 +2479,9 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     
     # Try to extract POST variables from log message
     # Look for various patterns including text-based, JSON structures, form-encoded, and dictionary-like
-    from urllib.parse import parse_qs, unquote
-    
     # Text-based patterns: "post_data: {...}", "POST data: {...}", "form_data: {...}", etc.
-    post_text_patterns = [
-        r'post[_\s]*data[:\s]+(\{[^}]+\})',  # "post_data: {...}"
-        r'POST[_\s]*data[:\s]+(\{[^}]+\})',  # "POST data: {...}"
-        r'form[_\s]*data[:\s]+(\{[^}]+\})',  # "form_data: {...}"
-        r'POST[_\s]*variables[:\s]+(\{[^}]+\})',  # "POST variables: {...}"
-        r'post[_\s]*body[:\s]+(\{[^}]+\})',  # "post_body: {...}"
-    ]
-    
-    for pattern in post_text_patterns:
-        post_match = re.search(pattern, message, re.IGNORECASE)
+    for pattern in _POST_TEXT_RES:
+        post_match = pattern.search(message)
         if post_match:
             post_data_str = post_match.group(1)
             try:
@@ -1456,15 +2496,8 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     
     # JSON structures: '"post_data": {...}', '"form_data": {...}', '"POST": {...}'
     if 'post_variables' not in metadata:
-        json_post_patterns = [
-            r'["\']post[_\s]*data["\']\s*:\s*(\{[^}]+\})',
-            r'["\']form[_\s]*data["\']\s*:\s*(\{[^}]+\})',
-            r'["\']POST["\']\s*:\s*(\{[^}]+\})',
-            r'["\']post[_\s]*variables["\']\s*:\s*(\{[^}]+\})',
-        ]
-        
-        for pattern in json_post_patterns:
-            json_post_match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in _JSON_POST_RES:
+            json_post_match = pattern.search(message)
             if json_post_match:
                 post_data_str = json_post_match.group(1)
                 try:
@@ -1478,8 +2511,7 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     # Form-encoded data: "key1=value1&key2=value2" (without leading ?)
     if 'post_variables' not in metadata:
         # Look for form-encoded patterns (param=value&param2=value2)
-        form_encoded_pattern = r'(?:post[_\s]*data|form[_\s]*data|POST[_\s]*body)[:\s]+([a-zA-Z0-9_\-\.=&%]+(?:&[a-zA-Z0-9_\-\.=&%]+)+)'
-        form_match = re.search(form_encoded_pattern, message, re.IGNORECASE)
+        form_match = _FORM_ENCODED_RE.search(message)
         if form_match:
             form_data_str = form_match.group(1)
             try:
@@ -1493,8 +2525,7 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
         
         # Also check for standalone form-encoded patterns (not preceded by labels)
         if 'post_variables' not in metadata:
-            standalone_form_pattern = r'\b([a-zA-Z0-9_\-\.]+=[a-zA-Z0-9_\-\.%]+(?:&[a-zA-Z0-9_\-\.]+=[a-zA-Z0-9_\-\.%]+)+)\b'
-            standalone_match = re.search(standalone_form_pattern, message)
+            standalone_match = _STANDALONE_FORM_RE.search(message)
             if standalone_match and standalone_match.group(1) and '=' in standalone_match.group(1) and '&' in standalone_match.group(1):
                 form_data_str = standalone_match.group(1)
                 try:
@@ -1506,13 +2537,8 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     
     # Dictionary-like structures: {'key': 'value'}, {"key": "value"}
     if 'post_variables' not in metadata:
-        dict_patterns = [
-            r"\{'[^']+':\s*'[^']*'(?:,\s*'[^']+':\s*'[^']*')*\}",  # Single quotes
-            r'\{"[^"]+":\s*"[^"]*"(?:,\s*"[^"]+":\s*"[^"]*")*\}',  # Double quotes
-        ]
-        
-        for pattern in dict_patterns:
-            dict_match = re.search(pattern, message)
+        for pattern in _DICT_RES:
+            dict_match = pattern.search(message)
             if dict_match:
                 dict_str = dict_match.group(0)
                 try:
@@ -1532,6 +2558,28 @@ def _extract_metadata_from_message(message: str) -> Dict[str, Any]:
     return metadata
 
 
+def _find_log_by_digest(limit: int, target_digest: bytes) -> Tuple[Optional[Dict[str, Any]], int]:
+    """Search recent logs newest-first for the entry with a given hash (blocking; run in a thread).
+    
+    Args:
+        limit: Number of recent log lines to search
+        target_digest: Raw SHA256 digest of the wanted entry
+        
+    Returns:
+        Tuple of (matching log entry or None, number of entries searched)
+        
+    Raises:
+        FileNotFoundError: If journalctl or the log file is missing
+        RuntimeError: If journalctl fails before producing any output
+    """
+    searched_logs = 0
+    for log in _iter_recent_logs(limit):
+        searched_logs += 1
+        if _log_hash_digest(log.get("timestamp", ""), log.get("message", ""), log.get("module")) == target_digest:
+            return log, searched_logs
+    return None, searched_logs
+
+
 @router.get("/log/{log_hash}", response_class=JSONResponse)
 async def get_log_details(log_hash: str):
     """Get detailed information for a specific log entry by hash.
@@ -1548,35 +2596,30 @@ async def get_log_details(log_hash: str):
     try:
         # Search recent logs (use a larger limit to increase chances of finding the log)
         limit = 5000  # Search more logs to increase likelihood of finding the entry
-        all_logs_response = await get_logs(limit=limit, level=None)
-        
-        if all_logs_response.get("error"):
-            return {
-                "error": all_logs_response.get("error"),
-                "log_hash": log_hash
-            }
-        
-        logs = all_logs_response.get("logs", [])
         
-        # Find log entry matching the hash
+        # Find log entry matching the hash, newest first, stopping at the first match.
+        # Compare raw digests so each entry skips the hex conversion; a malformed hash can never match
         matching_log = None
-        for log in logs:
-            timestamp = log.get("timestamp", "")
-            message = log.get("message", "")
-            module = log.get("module")
-            
-            # Generate hash for this log entry
-            entry_hash = _generate_log_hash(timestamp, message, module)
-            
-            if entry_hash == log_hash:
-                matching_log = log
-                break
+        searched_logs = 0
+        try:
+            target_digest = bytes.fromhex(log_hash)
+        except ValueError:
+            target_digest = None
+        if target_digest is not None:
+            try:
+                # In a thread: reading journalctl or the log file (and hashing each entry) blocks
+                matching_log, searched_logs = await asyncio.to_thread(_find_log_by_digest, limit, target_digest)
+            except (FileNotFoundError, RuntimeError) as e:
+                return {
+                    "error": str(e),
+                    "log_hash": log_hash
+                }
         
         if not matching_log:
             return {
                 "error": f"Log entry not found (hash: {log_hash}). The log may have rotated or the entry is no longer in recent logs.",
                 "log_hash": log_hash,
-                "searched_logs": len(logs)
+                "searched_logs": searched_logs
             }
         
         # Extract traceback and metadata
@@ -1592,7 +2635,7 @@ async def get_log_details(log_hash: str):
             "message": message,
             "raw_message": message,  # For copying
             "module": matching_log.get("module"),
-            "source": all_logs_response.get("source", ""),
+            "source": "journalctl" if USE_JOURNALCTL else LOG_FILE_PATH,
             "metadata": metadata
         }
         
@@ -1613,34 +2656,230 @@ async def get_log_details(log_hash: str):
         }
 
 
-@router.get("/logout", response_class=HTMLResponse)
-async def get_logout_page():
-    """Logout information page.
+# Precompressed page bodies: the HTML pages are large and mostly static, so each is
+# gzip-compressed once instead of being sent uncompressed (or compressed per request).
+# The ETag lets browsers revalidate a cached page with a bodyless 304.
+_PageBodies = namedtuple("_PageBodies", ["identity", "gzip", "etag", "preload"])
+PAGE_CACHE_CONTROL = "private, max-age=300, stale-while-revalidate=600"  # Pages sit behind Basic auth
+# Page sources are minified once at import (kept readable in development)
+MINIFY_PAGES = not IS_DEVELOPMENT
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_SPACE_RE = re.compile(r'\s*([{};,>])\s*|(:)\s+')  # Whitespace around punctuation
+_STYLE_BLOCK_RE = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+_PAGE_ASSET_RE = re.compile(rb'(?:href|src)="(/monitor/static/[^"]+\.(css|js))"')
+_PRELOAD_AS = {b"css": "style", b"js": "script"}
+
+
+def _build_page_bodies(body: bytes) -> _PageBodies:
+    """Gzip an encoded page at maximum compression and compute its ETag.
     
-    Note: Browser-native HTTP Basic Authentication cannot be logged out programmatically.
-    Users must close their browser or clear saved credentials to log out.
+    Static assets the page references are listed in a Link preload header, so
+    the browser (or a proxy sending Early Hints) can fetch them before the HTML
+    is parsed.
     """
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Logout - FRL Python API</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-            margin: 0;
-            padding: 20px;
-        }
-        .logout-container {
-            background: white;
-            padding: 40px;
+    # mtime=0 keeps the compressed bytes (and ETag) identical across workers and restarts
+    etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+    preload = ", ".join(
+        f"<{url.decode()}>; rel=preload; as={_PRELOAD_AS[ext]}"
+        for url, ext in _PAGE_ASSET_RE.findall(body)
+    )
+    return _PageBodies(body, gzip.compress(body, compresslevel=9, mtime=0), etag, preload)
+
+
+def _minify_css(css: str) -> str:
+    """Drop comments, line breaks and the whitespace around CSS punctuation."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(lambda m: m.group(1) or m.group(2), css)
+    return css.replace(";}", "}").strip()
+
+
+def _minify_source(source: str) -> str:
+    """Strip indentation, blank lines and whole-line // comments from page HTML/CSS/JS.
+    
+    Line breaks are kept, so JavaScript statement boundaries behave exactly as
+    in the original source; lines inside a multi-line `template literal` are
+    never treated as comments. Inline <style> blocks are compacted as CSS. Not
+    for content with significant leading whitespace (<pre> blocks); the
+    monitor pages have none.
+    """
+    if not MINIFY_PAGES:
+        return source
+    source = _STYLE_BLOCK_RE.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), source)
+    lines = []
+    in_template = False
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or (line.startswith("//") and not in_template):
+            continue
+        if line.count("`") % 2:
+            in_template = not in_template
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _precompress_page(html: str) -> _PageBodies:
+    """Minify, encode and compress a static page once."""
+    return _build_page_bodies(_minify_source(html).encode("utf-8"))
+
+
+# Per-request pages (worker PID, log hash) are plain templates with a marker instead
+# of f-strings: encoded once around the marker, so a request only joins in its value.
+WORKER_DETAIL_PAGE_CACHE_SIZE = 64  # Compressed pages kept for recently viewed PIDs
+LOG_DETAIL_PAGE_CACHE_SIZE = 64  # Compressed pages kept for recently viewed log entries
+
+
+def _page_template_parts(html: str, marker: str) -> tuple:
+    """Minify and encode a page template into the byte segments around each marker."""
+    return tuple(part.encode("utf-8") for part in _minify_source(html).split(marker))
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison, as RFC 9110 requires for it)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    opaque = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        # The gzip representation carries a "-gzip" suffixed tag of the same page
+        if candidate.strip('"') in (opaque, opaque + "-gzip"):
+            return True
+    return False
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Check whether the client's Accept-Encoding allows gzip.
+    
+    An explicit gzip entry takes precedence over "*", wherever each appears; a q-value
+    of 0 means "not acceptable". Entries with a malformed q-value are ignored.
+    """
+    gzip_q = None
+    wildcard_q = None
+    for token in request.headers.get("accept-encoding", "").split(","):
+        coding, *params = token.split(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = None
+        if q is None:
+            continue
+        if coding == "gzip":
+            gzip_q = q
+        else:
+            wildcard_q = q
+    if gzip_q is not None:
+        return gzip_q > 0
+    return wildcard_q is not None and wildcard_q > 0
+
+
+PAGE_RESPONSE_CACHE_SIZE = 256  # Prepared responses kept for recently served pages/assets
+
+
+@functools.lru_cache(maxsize=PAGE_RESPONSE_CACHE_SIZE)
+def _page_responses(page: _PageBodies, media_type: str, cache_control: str) -> Dict[Tuple[bool, bool], Response]:
+    """Build every response a page can get once, keyed by (gzip, not_modified).
+    
+    Sending a Response only reads its body and headers, so the same instances
+    are returned to every request instead of rebuilding headers each time.
+    """
+    responses = {}
+    for use_gzip in (False, True):
+        # Each representation gets its own strong ETag
+        headers = {
+            "Vary": "Accept-Encoding",
+            "ETag": page.etag[:-1] + '-gzip"' if use_gzip else page.etag,
+            "Cache-Control": cache_control
+        }
+        responses[use_gzip, True] = Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        if page.preload:
+            headers["Link"] = page.preload
+        content = page.gzip if use_gzip else page.identity
+        responses[use_gzip, False] = Response(content=content, media_type=media_type, headers=headers)
+    return responses
+
+
+def _page_response(
+    request: Request,
+    page: _PageBodies,
+    media_type: str = "text/html",
+    cache_control: str = PAGE_CACHE_CONTROL
+) -> Response:
+    """Serve a precompressed page, gzip-encoded when the client accepts it.
+    
+    Returns 304 Not Modified when the client already has the current version.
+    """
+    responses = _page_responses(page, media_type, cache_control)
+    return responses[_accepts_gzip(request), _etag_matches(request, page.etag)]
+
+
+# Page CSS/JS served as separate assets under content-fingerprinted names, so the
+# browser caches them for good and only the small HTML shell is revalidated.
+# A changed asset gets a new name (and URL) when the module is next loaded.
+STATIC_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STATIC_ASSET_MEDIA_TYPES = {
+    ".css": "text/css",
+    ".js": "application/javascript"
+}
+_static_assets = {}  # fingerprinted name -> (_PageBodies, media type)
+
+
+def _register_static_asset(name: str, content: str) -> str:
+    """Register a CSS/JS asset and return its fingerprinted URL.
+    
+    Args:
+        name: Asset name such as "dashboard.css"; the extension selects the media type
+        content: Asset source
+        
+    Returns:
+        URL of the asset, e.g. /monitor/static/dashboard.<hash>.css
+    """
+    stem, ext = os.path.splitext(name)
+    if ext == ".css" and MINIFY_PAGES:
+        content = _minify_css(content)
+    asset = _precompress_page(content)
+    fingerprint = asset.etag.strip('"')[:12]
+    fingerprinted = f"{stem}.{fingerprint}{ext}"
+    _static_assets[fingerprinted] = (asset, STATIC_ASSET_MEDIA_TYPES[ext])
+    return f"/monitor/static/{fingerprinted}"
+
+
+@router.get("/static/{name}")
+async def get_static_asset(name: str, request: Request):
+    """Serve a fingerprinted page asset (CSS/JS); these carry no data, so no auth."""
+    entry = _static_assets.get(name)
+    if entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+    asset, media_type = entry
+    return _page_response(request, asset, media_type=media_type, cache_control=STATIC_ASSET_CACHE_CONTROL)
+
+
+_LOGOUT_CSS = """
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            background: #f5f5f5;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+            margin: 0;
+            padding: 20px;
+        }
+        .logout-container {
+            background: white;
+            padding: 40px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             max-width: 500px;
@@ -1670,7 +2909,15 @@ async def get_logout_page():
         a:hover {
             text-decoration: underline;
         }
-    </style>
+"""
+_LOGOUT_PAGE_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Logout - FRL Python API</title>
+    <link rel="stylesheet" href="{css_url}">
 </head>
 <body>
     <div class="logout-container">
@@ -1690,21 +2937,23 @@ async def get_logout_page():
     </div>
 </body>
 </html>
+""".format(css_url=_register_static_asset("logout.css", _LOGOUT_CSS))
+_LOGOUT_PAGE = _precompress_page(_LOGOUT_PAGE_HTML)
+
+
+@router.get("/logout", response_class=HTMLResponse)
+async def get_logout_page(request: Request):
+    """Logout information page.
+    
+    Note: Browser-native HTTP Basic Authentication cannot be logged out programmatically.
+    Users must close their browser or clear saved credentials to log out.
     """
-    return HTMLResponse(content=html_content)
+    return _page_response(request, _LOGOUT_PAGE)
 
 
-@router.get("/dashboard/page", response_class=HTMLResponse)
-async def get_dashboard_page(username: str = Depends(verify_dashboard_credentials)):
-    """HTML dashboard for monitoring Gunicorn workers."""
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Gunicorn Worker Monitor</title>
-    <style>
+# Rules shared by every monitor page (reset, layout, nav menu, system metrics);
+# pages link this first and keep only their own rules and overrides
+_COMMON_CSS = """
         * {
             margin: 0;
             padding: 0;
@@ -1720,117 +2969,6 @@ async def get_dashboard_page(username: str = Depends(verify_dashboard_credential
             max-width: 1400px;
             margin: 0 auto;
         }
-        header {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        h1 {
-            color: #2c3e50;
-            font-size: 24px;
-        }
-        .refresh-indicator {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            color: #666;
-            font-size: 14px;
-        }
-        .refresh-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            background: #4CAF50;
-            animation: pulse 2s infinite;
-        }
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        .stat-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .stat-label {
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 8px;
-        }
-        .stat-value {
-            font-size: 28px;
-            font-weight: bold;
-            color: #2c3e50;
-        }
-        .stat-unit {
-            font-size: 14px;
-            color: #999;
-            font-weight: normal;
-        }
-        .workers-section {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .workers-section h2 {
-            margin-bottom: 20px;
-            color: #2c3e50;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-        th {
-            text-align: left;
-            padding: 12px;
-            background: #f8f9fa;
-            color: #666;
-            font-weight: 600;
-            font-size: 12px;
-            text-transform: uppercase;
-            border-bottom: 2px solid #e0e0e0;
-        }
-        td {
-            padding: 12px;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        tr:hover {
-            background: #f8f9fa;
-        }
-        .status-badge {
-            display: inline-block;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 11px;
-            font-weight: 600;
-            text-transform: uppercase;
-        }
-        .status-running {
-            background: #d4edda;
-            color: #155724;
-        }
-        .status-idle {
-            background: #fff3cd;
-            color: #856404;
-        }
-        .status-dead {
-            background: #f8d7da;
-            color: #721c24;
-        }
         .loading {
             text-align: center;
             padding: 40px;
@@ -1843,10 +2981,6 @@ async def get_dashboard_page(username: str = Depends(verify_dashboard_credential
             border-radius: 4px;
             margin-bottom: 20px;
         }
-        .uptime {
-            color: #666;
-            font-size: 12px;
-        }
         .system-metrics {
             background: white;
             padding: 20px;
@@ -1894,6 +3028,12 @@ async def get_dashboard_page(username: str = Depends(verify_dashboard_credential
             background: #4CAF50;
             transition: width 0.9s ease;
         }
+        .metric-details {
+            font-size: 12px;
+            color: #666;
+            margin-top: 5px;
+            min-height: 18px;
+        }
         .progress-fill.warning {
             background: #ff9800;
         }
@@ -1934,442 +3074,248 @@ async def get_dashboard_page(username: str = Depends(verify_dashboard_credential
             background-color: #2c3e50;
             color: white;
         }
-        .worker-link {
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 600;
+"""
+COMMON_CSS_URL = _register_static_asset("common.css", _COMMON_CSS)
+
+# Script helpers shared by the monitor pages; linked ahead of each page's own script
+_COMMON_JS = """
+        // Built once; toLocaleString() sets up a new formatter on every call
+        const numberFormat = new Intl.NumberFormat();
+        
+        function formatUptime(seconds) {
+            const days = Math.floor(seconds / 86400);
+            const hours = Math.floor((seconds % 86400) / 3600);
+            const minutes = Math.floor((seconds % 3600) / 60);
+            const secs = seconds % 60;
+            
+            if (days > 0) return `${days}d ${hours}h ${minutes}m`;
+            if (hours > 0) return `${hours}h ${minutes}m`;
+            if (minutes > 0) return `${minutes}m ${secs}s`;
+            return `${secs}s`;
         }
-        .worker-link:hover {
-            text-decoration: underline;
+        
+        function formatMemory(mb) {
+            if (mb >= 1024) return (mb / 1024).toFixed(2) + ' GB';
+            return mb.toFixed(2) + ' MB';
         }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <nav class="nav-menu">
-            <ul>
-                <li><a href="/monitor/dashboard/page" class="active">Dashboard</a></li>
-                <li><a href="/monitor/health/page">Health</a></li>
-                <li><a href="/monitor/logs/page">Logs</a></li>
-            </ul>
-        </nav>
         
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Disk Usage</div>
-                    <div class="metric-value" id="disk-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
-        
-        <header>
-            <h1>Gunicorn Worker Monitor</h1>
-            <div class="refresh-indicator">
-                <div class="refresh-dot"></div>
-                <span>Auto-refreshing every 0.5 seconds</span>
-            </div>
-        </header>
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
         
-        <div id="error-container"></div>
-        
-        <div class="stats-grid" id="stats-grid">
-            <div class="stat-card">
-                <div class="stat-label">Total Requests</div>
-                <div class="stat-value" id="total-requests">-</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Requests/Min</div>
-                <div class="stat-value" id="requests-per-minute">-</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Avg Response Time</div>
-                <div class="stat-value" id="avg-response-time">-<span class="stat-unit"> ms</span></div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Error Rate</div>
-                <div class="stat-value" id="error-rate">-<span class="stat-unit">%</span></div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Active Workers</div>
-                <div class="stat-value" id="active-workers">-</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Uptime</div>
-                <div class="stat-value" id="uptime">-</div>
-            </div>
-        </div>
+        // Escape a value for HTML text or a quoted attribute; unlike a scratch element's
+        // innerHTML this needs no DOM node per call and also escapes quotes
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
         
-        <div class="workers-section">
-            <h2>Worker Processes</h2>
-            <div id="workers-container" class="loading">Loading workers...</div>
-        </div>
-    </div>
-    
-    <script>
-        function formatUptime(seconds) {
-            const days = Math.floor(seconds / 86400);
-            const hours = Math.floor((seconds % 86400) / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            const secs = seconds % 60;
-            
-            if (days > 0) return `${days}d ${hours}h ${minutes}m`;
-            if (hours > 0) return `${hours}h ${minutes}m`;
-            if (minutes > 0) return `${minutes}m ${secs}s`;
-            return `${secs}s`;
+        // Only touch the DOM when a value actually changed (avoids style recalc/reflow per tick)
+        function setText(node, value) {
+            const text = String(value);
+            if (node.textContent !== text) node.textContent = text;
         }
         
-        function formatMemory(mb) {
-            if (mb >= 1024) return (mb / 1024).toFixed(2) + ' GB';
-            return mb.toFixed(2) + ' MB';
+        function setProgress(node, percent) {
+            const width = percent + '%';
+            if (node.style.width !== width) node.style.width = width;
+            const className = 'progress-fill' + (percent > 80 ? ' danger' : percent > 60 ? ' warning' : '');
+            if (node.className !== className) node.className = className;
         }
         
-        async function fetchDashboard() {
-            try {
-                const response = await fetch('/monitor/dashboard');
-                const data = await response.json();
-                
-                if (data.error) {
-                    document.getElementById('error-container').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
-                    return;
-                }
-                
-                const stats = data.stats || {};
-                const workers = data.workers || {};
-                
-                // Handle stats data
-                if (stats.error) {
-                    document.getElementById('error-container').innerHTML = 
-                        '<div class="error">Error: ' + stats.error + '</div>';
-                    return;
+        // The text node holding a card's number when its unit is a child <span>, so
+        // updates set that node's text instead of re-parsing the markup
+        function valueNode(id) {
+            const element = document.getElementById(id);
+            if (!element.firstChild || element.firstChild.nodeType !== Node.TEXT_NODE) {
+                element.insertBefore(document.createTextNode(''), element.firstChild);
+            }
+            return element.firstChild;
+        }
+        
+        const POLL_TIMEOUT_MS = 2000;  // Shortest time a polled call may run before it is aborted
+        
+        // Run fn now, then ms milliseconds after each previous call finished, while the
+        // tab is visible. One call at a time: a stalled backend delays the next tick
+        // instead of piling up requests. fn gets an AbortSignal (pass it to fetch) that
+        // fires once the call outlives max(ms, POLL_TIMEOUT_MS). Hidden tabs stop polling
+        // entirely and catch up with an immediate call when shown again.
+        // Returns a function that stops polling for good.
+        function startPolling(fn, ms) {
+            const timeout = Math.max(ms, POLL_TIMEOUT_MS);
+            let timer = null;
+            let running = false;
+            let active = false;
+            
+            async function tick() {
+                timer = null;
+                running = true;
+                const controller = new AbortController();
+                const abortTimer = setTimeout(() => controller.abort(), timeout);
+                try {
+                    await fn(controller.signal);
+                } finally {
+                    clearTimeout(abortTimer);
+                    running = false;
+                    if (active) {
+                        timer = setTimeout(tick, ms);
+                    }
                 }
-                
-                document.getElementById('total-requests').textContent = stats.total_requests.toLocaleString();
-                document.getElementById('requests-per-minute').textContent = stats.requests_per_minute;
-                document.getElementById('avg-response-time').innerHTML = 
-                    stats.average_response_time_ms.toFixed(2) + '<span class="stat-unit"> ms</span>';
-                document.getElementById('error-rate').innerHTML = 
-                    (stats.error_rate * 100).toFixed(2) + '<span class="stat-unit">%</span>';
-                document.getElementById('active-workers').textContent = stats.active_workers;
-                document.getElementById('uptime').textContent = formatUptime(stats.uptime_seconds);
-                
-                // Update system metrics
-                if (stats.system) {
-                    const cpuPercent = stats.system.cpu_percent;
-                    const memPercent = stats.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        stats.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        stats.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = stats.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        stats.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        stats.system.disk_total_gb.toFixed(2) + ' GB';
+            }
+            
+            // A call still running reschedules itself when it finishes
+            function resume() {
+                active = true;
+                if (!timer && !running) {
+                    tick();
                 }
-                
-                // Handle workers data
-                if (workers.error) {
-                    document.getElementById('workers-container').innerHTML = 
-                        '<div class="error">Error: ' + workers.error + '</div>';
-                    return;
+            }
+            
+            function pause() {
+                active = false;
+                if (timer) {
+                    clearTimeout(timer);
+                    timer = null;
                 }
-                
-                if (!workers.workers || workers.workers.length === 0) {
-                    document.getElementById('workers-container').innerHTML = 
-                        '<div class="loading">No workers found. Make sure Gunicorn is running.</div>';
-                    return;
+            }
+            
+            function onVisibilityChange() {
+                if (document.hidden) {
+                    pause();
+                } else if (!active) {
+                    resume();
                 }
-                
-                let html = '<table><thead><tr>';
-                html += '<th>PID</th>';
-                html += '<th>CPU %</th>';
-                html += '<th>Memory</th>';
-                html += '<th>Uptime</th>';
-                html += '<th>Status</th>';
-                html += '</tr></thead><tbody>';
-                
-                workers.workers.forEach(worker => {
-                    html += '<tr>';
-                    html += '<td><a href="/monitor/worker/' + worker.pid + '/page" class="worker-link">' + worker.pid + '</a></td>';
-                    html += '<td>' + worker.cpu_percent.toFixed(2) + '%</td>';
-                    html += '<td>' + formatMemory(worker.memory_mb) + '</td>';
-                    html += '<td class="uptime">' + formatUptime(worker.uptime_seconds) + '</td>';
-                    html += '<td><span class="status-badge status-' + worker.status + '">' + worker.status + '</span></td>';
-                    html += '</tr>';
+            }
+            
+            document.addEventListener('visibilitychange', onVisibilityChange);
+            if (!document.hidden) {
+                resume();
+            }
+            return () => {
+                pause();
+                document.removeEventListener('visibilitychange', onVisibilityChange);
+            };
+        }
+        
+        // Fetch a polled JSON endpoint, revalidating with the last ETag it sent; resolves
+        // to null on 304 (payload unchanged), so callers skip the parse and DOM updates
+        function conditionalFetcher(url) {
+            let etag = null;
+            return async function (signal) {
+                const options = { signal };
+                if (etag) options.headers = { 'If-None-Match': etag };
+                const response = await fetch(url, options);
+                if (response.status === 304) return null;
+                etag = response.headers.get('ETag');
+                return response.json();
+            };
+        }
+        
+        // Deliver the JSON payloads of url to onData while the tab is visible: pushed
+        // over the url + '/stream' Server-Sent Events stream, or by polling url every
+        // ms milliseconds where EventSource is unavailable. Fetch failures reach onData
+        // as {error: message}. Returns a function that stops updates for good.
+        function startStream(url, onData, ms) {
+            // Payloads are applied at the start of the next frame, alongside any other
+            // frame-batched DOM work; several arriving within one frame collapse to the latest
+            let pendingData = null;
+            function deliver(data) {
+                const scheduled = pendingData !== null;
+                pendingData = data;
+                if (scheduled) return;
+                requestAnimationFrame(() => {
+                    const latest = pendingData;
+                    pendingData = null;
+                    onData(latest);
                 });
-                
-                html += '</tbody></table>';
-                html += '<div style="margin-top: 10px; color: #666; font-size: 12px;">';
-                html += 'Master PID: ' + (workers.master_pid || 'N/A') + ' | Total Workers: ' + workers.total_workers;
-                html += '</div>';
-                
-                document.getElementById('workers-container').innerHTML = html;
-                document.getElementById('error-container').innerHTML = '';
-            } catch (error) {
-                document.getElementById('error-container').innerHTML = 
-                    '<div class="error">Error fetching dashboard: ' + error.message + '</div>';
             }
+            
+            if (!window.EventSource) {
+                const fetchPayload = conditionalFetcher(url);
+                async function poll(signal) {
+                    try {
+                        const data = await fetchPayload(signal);
+                        if (data) deliver(data);
+                    } catch (error) {
+                        deliver({ error: error.message });
+                    }
+                }
+                return startPolling(poll, ms);
+            }
+            
+            let stream = null;
+            
+            // EventSource reconnects on its own after errors or when the server ends the stream
+            function open() {
+                stream = new EventSource(url + '/stream');
+                stream.onmessage = event => deliver(JSON.parse(event.data));
+            }
+            
+            function close() {
+                if (stream) {
+                    stream.close();
+                    stream = null;
+                }
+            }
+            
+            // A reopened stream delivers fresh data right away
+            function onVisibilityChange() {
+                if (document.hidden) {
+                    close();
+                } else if (!stream) {
+                    open();
+                }
+            }
+            
+            document.addEventListener('visibilitychange', onVisibilityChange);
+            if (!document.hidden) {
+                open();
+            }
+            return () => {
+                close();
+                document.removeEventListener('visibilitychange', onVisibilityChange);
+            };
         }
         
-        async function refresh() {
-            await fetchDashboard();
-        }
-        
-        // Initial load
-        refresh();
+        // System Metrics panel elements, looked up on first use
+        let systemMetricsEls = null;
         
-        // Auto-refresh every 0.5 seconds
-        setInterval(refresh, 500);
-    </script>
-</body>
-</html>
-    """
-    return HTMLResponse(content=html_content)
-
+        // Fill the shared System Metrics panel from a /monitor/stats payload
+        function updateSystemMetrics(data) {
+            if (!data.system) return;
+            
+            if (!systemMetricsEls) {
+                systemMetricsEls = {
+                    cpuPercent: document.getElementById('cpu-percent'),
+                    cpuProgress: document.getElementById('cpu-progress'),
+                    memoryPercent: document.getElementById('memory-percent'),
+                    memoryProgress: document.getElementById('memory-progress'),
+                    memoryDetails: document.getElementById('memory-details'),
+                    diskPercent: document.getElementById('disk-percent'),
+                    diskProgress: document.getElementById('disk-progress'),
+                    diskDetails: document.getElementById('disk-details')
+                };
+            }
+            const els = systemMetricsEls;
+            const system = data.system;
+            
+            setText(els.cpuPercent, system.cpu_percent.toFixed(1) + '%');
+            setProgress(els.cpuProgress, system.cpu_percent);
+            
+            setText(els.memoryPercent, system.memory_percent.toFixed(1) + '%');
+            setProgress(els.memoryProgress, system.memory_percent);
+            setText(els.memoryDetails,
+                system.memory_used_gb.toFixed(2) + ' GB / ' + system.memory_total_gb.toFixed(2) + ' GB');
+            
+            setText(els.diskPercent, system.disk_percent.toFixed(1) + '%');
+            setProgress(els.diskProgress, system.disk_percent);
+            setText(els.diskDetails,
+                system.disk_used_gb.toFixed(2) + ' GB / ' + system.disk_total_gb.toFixed(2) + ' GB');
+        }
+"""
+COMMON_JS_URL = _register_static_asset("common.js", _COMMON_JS)
 
-@router.get("/worker/{pid}/page", response_class=HTMLResponse)
-async def get_worker_detail_page(pid: int, username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing detailed worker process information."""
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Worker {pid} Details - Gunicorn Monitor</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-        .back-link {{
-            display: inline-block;
-            margin-bottom: 20px;
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-        }}
-        .back-link:hover {{
-            text-decoration: underline;
-        }}
-        .detail-section {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .detail-section h2 {{
-            color: #2c3e50;
-            margin-bottom: 15px;
-            font-size: 20px;
-        }}
-        .detail-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 15px;
-        }}
-        .detail-item {{
-            padding: 10px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }}
-        .detail-label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 5px;
-        }}
-        .detail-value {{
-            font-size: 16px;
-            font-weight: 600;
-            color: #2c3e50;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 10px;
-        }}
-        th {{
-            text-align: left;
-            padding: 10px;
-            background: #f8f9fa;
-            color: #666;
-            font-weight: 600;
-            font-size: 12px;
-            text-transform: uppercase;
-            border-bottom: 2px solid #e0e0e0;
-        }}
-        td {{
-            padding: 10px;
-            border-bottom: 1px solid #e0e0e0;
-            font-size: 14px;
-        }}
-        .loading {{
-            text-align: center;
-            padding: 40px;
-            color: #666;
-        }}
-        .error {{
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 20px;
-        }}
-        .nav-menu {{
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .nav-menu ul {{
-            list-style: none;
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }}
-        .nav-menu li {{
-            margin: 0;
-        }}
-        .nav-menu a {{
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }}
-        .nav-menu a:hover {{
-            background-color: #f0f0f0;
-        }}
-        .nav-menu a.active {{
-            background-color: #2c3e50;
-            color: white;
-        }}
-        .system-metrics {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .system-metrics h2 {{
-            color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
-        }}
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-        }}
-        .metric-item {{
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }}
-        .metric-label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 8px;
-        }}
-        .metric-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }}
-        .progress-bar {{
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
-        }}
-        .progress-fill {{
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.9s ease;
-        }}
-        .progress-fill.warning {{
-            background: #ff9800;
-        }}
-        .progress-fill.danger {{
-            background: #f44336;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <nav class="nav-menu">
-            <ul>
-                <li><a href="/monitor/dashboard/page">Dashboard</a></li>
-                <li><a href="/monitor/health/page">Health</a></li>
-                <li><a href="/monitor/logs/page">Logs</a></li>
-            </ul>
-        </nav>
-        
-        <div class="system-metrics" id="system-metrics">
+# System Metrics panel markup shared by every page; filled in by updateSystemMetrics in common.js
+_SYSTEM_METRICS_HTML = """<div class="system-metrics" id="system-metrics">
             <h2>System Metrics</h2>
-            <div class="metrics-grid">
+            <div class="metrics-grid" id="metrics-grid">
                 <div class="metric-item">
                     <div class="metric-label">CPU Usage</div>
                     <div class="metric-value" id="cpu-percent">-</div>
@@ -2383,313 +3329,89 @@ async def get_worker_detail_page(pid: int, username: str = Depends(verify_dashbo
                     <div class="progress-bar">
                         <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
                     </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
+                    <div class="metric-details" id="memory-details">-</div>
                 </div>
                 <div class="metric-item">
                     <div class="metric-label">Disk Usage</div>
                     <div class="metric-value" id="disk-percent">-</div>
                     <div class="progress-bar">
                         <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
-        
-        <a href="/monitor/dashboard/page" class="back-link">← Back to Dashboard</a>
-        
-        <div id="worker-details" class="loading">Loading worker details...</div>
-    </div>
-    
-    <script>
-        async function loadWorkerDetails() {{
-            try {{
-                const response = await fetch('/monitor/worker/{pid}');
-                const data = await response.json();
-                
-                if (data.error) {{
-                    document.getElementById('worker-details').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
-                    return;
-                }}
-                
-                let html = '';
-                
-                // Overview Section
-                html += '<div class="detail-section">';
-                html += '<h2>Overview</h2>';
-                html += '<div class="detail-grid">';
-                html += '<div class="detail-item"><div class="detail-label">PID</div><div class="detail-value">' + data.pid + '</div></div>';
-                html += '<div class="detail-item"><div class="detail-label">Name</div><div class="detail-value">' + (data.name || 'N/A') + '</div></div>';
-                html += '<div class="detail-item"><div class="detail-label">Status</div><div class="detail-value">' + (data.status || 'N/A') + '</div></div>';
-                html += '<div class="detail-item"><div class="detail-label">Uptime</div><div class="detail-value">' + formatUptime(data.uptime_seconds || 0) + '</div></div>';
-                html += '<div class="detail-item"><div class="detail-label">CPU %</div><div class="detail-value">' + (data.cpu_percent || 0).toFixed(2) + '%</div></div>';
-                html += '<div class="detail-item"><div class="detail-label">Threads</div><div class="detail-value">' + (data.num_threads || 0) + '</div></div>';
-                html += '<div class="detail-item"><div class="detail-label">Logs</div><div class="detail-value"><a href="/monitor/worker/' + data.pid + '/logs/page" style="color: #2c3e50; text-decoration: none; font-weight: 600;">View Logs →</a></div></div>';
-                html += '</div></div>';
-                
-                // Memory Section
-                if (data.memory) {{
-                    html += '<div class="detail-section">';
-                    html += '<h2>Memory</h2>';
-                    html += '<div class="detail-grid">';
-                    html += '<div class="detail-item"><div class="detail-label">RSS</div><div class="detail-value">' + data.memory.rss_mb.toFixed(2) + ' MB</div></div>';
-                    html += '<div class="detail-item"><div class="detail-label">VMS</div><div class="detail-value">' + data.memory.vms_mb.toFixed(2) + ' MB</div></div>';
-                    if (data.memory.shared_mb !== undefined) {{
-                        html += '<div class="detail-item"><div class="detail-label">Shared</div><div class="detail-value">' + data.memory.shared_mb.toFixed(2) + ' MB</div></div>';
-                    }}
-                    html += '</div></div>';
-                }}
-                
-                // Children Section
-                if (data.children && data.children.length > 0) {{
-                    html += '<div class="detail-section">';
-                    html += '<h2>Child Processes (' + data.children.length + ')</h2>';
-                    html += '<table><thead><tr><th>PID</th><th>Name</th><th>Status</th></tr></thead><tbody>';
-                    data.children.forEach(child => {{
-                        html += '<tr><td>' + child.pid + '</td><td>' + child.name + '</td><td>' + child.status + '</td></tr>';
-                    }});
-                    html += '</tbody></table></div>';
-                }}
-                
-                // Threads Section
-                if (data.threads && data.threads.length > 0) {{
-                    html += '<div class="detail-section">';
-                    html += '<h2>Threads (' + data.threads.length + ')</h2>';
-                    html += '<table><thead><tr><th>Thread ID</th><th>User Time</th><th>System Time</th></tr></thead><tbody>';
-                    data.threads.slice(0, 20).forEach(thread => {{
-                        html += '<tr><td>' + thread.id + '</td><td>' + thread.user_time.toFixed(2) + 's</td><td>' + thread.system_time.toFixed(2) + 's</td></tr>';
-                    }});
-                    if (data.threads.length > 20) {{
-                        html += '<tr><td colspan="3">... and ' + (data.threads.length - 20) + ' more</td></tr>';
-                    }}
-                    html += '</tbody></table></div>';
-                }}
-                
-                // Connections Section
-                if (data.connections && data.connections.length > 0) {{
-                    html += '<div class="detail-section">';
-                    html += '<h2>Network Connections (' + data.connections.length + ')</h2>';
-                    html += '<table><thead><tr><th>Local Address</th><th>Remote Address</th><th>Status</th><th>Type</th></tr></thead><tbody>';
-                    data.connections.forEach(conn => {{
-                        html += '<tr><td>' + (conn.laddr || 'N/A') + '</td><td>' + (conn.raddr || 'N/A') + '</td><td>' + (conn.status || 'N/A') + '</td><td>' + (conn.type || 'N/A') + '</td></tr>';
-                    }});
-                    html += '</tbody></table></div>';
-                }}
-                
-                // I/O Section
-                if (data.io) {{
-                    html += '<div class="detail-section">';
-                    html += '<h2>I/O Statistics</h2>';
-                    html += '<div class="detail-grid">';
-                    html += '<div class="detail-item"><div class="detail-label">Read Count</div><div class="detail-value">' + data.io.read_count.toLocaleString() + '</div></div>';
-                    html += '<div class="detail-item"><div class="detail-label">Write Count</div><div class="detail-value">' + data.io.write_count.toLocaleString() + '</div></div>';
-                    html += '<div class="detail-item"><div class="detail-label">Read Bytes</div><div class="detail-value">' + data.io.read_bytes_mb.toFixed(2) + ' MB</div></div>';
-                    html += '<div class="detail-item"><div class="detail-label">Write Bytes</div><div class="detail-value">' + data.io.write_bytes_mb.toFixed(2) + ' MB</div></div>';
-                    html += '</div></div>';
-                }}
-                
-                // Command Line Section
-                if (data.cmdline && data.cmdline.length > 0) {{
-                    html += '<div class="detail-section">';
-                    html += '<h2>Command Line</h2>';
-                    html += '<div style="background: #f8f9fa; padding: 15px; border-radius: 4px; font-family: monospace; word-break: break-all;">';
-                    html += data.cmdline.join(' ');
-                    html += '</div></div>';
-                }}
-                
-                document.getElementById('worker-details').innerHTML = html;
-            }} catch (error) {{
-                document.getElementById('worker-details').innerHTML = 
-                    '<div class="error">Error loading worker details: ' + error.message + '</div>';
-            }}
-        }}
-        
-        function formatUptime(seconds) {{
-            const days = Math.floor(seconds / 86400);
-            const hours = Math.floor((seconds % 86400) / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            const secs = seconds % 60;
-            
-            if (days > 0) return `${{days}}d ${{hours}}h ${{minutes}}m`;
-            if (hours > 0) return `${{hours}}h ${{minutes}}m`;
-            if (minutes > 0) return `${{minutes}}m ${{secs}}s`;
-            return `${{secs}}s`;
-        }}
-        
-        async function fetchSystemMetrics() {{
-            try {{
-                const response = await fetch('/monitor/stats');
-                const data = await response.json();
-                
-                if (data.system) {{
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
-                }}
-            }} catch (error) {{
-                // Silently fail - don't break the page if system metrics fail
-            }}
-        }}
-        
-        // Load on page load
-        fetchSystemMetrics();
-        loadWorkerDetails();
-        
-        // Auto-refresh system metrics every 0.5 seconds (matching dashboard)
-        setInterval(() => {{
-            fetchSystemMetrics();
-        }}, 500);
-        
-        // Auto-refresh worker details every 5 seconds
-        setInterval(() => {{
-            loadWorkerDetails();
-        }}, 5000);
-    </script>
-</body>
-</html>
-    """
-    return HTMLResponse(content=html_content)
-
-
-@router.get("/workers/page", response_class=HTMLResponse)
-async def get_workers_page(username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing worker processes."""
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Workers - Gunicorn Monitor</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .nav-menu {
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        .nav-menu ul {
-            list-style: none;
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }
-        .nav-menu li {
-            margin: 0;
-        }
-        .nav-menu a {
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }
-        .nav-menu a:hover {
-            background-color: #f0f0f0;
-        }
-        .nav-menu a.active {
-            background-color: #2c3e50;
-            color: white;
-        }
-        .system-metrics {
+                    </div>
+                    <div class="metric-details" id="disk-details">-</div>
+                </div>
+            </div>
+        </div>"""
+
+
+def _with_common_parts(html: str) -> str:
+    """Fill in the shared asset URLs and System Metrics panel of a page template."""
+    return (
+        html.replace("{common_css_url}", COMMON_CSS_URL)
+        .replace("{common_js_url}", COMMON_JS_URL)
+        .replace("{system_metrics_html}", _SYSTEM_METRICS_HTML)
+    )
+
+_DASHBOARD_CSS = """
+        header {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 20px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
         }
-        .system-metrics h2 {
+        h1 {
             color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
+            font-size: 24px;
         }
-        .metrics-grid {
+        .refresh-indicator {
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            color: #666;
+            font-size: 14px;
+        }
+        .refresh-dot {
+            width: 10px;
+            height: 10px;
+            border-radius: 50%;
+            background: #4CAF50;
+            animation: pulse 2s infinite;
+        }
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.5; }
+        }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
+            margin-bottom: 20px;
         }
-        .metric-item {
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 4px;
+        .stat-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            min-height: 96px;
         }
-        .metric-label {
+        .stat-label {
             font-size: 12px;
             color: #666;
             text-transform: uppercase;
             margin-bottom: 8px;
         }
-        .metric-value {
-            font-size: 24px;
+        .stat-value {
+            font-size: 28px;
             font-weight: bold;
             color: #2c3e50;
-            margin-bottom: 5px;
-        }
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
-        }
-        .progress-fill {
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.9s ease;
-        }
-        .progress-fill.warning {
-            background: #ff9800;
         }
-        .progress-fill.danger {
-            background: #f44336;
+        .stat-unit {
+            font-size: 14px;
+            color: #999;
+            font-weight: normal;
         }
         .workers-section {
             background: white;
@@ -2742,6 +3464,20 @@ async def get_workers_page(username: str = Depends(verify_dashboard_credentials)
             background: #f8d7da;
             color: #721c24;
         }
+        .uptime {
+            color: #666;
+            font-size: 12px;
+        }
+        .metric-item {
+            min-height: 120px;
+        }
+        .progress-fill {
+            transition: none;
+        }
+        /* Enabled only after the first values are painted, so bars don't animate up from 0% on load */
+        .metrics-grid.animated .progress-fill {
+            transition: width 0.9s ease;
+        }
         .worker-link {
             color: #2c3e50;
             text-decoration: none;
@@ -2750,351 +3486,753 @@ async def get_workers_page(username: str = Depends(verify_dashboard_credentials)
         .worker-link:hover {
             text-decoration: underline;
         }
-        .loading {
-            text-align: center;
-            padding: 40px;
+        /* Space is reserved up front so the first data update doesn't shift the layout */
+        #workers-container {
+            min-height: 240px;
+        }
+        .workers-footer {
+            margin-top: 10px;
+            color: #666;
+            font-size: 12px;
+            min-height: 18px;
+        }
+        .skeleton {
+            display: inline-block;
+            width: 60%;
+            height: 14px;
+            border-radius: 4px;
+            background-color: #eee;
+            background-image: linear-gradient(90deg, #eee 0%, #f8f8f8 50%, #eee 100%);
+            background-size: 200% 100%;
+            animation: shimmer 1.5s infinite linear;
+        }
+        @keyframes shimmer {
+            from { background-position: 100% 0; }
+            to { background-position: -100% 0; }
+        }
+"""
+_DASHBOARD_JS = """
+        const els = {
+            errorContainer: document.getElementById('error-container'),
+            totalRequests: document.getElementById('total-requests'),
+            requestsPerMinute: document.getElementById('requests-per-minute'),
+            avgResponseTime: valueNode('avg-response-time'),
+            errorRate: valueNode('error-rate'),
+            activeWorkers: document.getElementById('active-workers'),
+            uptime: document.getElementById('uptime'),
+            metricsGrid: document.getElementById('metrics-grid'),
+            workersContainer: document.getElementById('workers-container')
+        };
+        
+        // Progress bar transitions are switched on after the first metrics render
+        let metricsAnimated = false;
+        
+        let lastError = null;
+        function showError(message) {
+            if (message === lastError) return;
+            lastError = message;
+            els.errorContainer.textContent = '';
+            if (message) {
+                const div = document.createElement('div');
+                div.className = 'error';
+                div.textContent = message;
+                els.errorContainer.appendChild(div);
+            }
+        }
+        
+        // Workers table is built once; each tick only updates the cells of rows keyed by PID
+        const workerRows = new Map();
+        let workersTable = null;
+        let workersBody = null;
+        let workersFooter = null;
+        let workersMessage = null;
+        
+        function showWorkersMessage(className, message) {
+            if (workersMessage === className + message) return;
+            workersMessage = className + message;
+            workersTable = null;
+            workerRows.clear();
+            els.workersContainer.className = '';
+            els.workersContainer.textContent = '';
+            const div = document.createElement('div');
+            div.className = className;
+            div.textContent = message;
+            els.workersContainer.appendChild(div);
+        }
+        
+        function ensureWorkersTable() {
+            if (workersTable) return;
+            workersMessage = null;
+            // First render adopts the server-rendered skeleton table in place
+            const skeleton = document.getElementById('workers-table');
+            if (skeleton) {
+                workersTable = skeleton;
+                workersBody = skeleton.tBodies[0];
+                workersFooter = document.getElementById('workers-footer');
+                return;
+            }
+            workersTable = document.createElement('table');
+            const headRow = workersTable.createTHead().insertRow();
+            ['PID', 'CPU %', 'Memory', 'Uptime', 'Status'].forEach(label => {
+                const th = document.createElement('th');
+                th.textContent = label;
+                headRow.appendChild(th);
+            });
+            workersBody = workersTable.createTBody();
+            workersFooter = document.createElement('div');
+            workersFooter.className = 'workers-footer';
+            els.workersContainer.className = '';
+            els.workersContainer.textContent = '';
+            els.workersContainer.appendChild(workersTable);
+            els.workersContainer.appendChild(workersFooter);
+        }
+        
+        function createWorkerRow(pid) {
+            const tr = document.createElement('tr');
+            const link = document.createElement('a');
+            link.href = '/monitor/worker/' + pid + '/page';
+            link.className = 'worker-link';
+            link.textContent = pid;
+            tr.insertCell().appendChild(link);
+            const row = {
+                tr: tr,
+                cpu: tr.insertCell(),
+                memory: tr.insertCell(),
+                uptime: tr.insertCell(),
+                badge: document.createElement('span'),
+                status: null
+            };
+            row.uptime.className = 'uptime';
+            tr.insertCell().appendChild(row.badge);
+            return row;
+        }
+        
+        function updateWorkerRow(row, worker) {
+            setText(row.cpu, worker.cpu_percent.toFixed(2) + '%');
+            setText(row.memory, formatMemory(worker.memory_mb));
+            setText(row.uptime, formatUptime(worker.uptime_seconds));
+            if (row.status !== worker.status) {
+                row.status = worker.status;
+                row.badge.className = 'status-badge status-' + worker.status;
+                row.badge.textContent = worker.status;
+            }
+        }
+        
+        function renderWorkers(workers) {
+            ensureWorkersTable();
+            if (workerRows.size === 0) {
+                // First render: assemble every row off-document and attach them in one go
+                // (this also replaces the skeleton placeholder rows)
+                const fragment = document.createDocumentFragment();
+                workers.workers.forEach(worker => {
+                    const row = createWorkerRow(worker.pid);
+                    workerRows.set(worker.pid, row);
+                    updateWorkerRow(row, worker);
+                    fragment.appendChild(row.tr);
+                });
+                workersBody.replaceChildren(fragment);
+            } else {
+                const seen = new Set();
+                workers.workers.forEach((worker, index) => {
+                    seen.add(worker.pid);
+                    let row = workerRows.get(worker.pid);
+                    if (!row) {
+                        row = createWorkerRow(worker.pid);
+                        workerRows.set(worker.pid, row);
+                    }
+                    updateWorkerRow(row, worker);
+                    // Keep server order; only moves rows that are out of place
+                    if (workersBody.rows[index] !== row.tr) {
+                        workersBody.insertBefore(row.tr, workersBody.rows[index] || null);
+                    }
+                });
+                workerRows.forEach((row, pid) => {
+                    if (!seen.has(pid)) {
+                        row.tr.remove();
+                        workerRows.delete(pid);
+                    }
+                });
+            }
+            setText(workersFooter, 'Master PID: ' + (workers.master_pid || 'N/A') + ' | Total Workers: ' + workers.total_workers);
+        }
+        
+        function renderDashboard(data) {
+            try {
+                if (data.error) {
+                    showError('Error: ' + data.error);
+                    return;
+                }
+                
+                const stats = data.stats || {};
+                const workers = data.workers || {};
+                
+                // Handle stats data
+                if (stats.error) {
+                    showError('Error: ' + stats.error);
+                    return;
+                }
+                
+                setText(els.totalRequests, numberFormat.format(stats.total_requests));
+                setText(els.requestsPerMinute, stats.requests_per_minute);
+                setText(els.avgResponseTime, stats.average_response_time_ms.toFixed(2));
+                setText(els.errorRate, (stats.error_rate * 100).toFixed(2));
+                setText(els.activeWorkers, stats.active_workers);
+                setText(els.uptime, formatUptime(stats.uptime_seconds));
+                
+                updateSystemMetrics(stats);
+                if (stats.system && !metricsAnimated) {
+                    metricsAnimated = true;
+                    requestAnimationFrame(() => els.metricsGrid.classList.add('animated'));
+                }
+                
+                // Handle workers data
+                if (workers.error) {
+                    showWorkersMessage('error', 'Error: ' + workers.error);
+                    return;
+                }
+                
+                if (!workers.workers || workers.workers.length === 0) {
+                    showWorkersMessage('loading', 'No workers found. Make sure Gunicorn is running.');
+                    return;
+                }
+                
+                renderWorkers(workers);
+                showError(null);
+            } catch (error) {
+                showError('Error rendering dashboard: ' + error.message);
+            }
+        }
+        
+        if (!window.EventSource) {
+            setText(document.getElementById('refresh-mode'), 'Auto-refreshing every 0.5 seconds');
+        }
+        // Pushed over /monitor/dashboard/stream (polled every 0.5 seconds without EventSource),
+        // only while the tab is visible
+        startStream('/monitor/dashboard', renderDashboard, 500);
+"""
+WORKER_SKELETON_ROWS = 5  # Placeholder rows rendered until the first update arrives
+_DASHBOARD_PAGE_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Gunicorn Worker Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
+    <link rel="stylesheet" href="{css_url}">
+    <script src="{common_js_url}" defer></script>
+    <script src="{js_url}" defer></script>
+</head>
+<body>
+    <div class="container">
+        <nav class="nav-menu">
+            <ul>
+                <li><a href="/monitor/dashboard/page" class="active">Dashboard</a></li>
+                <li><a href="/monitor/health/page">Health</a></li>
+                <li><a href="/monitor/logs/page">Logs</a></li>
+            </ul>
+        </nav>
+        
+        {system_metrics_html}
+        
+        <header>
+            <h1>Gunicorn Worker Monitor</h1>
+            <div class="refresh-indicator">
+                <div class="refresh-dot"></div>
+                <span id="refresh-mode">Live updates</span>
+            </div>
+        </header>
+        
+        <div id="error-container"></div>
+        
+        <div class="stats-grid" id="stats-grid">
+            <div class="stat-card">
+                <div class="stat-label">Total Requests</div>
+                <div class="stat-value" id="total-requests">-</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Requests/Min</div>
+                <div class="stat-value" id="requests-per-minute">-</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Avg Response Time</div>
+                <div class="stat-value" id="avg-response-time">-<span class="stat-unit"> ms</span></div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Error Rate</div>
+                <div class="stat-value" id="error-rate">-<span class="stat-unit">%</span></div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Active Workers</div>
+                <div class="stat-value" id="active-workers">-</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Uptime</div>
+                <div class="stat-value" id="uptime">-</div>
+            </div>
+        </div>
+        
+        <div class="workers-section">
+            <h2>Worker Processes</h2>
+            <div id="workers-container">
+                <table id="workers-table">
+                    <thead>
+                        <tr><th>PID</th><th>CPU %</th><th>Memory</th><th>Uptime</th><th>Status</th></tr>
+                    </thead>
+                    <tbody>{skeleton_rows}</tbody>
+                </table>
+                <div class="workers-footer" id="workers-footer"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+""".format(
+    skeleton_rows=WORKER_SKELETON_ROWS * (
+        "<tr>" + '<td><span class="skeleton"></span></td>' * 5 + "</tr>"
+    ),
+    common_css_url=COMMON_CSS_URL,
+    common_js_url=COMMON_JS_URL,
+    system_metrics_html=_SYSTEM_METRICS_HTML,
+    css_url=_register_static_asset("dashboard.css", _DASHBOARD_CSS),
+    js_url=_register_static_asset("dashboard.js", _DASHBOARD_JS)
+)
+_DASHBOARD_PAGE = _precompress_page(_DASHBOARD_PAGE_HTML)
+
+
+@router.get("/dashboard/page", response_class=HTMLResponse)
+async def get_dashboard_page(request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML dashboard for monitoring Gunicorn workers."""
+    return _page_response(request, _DASHBOARD_PAGE)
+
+
+_WORKER_DETAIL_CSS = """
+        .back-link {
+            display: inline-block;
+            margin-bottom: 20px;
+            color: #2c3e50;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        .back-link:hover {
+            text-decoration: underline;
+        }
+        .detail-section {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            margin-bottom: 20px;
+        }
+        .detail-section h2 {
+            color: #2c3e50;
+            margin-bottom: 15px;
+            font-size: 20px;
+        }
+        .detail-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 15px;
+        }
+        .detail-item {
+            padding: 10px;
+            background: #f8f9fa;
+            border-radius: 4px;
+        }
+        .detail-label {
+            font-size: 12px;
+            color: #666;
+            text-transform: uppercase;
+            margin-bottom: 5px;
+        }
+        .detail-value {
+            font-size: 16px;
+            font-weight: 600;
+            color: #2c3e50;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 10px;
+        }
+        th {
+            text-align: left;
+            padding: 10px;
+            background: #f8f9fa;
             color: #666;
+            font-weight: 600;
+            font-size: 12px;
+            text-transform: uppercase;
+            border-bottom: 2px solid #e0e0e0;
         }
-        .error {
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
+        td {
+            padding: 10px;
+            border-bottom: 1px solid #e0e0e0;
+            font-size: 14px;
+        }
+        .show-more {
+            margin-top: 10px;
+            padding: 8px 16px;
+            border: 1px solid #e0e0e0;
             border-radius: 4px;
-            margin-bottom: 20px;
+            background: #f8f9fa;
+            color: #2c3e50;
+            cursor: pointer;
         }
-        .uptime {
+        .show-more:hover {
+            background: #e0e0e0;
+        }
+        .list-note {
+            margin-top: 10px;
             color: #666;
             font-size: 12px;
         }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <nav class="nav-menu">
-            <ul>
-                <li><a href="/monitor/dashboard/page">Dashboard</a></li>
-                <li><a href="/monitor/health/page">Health</a></li>
-                <li><a href="/monitor/logs/page">Logs</a></li>
-            </ul>
-        </nav>
-        
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Disk Usage</div>
-                    <div class="metric-value" id="disk-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="workers-section">
-            <h2>Worker Processes</h2>
-            <div id="error-container"></div>
-            <div id="workers-container" class="loading">Loading workers...</div>
-        </div>
-    </div>
-    
-    <script>
-        function formatUptime(seconds) {
-            const days = Math.floor(seconds / 86400);
-            const hours = Math.floor((seconds % 86400) / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            const secs = seconds % 60;
+"""
+_WORKER_DETAIL_JS = """
+        function showDetailsError(message) {
+            const div = document.createElement('div');
+            div.className = 'error';
+            div.textContent = message;
+            document.getElementById('worker-details').replaceChildren(div);
+        }
+        
+        function detailSection(title) {
+            const section = document.createElement('div');
+            section.className = 'detail-section';
+            const heading = document.createElement('h2');
+            heading.textContent = title;
+            section.appendChild(heading);
+            return section;
+        }
+        
+        // items: [label, value] pairs; a value may be a DOM node
+        function appendDetailGrid(section, items) {
+            const grid = document.createElement('div');
+            grid.className = 'detail-grid';
+            items.forEach(([label, value]) => {
+                const item = document.createElement('div');
+                item.className = 'detail-item';
+                const labelDiv = document.createElement('div');
+                labelDiv.className = 'detail-label';
+                labelDiv.textContent = label;
+                const valueDiv = document.createElement('div');
+                valueDiv.className = 'detail-value';
+                if (value instanceof Node) {
+                    valueDiv.appendChild(value);
+                } else {
+                    valueDiv.textContent = value;
+                }
+                item.appendChild(labelDiv);
+                item.appendChild(valueDiv);
+                grid.appendChild(item);
+            });
+            section.appendChild(grid);
+        }
+        
+        // Rows revealed with "Show more" per table, kept across refreshes
+        const detailRowsShown = {};
+        
+        // rows: arrays of cell text. Only the first pageSize rows are built up front;
+        // a "Show more" button appends the next batch on demand, so a worker with
+        // thousands of threads or children never renders thousands of rows at once.
+        function appendDetailTable(section, key, headers, rows, pageSize) {
+            const table = document.createElement('table');
+            const headRow = table.createTHead().insertRow();
+            headers.forEach(label => {
+                const th = document.createElement('th');
+                th.textContent = label;
+                headRow.appendChild(th);
+            });
+            const tbody = table.createTBody();
+            section.appendChild(table);
             
-            if (days > 0) return `${days}d ${hours}h ${minutes}m`;
-            if (hours > 0) return `${hours}h ${minutes}m`;
-            if (minutes > 0) return `${minutes}m ${secs}s`;
-            return `${secs}s`;
-        }
-        
-        function formatMemory(mb) {
-            if (mb >= 1024) return (mb / 1024).toFixed(2) + ' GB';
-            return mb.toFixed(2) + ' MB';
+            let shown = 0;
+            function showRows(count) {
+                // Each batch is assembled in a fragment and attached once
+                const fragment = document.createDocumentFragment();
+                rows.slice(shown, count).forEach(cells => {
+                    const tr = document.createElement('tr');
+                    cells.forEach(text => {
+                        tr.insertCell().textContent = text;
+                    });
+                    fragment.appendChild(tr);
+                });
+                tbody.appendChild(fragment);
+                shown = Math.min(count, rows.length);
+            }
+            showRows(Math.max(detailRowsShown[key] || 0, pageSize));
+            if (shown >= rows.length) return;
+            
+            const more = document.createElement('button');
+            more.type = 'button';
+            more.className = 'show-more';
+            function updateLabel() {
+                const hidden = rows.length - shown;
+                more.textContent = 'Show ' + Math.min(pageSize, hidden) + ' more (' + hidden + ' hidden)';
+            }
+            more.addEventListener('click', () => {
+                showRows(shown + pageSize);
+                detailRowsShown[key] = shown;
+                if (shown >= rows.length) {
+                    more.remove();
+                } else {
+                    updateLabel();
+                }
+            });
+            updateLabel();
+            section.appendChild(more);
         }
         
-        async function fetchWorkers() {
+        function renderWorkerDetails(data) {
             try {
-                const response = await fetch('/monitor/workers');
-                const data = await response.json();
-                
                 if (data.error) {
-                    document.getElementById('workers-container').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
-                    document.getElementById('error-container').innerHTML = '';
+                    showDetailsError('Error: ' + data.error);
                     return;
                 }
                 
-                if (data.workers.length === 0) {
-                    document.getElementById('workers-container').innerHTML = 
-                        '<div class="loading">No workers found. Make sure Gunicorn is running.</div>';
-                    document.getElementById('error-container').innerHTML = '';
-                    return;
+                // Sections are built off-document and swapped in with one DOM write
+                const fragment = document.createDocumentFragment();
+                
+                // Overview Section
+                const logsLink = document.createElement('a');
+                logsLink.href = '/monitor/worker/' + data.pid + '/logs/page';
+                logsLink.style.cssText = 'color: #2c3e50; text-decoration: none; font-weight: 600;';
+                logsLink.textContent = 'View Logs →';
+                const overview = detailSection('Overview');
+                appendDetailGrid(overview, [
+                    ['PID', data.pid],
+                    ['Name', data.name || 'N/A'],
+                    ['Status', data.status || 'N/A'],
+                    ['Uptime', formatUptime(data.uptime_seconds || 0)],
+                    ['CPU %', (data.cpu_percent || 0).toFixed(2) + '%'],
+                    ['Threads', data.num_threads || 0],
+                    ['Logs', logsLink]
+                ]);
+                fragment.appendChild(overview);
+                
+                // Memory Section
+                if (data.memory) {
+                    const items = [
+                        ['RSS', data.memory.rss_mb.toFixed(2) + ' MB'],
+                        ['VMS', data.memory.vms_mb.toFixed(2) + ' MB']
+                    ];
+                    if (data.memory.shared_mb !== undefined) {
+                        items.push(['Shared', data.memory.shared_mb.toFixed(2) + ' MB']);
+                    }
+                    const memory = detailSection('Memory');
+                    appendDetailGrid(memory, items);
+                    fragment.appendChild(memory);
                 }
                 
-                let html = '<table><thead><tr>';
-                html += '<th>PID</th>';
-                html += '<th>CPU %</th>';
-                html += '<th>Memory</th>';
-                html += '<th>Uptime</th>';
-                html += '<th>Status</th>';
-                html += '</tr></thead><tbody>';
+                // Children Section
+                if (data.children && data.children.length > 0) {
+                    const children = detailSection('Child Processes (' + data.children.length + ')');
+                    appendDetailTable(children, 'children', ['PID', 'Name', 'Status'],
+                        data.children.map(child => [child.pid, child.name, child.status]), 50);
+                    fragment.appendChild(children);
+                }
                 
-                data.workers.forEach(worker => {
-                    html += '<tr>';
-                    html += '<td><a href="/monitor/worker/' + worker.pid + '/page" class="worker-link">' + worker.pid + '</a></td>';
-                    html += '<td>' + worker.cpu_percent.toFixed(2) + '%</td>';
-                    html += '<td>' + formatMemory(worker.memory_mb) + '</td>';
-                    html += '<td class="uptime">' + formatUptime(worker.uptime_seconds) + '</td>';
-                    html += '<td><span class="status-badge status-' + worker.status + '">' + worker.status + '</span></td>';
-                    html += '</tr>';
-                });
+                // Threads Section
+                if (data.threads && data.threads.length > 0) {
+                    const threads = detailSection('Threads (' + data.threads.length + ')');
+                    appendDetailTable(threads, 'threads', ['Thread ID', 'User Time', 'System Time'],
+                        data.threads.map(thread => [
+                            thread.id, thread.user_time.toFixed(2) + 's', thread.system_time.toFixed(2) + 's'
+                        ]), 20);
+                    fragment.appendChild(threads);
+                }
                 
-                html += '</tbody></table>';
-                html += '<div style="margin-top: 10px; color: #666; font-size: 12px;">';
-                html += 'Master PID: ' + (data.master_pid || 'N/A') + ' | Total Workers: ' + data.total_workers;
-                html += '</div>';
+                // Connections Section
+                if (data.connections && data.connections.length > 0) {
+                    const total = data.num_connections || data.connections.length;
+                    const connections = detailSection('Network Connections (' + total + ')');
+                    appendDetailTable(connections, 'connections', ['Local Address', 'Remote Address', 'Status', 'Type'],
+                        data.connections.map(conn => [
+                            conn.laddr || 'N/A', conn.raddr || 'N/A', conn.status || 'N/A', conn.type || 'N/A'
+                        ]), 50);
+                    if (data.connections_truncated) {
+                        // The server lists at most the first 50 connections
+                        const note = document.createElement('div');
+                        note.className = 'list-note';
+                        note.textContent = 'Showing the first ' + data.connections.length + ' of ' + total + ' connections';
+                        connections.appendChild(note);
+                    }
+                    fragment.appendChild(connections);
+                }
                 
-                document.getElementById('workers-container').innerHTML = html;
-                document.getElementById('error-container').innerHTML = '';
+                // I/O Section
+                if (data.io) {
+                    const io = detailSection('I/O Statistics');
+                    appendDetailGrid(io, [
+                        ['Read Count', numberFormat.format(data.io.read_count)],
+                        ['Write Count', numberFormat.format(data.io.write_count)],
+                        ['Read Bytes', data.io.read_bytes_mb.toFixed(2) + ' MB'],
+                        ['Write Bytes', data.io.write_bytes_mb.toFixed(2) + ' MB']
+                    ]);
+                    fragment.appendChild(io);
+                }
+                
+                // Command Line Section
+                if (data.cmdline && data.cmdline.length > 0) {
+                    const cmdline = detailSection('Command Line');
+                    const text = document.createElement('div');
+                    text.style.cssText = 'background: #f8f9fa; padding: 15px; border-radius: 4px; font-family: monospace; word-break: break-all;';
+                    text.textContent = data.cmdline.join(' ');
+                    cmdline.appendChild(text);
+                    fragment.appendChild(cmdline);
+                }
+                
+                document.getElementById('worker-details').replaceChildren(fragment);
             } catch (error) {
-                document.getElementById('workers-container').innerHTML = 
-                    '<div class="error">Error fetching workers: ' + error.message + '</div>';
-                document.getElementById('error-container').innerHTML = '';
+                showDetailsError('Error rendering worker details: ' + error.message);
             }
         }
         
-        async function fetchSystemMetrics() {
+        // One request carries both the system metrics and the worker details
+        let workerUpdated = null;
+        async function refresh(signal) {
             try {
-                const response = await fetch('/monitor/stats');
+                const response = await fetch('/monitor/worker/' + document.body.dataset.pid + '/bundle', { signal });
                 const data = await response.json();
                 
-                if (data.system) {
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
+                updateSystemMetrics(data);
+                // The server refreshes worker details every 5 seconds; re-render only then
+                if (data.worker_updated !== workerUpdated) {
+                    workerUpdated = data.worker_updated;
+                    renderWorkerDetails(data.worker);
                 }
             } catch (error) {
-                // Silently fail - don't break the page if system metrics fail
+                showDetailsError('Error loading worker details: ' + error.message);
             }
         }
         
-        // Initial load
-        fetchSystemMetrics();
-        fetchWorkers();
-        
-        // Auto-refresh system metrics every 0.5 seconds (matching dashboard)
-        setInterval(() => {
-            fetchSystemMetrics();
-        }, 500);
-        
-        // Auto-refresh workers every 5 seconds
-        setInterval(() => {
-            fetchWorkers();
-        }, 5000);
-    </script>
+        // Load on page load, then refresh every 0.5 seconds (matching dashboard)
+        startPolling(refresh, 500);
+"""
+_WORKER_DETAIL_PAGE_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Worker {pid} Details - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
+    <link rel="stylesheet" href="{css_url}">
+    <script src="{common_js_url}" defer></script>
+    <script src="{js_url}" defer></script>
+</head>
+<body data-pid="{pid}">
+    <div class="container">
+        <nav class="nav-menu">
+            <ul>
+                <li><a href="/monitor/dashboard/page">Dashboard</a></li>
+                <li><a href="/monitor/health/page">Health</a></li>
+                <li><a href="/monitor/logs/page">Logs</a></li>
+            </ul>
+        </nav>
+        
+        {system_metrics_html}
+        
+        <a href="/monitor/dashboard/page" class="back-link">← Back to Dashboard</a>
+        
+        <div id="worker-details" class="loading">Loading worker details...</div>
+    </div>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+""".format(
+    pid="__PID__",
+    common_css_url=COMMON_CSS_URL,
+    common_js_url=COMMON_JS_URL,
+    system_metrics_html=_SYSTEM_METRICS_HTML,
+    css_url=_register_static_asset("worker-detail.css", _WORKER_DETAIL_CSS),
+    js_url=_register_static_asset("worker-detail.js", _WORKER_DETAIL_JS)
+)
+_WORKER_DETAIL_PAGE_PARTS = _page_template_parts(_WORKER_DETAIL_PAGE_HTML, "__PID__")
 
 
-@router.get("/stats/page", response_class=HTMLResponse)
-async def get_stats_page(username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing request statistics."""
-    html_content = """
+@functools.lru_cache(maxsize=WORKER_DETAIL_PAGE_CACHE_SIZE)
+def _worker_detail_page(pid: int) -> _PageBodies:
+    """Render and compress the worker detail page for a PID (cached per PID)."""
+    return _build_page_bodies(str(pid).encode("utf-8").join(_WORKER_DETAIL_PAGE_PARTS))
+
+
+@router.get("/worker/{pid}/page", response_class=HTMLResponse)
+async def get_worker_detail_page(pid: int, request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing detailed worker process information."""
+    return _page_response(request, _worker_detail_page(pid))
+
+
+_WORKERS_PAGE_HTML = _with_common_parts("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Stats - Gunicorn Monitor</title>
+    <title>Workers - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
     <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .nav-menu {
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        .nav-menu ul {
-            list-style: none;
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }
-        .nav-menu li {
-            margin: 0;
-        }
-        .nav-menu a {
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }
-        .nav-menu a:hover {
-            background-color: #f0f0f0;
-        }
-        .nav-menu a.active {
-            background-color: #2c3e50;
-            color: white;
-        }
-        .system-metrics {
+        .workers-section {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
         }
-        .system-metrics h2 {
+        .workers-section h2 {
+            margin-bottom: 20px;
             color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
         }
-        .metrics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
+        table {
+            width: 100%;
+            border-collapse: collapse;
         }
-        .metric-item {
-            padding: 15px;
+        th {
+            text-align: left;
+            padding: 12px;
             background: #f8f9fa;
-            border-radius: 4px;
-        }
-        .metric-label {
-            font-size: 12px;
             color: #666;
+            font-weight: 600;
+            font-size: 12px;
             text-transform: uppercase;
-            margin-bottom: 8px;
-        }
-        .metric-value {
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
+            border-bottom: 2px solid #e0e0e0;
         }
-        .progress-fill {
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.3s ease;
+        td {
+            padding: 12px;
+            border-bottom: 1px solid #e0e0e0;
         }
-        .progress-fill.warning {
-            background: #ff9800;
+        tr:hover {
+            background: #f8f9fa;
         }
-        .progress-fill.danger {
-            background: #f44336;
+        .status-badge {
+            display: inline-block;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 11px;
+            font-weight: 600;
+            text-transform: uppercase;
         }
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
+        .status-running {
+            background: #d4edda;
+            color: #155724;
         }
-        .stat-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        .status-idle {
+            background: #fff3cd;
+            color: #856404;
         }
-        .stat-label {
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 8px;
+        .status-dead {
+            background: #f8d7da;
+            color: #721c24;
         }
-        .stat-value {
-            font-size: 28px;
-            font-weight: bold;
+        .worker-link {
             color: #2c3e50;
+            text-decoration: none;
+            font-weight: 600;
         }
-        .stat-unit {
-            font-size: 14px;
-            color: #999;
-            font-weight: normal;
+        .worker-link:hover {
+            text-decoration: underline;
         }
-        .loading {
-            text-align: center;
-            padding: 40px;
+        .uptime {
             color: #666;
-        }
-        .error {
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 20px;
+            font-size: 12px;
         }
     </style>
 </head>
@@ -3108,263 +4246,269 @@ async def get_stats_page(username: str = Depends(verify_dashboard_credentials)):
             </ul>
         </nav>
         
-        <div id="error-container"></div>
-        
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Disk Usage</div>
-                    <div class="metric-value" id="disk-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
+        {system_metrics_html}
         
-        <div class="stats-grid" id="stats-grid">
-            <div class="stat-card">
-                <div class="stat-label">Total Requests</div>
-                <div class="stat-value" id="total-requests">-</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Requests/Min</div>
-                <div class="stat-value" id="requests-per-minute">-</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Avg Response Time</div>
-                <div class="stat-value" id="avg-response-time">-<span class="stat-unit"> ms</span></div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Error Rate</div>
-                <div class="stat-value" id="error-rate">-<span class="stat-unit">%</span></div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Active Workers</div>
-                <div class="stat-value" id="active-workers">-</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Uptime</div>
-                <div class="stat-value" id="uptime">-</div>
-            </div>
+        <div class="workers-section">
+            <h2>Worker Processes</h2>
+            <div id="error-container"></div>
+            <div id="workers-container" class="loading">Loading workers...</div>
         </div>
     </div>
     
+    <script src="{common_js_url}"></script>
     <script>
-        function formatUptime(seconds) {
-            const days = Math.floor(seconds / 86400);
-            const hours = Math.floor((seconds % 86400) / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            const secs = seconds % 60;
+        // Table shell and prototype row are built once; refreshes only swap the tbody
+        let workersTable = null;
+        
+        function showWorkersMessage(className, message) {
+            const div = document.createElement('div');
+            div.className = className;
+            div.textContent = message;
+            workersTable = null;
+            document.getElementById('workers-container').replaceChildren(div);
+            document.getElementById('error-container').innerHTML = '';
+        }
+        
+        function ensureWorkersTable() {
+            if (workersTable) return workersTable;
             
-            if (days > 0) return `${days}d ${hours}h ${minutes}m`;
-            if (hours > 0) return `${hours}h ${minutes}m`;
-            if (minutes > 0) return `${minutes}m ${secs}s`;
-            return `${secs}s`;
+            const table = document.createElement('table');
+            const headRow = table.createTHead().insertRow();
+            ['PID', 'CPU %', 'Memory', 'Uptime', 'Status'].forEach(label => {
+                const th = document.createElement('th');
+                th.textContent = label;
+                headRow.appendChild(th);
+            });
+            const tbody = table.createTBody();
+            
+            const rowTemplate = document.createElement('tr');
+            const pidCell = document.createElement('td');
+            const link = document.createElement('a');
+            link.className = 'worker-link';
+            pidCell.appendChild(link);
+            rowTemplate.appendChild(pidCell);
+            rowTemplate.appendChild(document.createElement('td'));
+            rowTemplate.appendChild(document.createElement('td'));
+            const uptimeCell = document.createElement('td');
+            uptimeCell.className = 'uptime';
+            rowTemplate.appendChild(uptimeCell);
+            const statusCell = document.createElement('td');
+            statusCell.appendChild(document.createElement('span'));
+            rowTemplate.appendChild(statusCell);
+            
+            const footer = document.createElement('div');
+            footer.style.cssText = 'margin-top: 10px; color: #666; font-size: 12px;';
+            
+            document.getElementById('workers-container').replaceChildren(table, footer);
+            workersTable = { tbody, rowTemplate, footer };
+            return workersTable;
         }
         
-        async function fetchStats() {
+        async function fetchWorkers(signal) {
             try {
-                const response = await fetch('/monitor/stats');
+                const response = await fetch('/monitor/workers', { signal });
                 const data = await response.json();
                 
                 if (data.error) {
-                    document.getElementById('error-container').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
+                    showWorkersMessage('error', 'Error: ' + data.error);
                     return;
                 }
                 
-                document.getElementById('total-requests').textContent = data.total_requests.toLocaleString();
-                document.getElementById('requests-per-minute').textContent = data.requests_per_minute;
-                document.getElementById('avg-response-time').innerHTML = 
-                    data.average_response_time_ms.toFixed(2) + '<span class="stat-unit"> ms</span>';
-                document.getElementById('error-rate').innerHTML = 
-                    (data.error_rate * 100).toFixed(2) + '<span class="stat-unit">%</span>';
-                document.getElementById('active-workers').textContent = data.active_workers;
-                document.getElementById('uptime').textContent = formatUptime(data.uptime_seconds);
-                
-                // Update system metrics
-                if (data.system) {
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
+                if (data.workers.length === 0) {
+                    showWorkersMessage('loading', 'No workers found. Make sure Gunicorn is running.');
+                    return;
                 }
                 
+                const { tbody, rowTemplate, footer } = ensureWorkersTable();
+                const fragment = document.createDocumentFragment();
+                
+                data.workers.forEach(worker => {
+                    const tr = rowTemplate.cloneNode(true);
+                    const cells = tr.children;
+                    const link = cells[0].firstChild;
+                    link.href = '/monitor/worker/' + worker.pid + '/page';
+                    link.textContent = worker.pid;
+                    cells[1].textContent = worker.cpu_percent.toFixed(2) + '%';
+                    cells[2].textContent = formatMemory(worker.memory_mb);
+                    cells[3].textContent = formatUptime(worker.uptime_seconds);
+                    const badge = cells[4].firstChild;
+                    badge.className = 'status-badge status-' + worker.status;
+                    badge.textContent = worker.status;
+                    fragment.appendChild(tr);
+                });
+                
+                tbody.replaceChildren(fragment);
+                footer.textContent = 'Master PID: ' + (data.master_pid || 'N/A') + ' | Total Workers: ' + data.total_workers;
                 document.getElementById('error-container').innerHTML = '';
             } catch (error) {
-                document.getElementById('error-container').innerHTML = 
-                    '<div class="error">Error fetching stats: ' + error.message + '</div>';
+                showWorkersMessage('error', 'Error fetching workers: ' + error.message);
             }
         }
         
-        // Initial load
-        fetchStats();
+        // System metrics are pushed over the stats stream (polled every 0.5 seconds without EventSource)
+        startStream('/monitor/stats', updateSystemMetrics, 500);
         
-        // Auto-refresh every 0.5 seconds (matching dashboard)
-        setInterval(fetchStats, 500);
+        // Load now, then auto-refresh workers every 5 seconds
+        startPolling(fetchWorkers, 5000);
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+""")
+_WORKERS_PAGE = _precompress_page(_WORKERS_PAGE_HTML)
 
 
-@router.get("/health/page", response_class=HTMLResponse)
-async def get_health_page(username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing system health."""
-    html_content = """
+@router.get("/workers/page", response_class=HTMLResponse)
+async def get_workers_page(request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing worker processes."""
+    return _page_response(request, _WORKERS_PAGE)
+
+
+_STATS_PAGE_HTML = _with_common_parts("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Health - Gunicorn Monitor</title>
+    <title>Stats - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
     <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .nav-menu {
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
+        .progress-fill {
+            transition: width 0.3s ease;
         }
-        .nav-menu ul {
-            list-style: none;
-            display: flex;
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }
-        .nav-menu li {
-            margin: 0;
-        }
-        .nav-menu a {
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }
-        .nav-menu a:hover {
-            background-color: #f0f0f0;
-        }
-        .nav-menu a.active {
-            background-color: #2c3e50;
-            color: white;
         }
-        .system-metrics {
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        .system-metrics h2 {
-            color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
-        }
-        .metrics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-        }
-        .metric-item {
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 4px;
         }
-        .metric-label {
+        .stat-label {
             font-size: 12px;
             color: #666;
             text-transform: uppercase;
             margin-bottom: 8px;
         }
-        .metric-value {
-            font-size: 24px;
+        .stat-value {
+            font-size: 28px;
             font-weight: bold;
             color: #2c3e50;
-            margin-bottom: 5px;
-        }
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
-        }
-        .progress-fill {
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.9s ease;
         }
-        .progress-fill.warning {
-            background: #ff9800;
+        .stat-unit {
+            font-size: 14px;
+            color: #999;
+            font-weight: normal;
         }
-        .progress-fill.danger {
-            background: #f44336;
+    </style>
+</head>
+<body>
+    <div class="container">
+        <nav class="nav-menu">
+            <ul>
+                <li><a href="/monitor/dashboard/page">Dashboard</a></li>
+                <li><a href="/monitor/health/page">Health</a></li>
+                <li><a href="/monitor/logs/page">Logs</a></li>
+            </ul>
+        </nav>
+        
+        <div id="error-container"></div>
+        
+        {system_metrics_html}
+        
+        <div class="stats-grid" id="stats-grid">
+            <div class="stat-card">
+                <div class="stat-label">Total Requests</div>
+                <div class="stat-value" id="total-requests">-</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Requests/Min</div>
+                <div class="stat-value" id="requests-per-minute">-</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Avg Response Time</div>
+                <div class="stat-value" id="avg-response-time">-<span class="stat-unit"> ms</span></div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Error Rate</div>
+                <div class="stat-value" id="error-rate">-<span class="stat-unit">%</span></div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Active Workers</div>
+                <div class="stat-value" id="active-workers">-</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Uptime</div>
+                <div class="stat-value" id="uptime">-</div>
+            </div>
+        </div>
+    </div>
+    
+    <script src="{common_js_url}"></script>
+    <script>
+        const statsEls = {
+            totalRequests: document.getElementById('total-requests'),
+            requestsPerMinute: document.getElementById('requests-per-minute'),
+            avgResponseTime: valueNode('avg-response-time'),
+            errorRate: valueNode('error-rate'),
+            activeWorkers: document.getElementById('active-workers'),
+            uptime: document.getElementById('uptime'),
+            errorContainer: document.getElementById('error-container')
+        };
+        
+        function showStatsError(message) {
+            statsEls.errorContainer.innerHTML = '<div class="error">' + escapeHtml(message) + '</div>';
+        }
+        
+        function renderStats(data) {
+            const els = statsEls;
+            try {
+                if (data.error) {
+                    showStatsError('Error: ' + data.error);
+                    return;
+                }
+                
+                setText(els.totalRequests, numberFormat.format(data.total_requests));
+                setText(els.requestsPerMinute, data.requests_per_minute);
+                setText(els.avgResponseTime, data.average_response_time_ms.toFixed(2));
+                setText(els.errorRate, (data.error_rate * 100).toFixed(2));
+                setText(els.activeWorkers, data.active_workers);
+                setText(els.uptime, formatUptime(data.uptime_seconds));
+                
+                updateSystemMetrics(data);
+                
+                if (els.errorContainer.firstChild) els.errorContainer.textContent = '';
+            } catch (error) {
+                showStatsError('Error rendering stats: ' + error.message);
+            }
         }
+        
+        // Stats are pushed over the stats stream (polled every 0.5 seconds without EventSource)
+        startStream('/monitor/stats', renderStats, 500);
+    </script>
+</body>
+</html>
+""")
+_STATS_PAGE = _precompress_page(_STATS_PAGE_HTML)
+
+
+@router.get("/stats/page", response_class=HTMLResponse)
+async def get_stats_page(request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing request statistics."""
+    return _page_response(request, _STATS_PAGE)
+
+
+_HEALTH_PAGE_HTML = _with_common_parts("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Health - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
+    <style>
         .health-section {
             background: white;
             padding: 20px;
@@ -3448,299 +4592,167 @@ async def get_health_page(username: str = Depends(verify_dashboard_credentials))
             background: #f8d7da;
             color: #721c24;
         }
-        .loading {
-            text-align: center;
-            padding: 40px;
-            color: #666;
-        }
-        .error {
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 20px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <nav class="nav-menu">
-            <ul>
-                <li><a href="/monitor/dashboard/page">Dashboard</a></li>
-                <li><a href="/monitor/health/page" class="active">Health</a></li>
-                <li><a href="/monitor/logs/page">Logs</a></li>
-            </ul>
-        </nav>
-        
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-            </div>
-        </div>
-        
-        <div id="error-container"></div>
-        <div id="health-container" class="loading">Loading health status...</div>
-    </div>
-    
-    <script>
-        async function fetchHealth() {
-            try {
-                const response = await fetch('/monitor/health');
-                const data = await response.json();
-                
-                if (data.error) {
-                    document.getElementById('health-container').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
-                    document.getElementById('error-container').innerHTML = '';
-                    return;
-                }
-                
-                let html = '';
-                
-                // Overall status banner
-                const statusClass = data.status === 'healthy' ? 'healthy' : 
-                                   data.status === 'degraded' ? 'degraded' : 'unhealthy';
-                html += '<div class="status-banner ' + statusClass + '">';
-                html += '<h1>System Status: ' + data.status.toUpperCase() + '</h1>';
-                html += '<div>Last updated: ' + new Date(data.timestamp).toLocaleString() + '</div>';
-                html += '</div>';
-                
-                // Health details
-                html += '<div class="health-grid">';
-                
-                // Database health
-                html += '<div class="health-card">';
-                html += '<h3>Database</h3>';
-                html += '<div class="health-item">';
-                html += '<span class="health-label">Status:</span>';
-                html += '<span class="health-value">';
-                html += '<span class="status-badge status-' + (data.database.status === 'healthy' ? 'healthy' : 'unhealthy') + '">';
-                html += data.database.status;
-                html += '</span></span></div>';
-                html += '<div class="health-item">';
-                html += '<span class="health-label">Connected:</span>';
-                html += '<span class="health-value">' + (data.database.connected ? 'Yes' : 'No') + '</span>';
-                html += '</div>';
-                html += '</div>';
-                
-                // Workers health
-                html += '<div class="health-card">';
-                html += '<h3>Workers</h3>';
-                html += '<div class="health-item">';
-                html += '<span class="health-label">Status:</span>';
-                html += '<span class="health-value">';
-                html += '<span class="status-badge status-' + (data.workers.status === 'healthy' ? 'healthy' : 'unhealthy') + '">';
-                html += data.workers.status;
-                html += '</span></span></div>';
-                html += '<div class="health-item">';
-                html += '<span class="health-label">Count:</span>';
-                html += '<span class="health-value">' + data.workers.count + '</span>';
-                html += '</div>';
-                html += '<div class="health-item">';
-                html += '<span class="health-label">Master PID:</span>';
-                html += '<span class="health-value">' + (data.workers.master_pid || 'N/A') + '</span>';
-                html += '</div>';
-                html += '</div>';
-                
-                html += '</div>';
-                
-                document.getElementById('health-container').innerHTML = html;
-                document.getElementById('error-container').innerHTML = '';
-            } catch (error) {
-                document.getElementById('health-container').innerHTML = 
-                    '<div class="error">Error fetching health: ' + error.message + '</div>';
-                document.getElementById('error-container').innerHTML = '';
-            }
-        }
-        
-        async function fetchSystemMetrics() {
-            try {
-                const response = await fetch('/monitor/stats');
-                const data = await response.json();
-                
-                if (data.system) {
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
-                }
-            } catch (error) {
-                // Silently fail - don't break the page if system metrics fail
-            }
-        }
-        
-        // Initial load
-        fetchSystemMetrics();
-        fetchHealth();
-        
-        // Auto-refresh system metrics every 0.5 seconds (matching dashboard)
-        setInterval(() => {
-            fetchSystemMetrics();
-        }, 500);
-        
-        // Auto-refresh health every 5 seconds
-        setInterval(() => {
-            fetchHealth();
-        }, 5000);
-    </script>
-</body>
-</html>
-    """
-    return HTMLResponse(content=html_content)
-
-
-@router.get("/logs/page", response_class=HTMLResponse)
-async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing application logs."""
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Logs - Gunicorn Monitor</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, monospace;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1600px;
-            margin: 0 auto;
-        }
-        .nav-menu {
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        .nav-menu ul {
-            list-style: none;
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }
-        .nav-menu li {
-            margin: 0;
-        }
-        .nav-menu a {
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }
-        .nav-menu a:hover {
-            background-color: #f0f0f0;
-        }
-        .nav-menu a.active {
-            background-color: #2c3e50;
-            color: white;
-        }
-        .system-metrics {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        .system-metrics h2 {
-            color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
-        }
-        .metrics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-        }
-        .metric-item {
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }
-        .metric-label {
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 8px;
-        }
-        .metric-value {
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
-        }
-        .progress-fill {
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.9s ease;
+    </style>
+</head>
+<body>
+    <div class="container">
+        <nav class="nav-menu">
+            <ul>
+                <li><a href="/monitor/dashboard/page">Dashboard</a></li>
+                <li><a href="/monitor/health/page" class="active">Health</a></li>
+                <li><a href="/monitor/logs/page">Logs</a></li>
+            </ul>
+        </nav>
+        
+        {system_metrics_html}
+        
+        <div id="error-container"></div>
+        <div id="health-container" class="loading">Loading health status...</div>
+    </div>
+    
+    <script src="{common_js_url}"></script>
+    <script>
+        // Built once; toLocaleString() sets up a new formatter on every call
+        // (these options are Date.prototype.toLocaleString's defaults)
+        const dateTimeFormat = new Intl.DateTimeFormat(undefined, {
+            year: 'numeric', month: 'numeric', day: 'numeric',
+            hour: 'numeric', minute: 'numeric', second: 'numeric'
+        });
+        
+        // The panel is built once; refreshes only change text and classes in place
+        let healthEls = null;
+        
+        function showHealthError(message) {
+            const div = document.createElement('div');
+            div.className = 'error';
+            div.textContent = message;
+            healthEls = null;
+            document.getElementById('health-container').replaceChildren(div);
+            document.getElementById('error-container').innerHTML = '';
+        }
+        
+        function setClassName(node, className) {
+            if (node.className !== className) node.className = className;
+        }
+        
+        function appendHealthCard(grid, title) {
+            const card = document.createElement('div');
+            card.className = 'health-card';
+            const heading = document.createElement('h3');
+            heading.textContent = title;
+            card.appendChild(heading);
+            grid.appendChild(card);
+            return card;
+        }
+        
+        // Append a label/value row to a card and return its value element
+        function appendHealthItem(card, label, valueNode) {
+            const item = document.createElement('div');
+            item.className = 'health-item';
+            const labelSpan = document.createElement('span');
+            labelSpan.className = 'health-label';
+            labelSpan.textContent = label;
+            item.appendChild(labelSpan);
+            const value = document.createElement('span');
+            value.className = 'health-value';
+            if (valueNode) value.appendChild(valueNode);
+            item.appendChild(value);
+            card.appendChild(item);
+            return valueNode || value;
+        }
+        
+        function ensureHealthPanel() {
+            if (healthEls) return healthEls;
+            
+            const banner = document.createElement('div');
+            const status = document.createElement('h1');
+            const updated = document.createElement('div');
+            banner.appendChild(status);
+            banner.appendChild(updated);
+            
+            const grid = document.createElement('div');
+            grid.className = 'health-grid';
+            const database = appendHealthCard(grid, 'Database');
+            const workers = appendHealthCard(grid, 'Workers');
+            
+            healthEls = {
+                banner: banner,
+                status: status,
+                updated: updated,
+                databaseStatus: appendHealthItem(database, 'Status:', document.createElement('span')),
+                databaseConnected: appendHealthItem(database, 'Connected:'),
+                workersStatus: appendHealthItem(workers, 'Status:', document.createElement('span')),
+                workersCount: appendHealthItem(workers, 'Count:'),
+                masterPid: appendHealthItem(workers, 'Master PID:')
+            };
+            document.getElementById('health-container').replaceChildren(banner, grid);
+            return healthEls;
+        }
+        
+        function renderHealth(data) {
+            const els = ensureHealthPanel();
+            
+            // Overall status banner
+            const statusClass = data.status === 'healthy' ? 'healthy' : 
+                               data.status === 'degraded' ? 'degraded' : 'unhealthy';
+            setClassName(els.banner, 'status-banner ' + statusClass);
+            setText(els.status, 'System Status: ' + data.status.toUpperCase());
+            setText(els.updated, 'Last updated: ' + dateTimeFormat.format(new Date(data.timestamp)));
+            
+            // Database health
+            setClassName(els.databaseStatus, 'status-badge status-' + (data.database.status === 'healthy' ? 'healthy' : 'unhealthy'));
+            setText(els.databaseStatus, data.database.status);
+            setText(els.databaseConnected, data.database.connected ? 'Yes' : 'No');
+            
+            // Workers health
+            setClassName(els.workersStatus, 'status-badge status-' + (data.workers.status === 'healthy' ? 'healthy' : 'unhealthy'));
+            setText(els.workersStatus, data.workers.status);
+            setText(els.workersCount, data.workers.count);
+            setText(els.masterPid, data.workers.master_pid || 'N/A');
         }
-        .progress-fill.warning {
-            background: #ff9800;
+        
+        async function fetchHealth(signal) {
+            try {
+                const response = await fetch('/monitor/health', { signal });
+                const data = await response.json();
+                
+                if (data.error) {
+                    showHealthError('Error: ' + data.error);
+                    return;
+                }
+                
+                renderHealth(data);
+                document.getElementById('error-container').innerHTML = '';
+            } catch (error) {
+                showHealthError('Error fetching health: ' + error.message);
+            }
         }
-        .progress-fill.danger {
-            background: #f44336;
+        
+        // System metrics are pushed over the stats stream (polled every 0.5 seconds without EventSource)
+        startStream('/monitor/stats', updateSystemMetrics, 500);
+        
+        // Load now, then auto-refresh health every 5 seconds
+        startPolling(fetchHealth, 5000);
+    </script>
+</body>
+</html>
+""")
+_HEALTH_PAGE = _precompress_page(_HEALTH_PAGE_HTML)
+
+
+@router.get("/health/page", response_class=HTMLResponse)
+async def get_health_page(request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing system health."""
+    return _page_response(request, _HEALTH_PAGE)
+
+
+# Log viewer styles shared by the logs and worker logs pages
+_LOGS_CSS = """
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, monospace;
+        }
+        .container {
+            max-width: 1600px;
         }
         .logs-controls {
             background: white;
@@ -3840,25 +4852,24 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
         .log-message {
             color: #d4d4d4;
         }
-        .loading {
-            text-align: center;
-            padding: 40px;
-            color: #666;
-        }
-        .error {
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 20px;
-        }
         .auto-scroll {
             margin-left: auto;
         }
         .auto-scroll input {
             margin-right: 5px;
         }
-    </style>
+"""
+LOGS_CSS_URL = _register_static_asset("logs.css", _LOGS_CSS)
+
+_LOGS_PAGE_HTML = _with_common_parts("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Logs - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
+    <link rel="stylesheet" href="{logs_css_url}">
 </head>
 <body>
     <div class="container">
@@ -3870,34 +4881,7 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
             </ul>
         </nav>
         
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Disk Usage</div>
-                    <div class="metric-value" id="disk-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
+        {system_metrics_html}
         
         <div class="logs-controls">
             <label>
@@ -3934,8 +4918,11 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
         <div id="logs-container" class="logs-container loading">Loading logs...</div>
     </div>
     
+    <script src="{common_js_url}"></script>
     <script>
-        let autoRefreshInterval = null;
+        let stopAutoRefresh = null;
+        let lastLogsBody = null;  // Response body currently rendered in logs-container
+        let logsRequestSeq = 0;  // Bumped per fetchLogs call; only the latest call may render
         
         async function generateLogHash(timestamp, message, module) {
             // Combine timestamp and message for hash (matching Python implementation)
@@ -3965,10 +4952,10 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
             return `
                 <div class="log-entry">
                     <span class="log-timestamp">
-                        <a href="/monitor/log/${hash}/page" class="log-link">${timestamp}</a>
+                        <a href="/monitor/log/${hash}/page" class="log-link">${escapeHtml(timestamp)}</a>
                     </span>
-                    <span class="log-level ${level}">${level}</span>
-                    ${module ? `<span style="color: #858585;">${module}</span>` : ''}
+                    <span class="log-level ${escapeHtml(level)}">${escapeHtml(level)}</span>
+                    ${module ? `<span style="color: #858585;">${escapeHtml(module)}</span>` : ''}
                     <span class="log-message">${escapeHtml(message)}</span>
                 </div>
             `;
@@ -3992,10 +4979,10 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
             return `
                 <div class="log-entry" data-hash-input="${escapeHtml(hashInput)}">
                     <span class="log-timestamp">
-                        <a href="#" class="log-link" data-timestamp="${escapeHtml(timestamp)}" data-message="${escapeHtml(message)}" data-module="${escapeHtml(log.module || '')}" onclick="event.preventDefault(); handleLogClick(this); return false;">${timestamp}</a>
+                        <a href="#" class="log-link" data-timestamp="${escapeHtml(timestamp)}" data-message="${escapeHtml(message)}" data-module="${escapeHtml(log.module || '')}" onclick="event.preventDefault(); handleLogClick(this); return false;">${escapeHtml(timestamp)}</a>
                     </span>
-                    <span class="log-level ${level}">${level}</span>
-                    ${module ? `<span style="color: #858585;">${module}</span>` : ''}
+                    <span class="log-level ${escapeHtml(level)}">${escapeHtml(level)}</span>
+                    ${module ? `<span style="color: #858585;">${escapeHtml(module)}</span>` : ''}
                     <span class="log-message">
                         <a href="#" class="log-link" data-timestamp="${escapeHtml(timestamp)}" data-message="${escapeHtml(message)}" data-module="${escapeHtml(log.module || '')}" onclick="event.preventDefault(); handleLogClick(this); return false;">${escapeHtml(message)}</a>
                     </span>
@@ -4012,13 +4999,8 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
             window.location.href = '/monitor/log/' + hash + '/page';
         }
         
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
-        
-        async function fetchLogs() {
+        async function fetchLogs(signal) {
+            const request = ++logsRequestSeq;
             try {
                 const limit = document.getElementById('limit-select').value;
                 const level = document.getElementById('level-select').value;
@@ -4026,7 +5008,8 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
                 if (level) params.append('level', level);
                 
                 const response = await fetch('/monitor/logs?' + params, {
-                    credentials: 'same-origin'
+                    credentials: 'same-origin',
+                    signal
                 });
                 
                 if (!response.ok) {
@@ -4038,16 +5021,26 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
                     throw new Error('Server returned non-JSON response. Authentication may have failed.');
                 }
                 
-                const data = await response.json();
+                // Auto-refresh mostly returns the same entries; keep the rendered ones then
+                const body = await response.text();
+                // A manual refresh or filter change started a newer fetch; its result wins
+                if (request !== logsRequestSeq) return;
+                if (body === lastLogsBody) {
+                    document.getElementById('error-container').innerHTML = '';
+                    return;
+                }
+                const data = JSON.parse(body);
                 
                 if (data.error) {
+                    lastLogsBody = body;
                     document.getElementById('logs-container').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
+                        '<div class="error">Error: ' + escapeHtml(data.error) + '</div>';
                     document.getElementById('error-container').innerHTML = '';
                     return;
                 }
                 
                 if (data.logs.length === 0) {
+                    lastLogsBody = body;
                     document.getElementById('logs-container').innerHTML = 
                         '<div class="loading">No logs found</div>';
                     document.getElementById('error-container').innerHTML = '';
@@ -4061,6 +5054,9 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
                 const logHtmls = await Promise.all(logHtmlPromises);
                 const html = logHtmls.join('');
                 
+                // Superseded while the hashes were computed
+                if (request !== logsRequestSeq) return;
+                lastLogsBody = body;
                 document.getElementById('logs-container').innerHTML = html;
                 document.getElementById('error-container').innerHTML = '';
                 
@@ -4070,8 +5066,10 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
                     container.scrollTop = container.scrollHeight;
                 }
             } catch (error) {
+                if (request !== logsRequestSeq) return;
+                lastLogsBody = null;
                 document.getElementById('logs-container').innerHTML = 
-                    '<div class="error">Error fetching logs: ' + error.message + '</div>';
+                    '<div class="error">Error fetching logs: ' + escapeHtml(error.message) + '</div>';
                 document.getElementById('error-container').innerHTML = '';
             }
         }
@@ -4079,263 +5077,120 @@ async def get_logs_page(username: str = Depends(verify_dashboard_credentials)):
         function toggleAutoRefresh() {
             const checkbox = document.getElementById('auto-refresh');
             if (checkbox.checked) {
-                autoRefreshInterval = setInterval(fetchLogs, 5000);
-            } else {
-                if (autoRefreshInterval) {
-                    clearInterval(autoRefreshInterval);
-                    autoRefreshInterval = null;
+                if (!stopAutoRefresh) {
+                    stopAutoRefresh = startPolling(fetchLogs, 5000);
                 }
+            } else if (stopAutoRefresh) {
+                stopAutoRefresh();
+                stopAutoRefresh = null;
             }
         }
         
         document.getElementById('auto-refresh').addEventListener('change', toggleAutoRefresh);
         
-        async function fetchSystemMetrics() {
-            try {
-                const response = await fetch('/monitor/stats');
-                const data = await response.json();
-                
-                if (data.system) {
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
-                }
-            } catch (error) {
-                // Silently fail - don't break the page if system metrics fail
-            }
-        }
-        
         // Initial load
-        fetchSystemMetrics();
         fetchLogs();
         
-        // Auto-refresh system metrics every 0.5 seconds (matching dashboard)
-        setInterval(() => {
-            fetchSystemMetrics();
-        }, 500);
+        // System metrics are pushed over the stats stream (polled every 0.5 seconds without EventSource)
+        startStream('/monitor/stats', updateSystemMetrics, 500);
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+""").replace("{logs_css_url}", LOGS_CSS_URL)
+_LOGS_PAGE = _precompress_page(_LOGS_PAGE_HTML)
 
 
-@router.get("/log/{log_hash}/page", response_class=HTMLResponse)
-async def get_log_detail_page(log_hash: str, username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing detailed log entry information."""
-    
-    html_content = f"""
+@router.get("/logs/page", response_class=HTMLResponse)
+async def get_logs_page(request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing application logs."""
+    return _page_response(request, _LOGS_PAGE)
+
+
+_LOG_DETAIL_PAGE_HTML = _with_common_parts("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Log Details - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
     <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-        .back-link {{
+        .back-link {
             display: inline-block;
             margin-bottom: 20px;
             color: #2c3e50;
             text-decoration: none;
             font-weight: 500;
-        }}
-        .back-link:hover {{
+        }
+        .back-link:hover {
             text-decoration: underline;
-        }}
-        .nav-menu {{
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .nav-menu ul {{
-            list-style: none;
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }}
-        .nav-menu li {{
-            margin: 0;
-        }}
-        .nav-menu a {{
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }}
-        .nav-menu a:hover {{
-            background-color: #f0f0f0;
-        }}
-        .nav-menu a.active {{
-            background-color: #2c3e50;
-            color: white;
-        }}
-        .system-metrics {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .system-metrics h2 {{
-            color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
-        }}
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-        }}
-        .metric-item {{
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }}
-        .metric-label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 8px;
-        }}
-        .metric-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }}
-        .progress-bar {{
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
-        }}
-        .progress-fill {{
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.9s ease;
-        }}
-        .progress-fill.warning {{
-            background: #ff9800;
-        }}
-        .progress-fill.danger {{
-            background: #f44336;
-        }}
-        .detail-section {{
+        }
+        .detail-section {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 20px;
-        }}
-        .detail-section h2 {{
+        }
+        .detail-section h2 {
             color: #2c3e50;
             margin-bottom: 15px;
             font-size: 20px;
-        }}
-        .detail-header {{
+        }
+        .detail-header {
             display: flex;
             align-items: center;
             gap: 15px;
             margin-bottom: 20px;
             padding-bottom: 15px;
             border-bottom: 2px solid #e0e0e0;
-        }}
-        .detail-timestamp {{
+        }
+        .detail-timestamp {
             font-size: 16px;
             color: #666;
             font-family: monospace;
-        }}
-        .level-badge {{
+        }
+        .level-badge {
             display: inline-block;
             padding: 6px 12px;
             border-radius: 4px;
             font-size: 12px;
             font-weight: 600;
             text-transform: uppercase;
-        }}
-        .level-badge.ERROR {{
+        }
+        .level-badge.ERROR {
             background: #f44336;
             color: white;
-        }}
-        .level-badge.WARNING {{
+        }
+        .level-badge.WARNING {
             background: #ff9800;
             color: white;
-        }}
-        .level-badge.INFO {{
+        }
+        .level-badge.INFO {
             background: #2196F3;
             color: white;
-        }}
-        .level-badge.DEBUG {{
+        }
+        .level-badge.DEBUG {
             background: #9e9e9e;
             color: white;
-        }}
-        .detail-item {{
+        }
+        .detail-item {
             margin-bottom: 20px;
-        }}
-        .detail-label {{
+        }
+        .detail-label {
             font-size: 12px;
             color: #666;
             text-transform: uppercase;
             margin-bottom: 8px;
             font-weight: 600;
-        }}
-        .detail-value {{
+        }
+        .detail-value {
             font-size: 14px;
             color: #2c3e50;
             line-height: 1.6;
             word-wrap: break-word;
-        }}
-        .message-box {{
+        }
+        .message-box {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 4px;
@@ -4343,8 +5198,8 @@ async def get_log_detail_page(log_hash: str, username: str = Depends(verify_dash
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, monospace;
             white-space: pre-wrap;
             word-wrap: break-word;
-        }}
-        .traceback-box {{
+        }
+        .traceback-box {
             background: #1e1e1e;
             color: #d4d4d4;
             padding: 20px;
@@ -4355,41 +5210,29 @@ async def get_log_detail_page(log_hash: str, username: str = Depends(verify_dash
             white-space: pre-wrap;
             word-wrap: break-word;
             overflow-x: auto;
-        }}
-        .metadata-grid {{
+        }
+        .metadata-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
-        }}
-        .metadata-item {{
+        }
+        .metadata-item {
             padding: 10px;
             background: #f8f9fa;
             border-radius: 4px;
-        }}
-        .metadata-label {{
+        }
+        .metadata-label {
             font-size: 11px;
             color: #666;
             text-transform: uppercase;
             margin-bottom: 5px;
-        }}
-        .metadata-value {{
+        }
+        .metadata-value {
             font-size: 14px;
             font-weight: 600;
             color: #2c3e50;
-        }}
-        .loading {{
-            text-align: center;
-            padding: 40px;
-            color: #666;
-        }}
-        .error {{
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 20px;
-        }}
-        .copy-button {{
+        }
+        .copy-button {
             padding: 6px 12px;
             background: #2c3e50;
             color: white;
@@ -4398,10 +5241,10 @@ async def get_log_detail_page(log_hash: str, username: str = Depends(verify_dash
             cursor: pointer;
             font-size: 12px;
             margin-top: 10px;
-        }}
-        .copy-button:hover {{
+        }
+        .copy-button:hover {
             background: #34495e;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -4414,72 +5257,47 @@ async def get_log_detail_page(log_hash: str, username: str = Depends(verify_dash
             </ul>
         </nav>
         
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Disk Usage</div>
-                    <div class="metric-value" id="disk-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
+        {system_metrics_html}
         
         <a href="/monitor/logs/page" class="back-link">← Back to Logs</a>
         
         <div id="log-details" class="loading">Loading log details...</div>
     </div>
     
+    <script src="{common_js_url}"></script>
     <script>
-        async function loadLogDetails() {{
-            try {{
-                const response = await fetch('/monitor/log/{log_hash}');
+        async function loadLogDetails() {
+            try {
+                const response = await fetch('/monitor/log/__LOG_HASH__');
                 
-                if (!response.ok) {{
-                    throw new Error(`HTTP ${{response.status}}: ${{response.statusText}}`);
-                }}
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                }
                 
                 const contentType = response.headers.get('content-type');
-                if (!contentType || !contentType.includes('application/json')) {{
+                if (!contentType || !contentType.includes('application/json')) {
                     throw new Error('Server returned non-JSON response. Authentication may have failed.');
-                }}
+                }
                 
                 const data = await response.json();
                 
-                if (data.error) {{
+                if (data.error) {
                     document.getElementById('log-details').innerHTML = 
                         '<div class="error">Error: ' + escapeHtml(data.error) + '</div>';
                     return;
-                }}
+                }
                 
                 let html = '';
                 
                 // Header Section
                 html += '<div class="detail-section">';
                 html += '<div class="detail-header">';
-                html += '<span class="level-badge ' + (data.level || 'INFO') + '">' + (data.level || 'INFO') + '</span>';
-                html += '<span class="detail-timestamp">' + (data.timestamp || 'N/A') + '</span>';
-                if (data.module) {{
-                    html += '<span style="color: #666; font-size: 14px;">[' + data.module + ']</span>';
-                }}
+                const level = escapeHtml(data.level || 'INFO');
+                html += '<span class="level-badge ' + level + '">' + level + '</span>';
+                html += '<span class="detail-timestamp">' + escapeHtml(data.timestamp || 'N/A') + '</span>';
+                if (data.module) {
+                    html += '<span style="color: #666; font-size: 14px;">[' + escapeHtml(data.module) + ']</span>';
+                }
                 html += '</div>';
                 
                 // Message Section
@@ -4496,402 +5314,156 @@ async def get_log_detail_page(log_hash: str, username: str = Depends(verify_dash
                 html += '</div>';
                 
                 // Traceback Section (if exists)
-                if (data.traceback) {{
+                if (data.traceback) {
                     html += '<div class="detail-item">';
                     html += '<div class="detail-label">Traceback</div>';
                     html += '<div class="traceback-box" id="traceback-content">' + escapeHtml(data.traceback) + '</div>';
                     html += '<button class="copy-button" onclick="copyToClipboard(\\'traceback-content\\')">Copy Traceback</button>';
                     html += '</div>';
-                }}
+                }
                 
                 // Metadata Section
-                if (data.metadata && Object.keys(data.metadata).length > 0) {{
+                if (data.metadata && Object.keys(data.metadata).length > 0) {
                     html += '<div class="detail-item">';
                     html += '<div class="detail-label">Metadata</div>';
                     html += '<div class="metadata-grid">';
-                    for (const [key, value] of Object.entries(data.metadata)) {{
+                    for (const [key, value] of Object.entries(data.metadata)) {
                         html += '<div class="metadata-item">';
                         html += '<div class="metadata-label">' + escapeHtml(key) + '</div>';
                         html += '<div class="metadata-value">' + escapeHtml(String(value)) + '</div>';
                         html += '</div>';
-                    }}
+                    }
                     html += '</div>';
                     html += '</div>';
-                }}
+                }
                 
                 // Additional Info
                 html += '<div class="detail-item">';
                 html += '<div class="detail-label">Additional Information</div>';
                 html += '<div class="metadata-grid">';
-                if (data.source) {{
+                if (data.source) {
                     html += '<div class="metadata-item">';
                     html += '<div class="metadata-label">Source</div>';
                     html += '<div class="metadata-value">' + escapeHtml(data.source) + '</div>';
                     html += '</div>';
-                }}
+                }
                 html += '<div class="metadata-item">';
                 html += '<div class="metadata-label">Log Hash</div>';
                 html += '<div class="metadata-value" style="font-family: monospace; font-size: 12px;">' + escapeHtml(data.log_hash || 'N/A') + '</div>';
                 html += '</div>';
                 // Add query string if it exists in metadata
-                if (data.metadata && data.metadata.query_string) {{
+                if (data.metadata && data.metadata.query_string) {
                     html += '<div class="metadata-item">';
                     html += '<div class="metadata-label">Query String</div>';
                     html += '<div class="metadata-value" style="font-family: monospace; font-size: 12px; word-break: break-all;">' + escapeHtml(data.metadata.query_string) + '</div>';
                     html += '</div>';
-                }}
+                }
                 // Add POST variables if they exist in metadata
-                if (data.metadata && data.metadata.post_variables) {{
+                if (data.metadata && data.metadata.post_variables) {
                     html += '<div class="metadata-item" style="grid-column: 1 / -1;">';
                     html += '<div class="metadata-label">POST Variables</div>';
                     const postVars = data.metadata.post_variables;
-                    if (typeof postVars === 'object' && postVars !== null && !Array.isArray(postVars)) {{
+                    if (typeof postVars === 'object' && postVars !== null && !Array.isArray(postVars)) {
                         // Display as formatted key-value list
                         let postVarsHtml = '<div style="font-family: monospace; font-size: 12px; word-break: break-all; line-height: 1.6;">';
-                        for (const [key, value] of Object.entries(postVars)) {{
+                        for (const [key, value] of Object.entries(postVars)) {
                             const displayValue = Array.isArray(value) ? value.join(', ') : String(value);
                             postVarsHtml += '<div style="margin-bottom: 4px;"><strong>' + escapeHtml(String(key)) + ':</strong> ' + escapeHtml(displayValue) + '</div>';
-                        }}
+                        }
                         postVarsHtml += '</div>';
                         html += '<div class="metadata-value">' + postVarsHtml + '</div>';
-                    }} else {{
+                    } else {
                         // Display as string
                         html += '<div class="metadata-value" style="font-family: monospace; font-size: 12px; word-break: break-all;">' + escapeHtml(String(postVars)) + '</div>';
-                    }}
+                    }
                     html += '</div>';
-                }}
+                }
                 html += '</div>';
                 html += '</div>';
                 
                 html += '</div>';
                 
                 document.getElementById('log-details').innerHTML = html;
-            }} catch (error) {{
+            } catch (error) {
                 document.getElementById('log-details').innerHTML = 
                     '<div class="error">Error loading log details: ' + escapeHtml(error.message) + '</div>';
-            }}
-        }}
-        
-        function escapeHtml(text) {{
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }}
+            }
+        }
         
-        function copyToClipboard(elementId) {{
+        function copyToClipboard(elementId) {
             const element = document.getElementById(elementId);
             const text = element.textContent;
-            navigator.clipboard.writeText(text).then(() => {{
+            navigator.clipboard.writeText(text).then(() => {
                 const button = event.target;
                 const originalText = button.textContent;
                 button.textContent = 'Copied!';
-                setTimeout(() => {{
+                setTimeout(() => {
                     button.textContent = originalText;
-                }}, 2000);
-            }}).catch(err => {{
+                }, 2000);
+            }).catch(err => {
                 // Silent error handling
-            }});
-        }}
-        
-        async function fetchSystemMetrics() {{
-            try {{
-                const response = await fetch('/monitor/stats');
-                const data = await response.json();
-                
-                if (data.system) {{
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
-                }}
-            }} catch (error) {{
-                // Silently fail - don't break the page if system metrics fail
-            }}
-        }}
+            });
+        }
         
         // Initial load
-        fetchSystemMetrics();
         loadLogDetails();
         
-        // Auto-refresh system metrics every 0.5 seconds (matching dashboard)
-        setInterval(() => {{
-            fetchSystemMetrics();
-        }}, 500);
+        // System metrics are pushed over the stats stream (polled every 0.5 seconds without EventSource)
+        startStream('/monitor/stats', updateSystemMetrics, 500);
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+""")
+_LOG_DETAIL_PAGE_PARTS = _page_template_parts(_LOG_DETAIL_PAGE_HTML, "__LOG_HASH__")
 
 
-@router.get("/worker/{pid}/logs/page", response_class=HTMLResponse)
-async def get_worker_logs_page(pid: int, username: str = Depends(verify_dashboard_credentials)):
-    """HTML page for viewing worker-specific logs."""
-    html_content = f"""
+@functools.lru_cache(maxsize=LOG_DETAIL_PAGE_CACHE_SIZE)
+def _log_detail_page(log_hash: str) -> _PageBodies:
+    """Render and compress the log detail page for a log hash (cached per hash)."""
+    return _build_page_bodies(log_hash.encode("utf-8").join(_LOG_DETAIL_PAGE_PARTS))
+
+@router.get("/log/{log_hash}/page", response_class=HTMLResponse)
+async def get_log_detail_page(log_hash: str, request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing detailed log entry information."""
+    # Percent-encoded so an arbitrary path value can't break out of the page's script
+    return _page_response(request, _log_detail_page(quote(log_hash, safe="")))
+
+
+_WORKER_LOGS_PAGE_HTML = _with_common_parts("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Worker {pid} Logs - Gunicorn Monitor</title>
+    <title>Worker __PID__ Logs - Gunicorn Monitor</title>
+    <link rel="stylesheet" href="{common_css_url}">
+    <link rel="stylesheet" href="{logs_css_url}">
     <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, monospace;
-            background: #f5f5f5;
-            color: #333;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-        }}
-        .nav-menu {{
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .nav-menu ul {{
-            list-style: none;
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            margin: 0;
-            padding: 0;
-        }}
-        .nav-menu li {{
-            margin: 0;
-        }}
-        .nav-menu a {{
-            color: #2c3e50;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-            display: inline-block;
-        }}
-        .nav-menu a:hover {{
-            background-color: #f0f0f0;
-        }}
-        .nav-menu a.active {{
-            background-color: #2c3e50;
-            color: white;
-        }}
-        .system-metrics {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .system-metrics h2 {{
-            color: #2c3e50;
-            font-size: 18px;
-            margin-bottom: 15px;
-        }}
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-        }}
-        .metric-item {{
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }}
-        .metric-label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            margin-bottom: 8px;
-        }}
-        .metric-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }}
-        .progress-bar {{
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-top: 8px;
-        }}
-        .progress-fill {{
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.9s ease;
-        }}
-        .progress-fill.warning {{
-            background: #ff9800;
-        }}
-        .progress-fill.danger {{
-            background: #f44336;
-        }}
-        .worker-info {{
+        .worker-info {
             background: white;
             padding: 15px 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 20px;
-        }}
-        .worker-info h2 {{
+        }
+        .worker-info h2 {
             color: #2c3e50;
             margin-bottom: 10px;
-        }}
-        .worker-info p {{
+        }
+        .worker-info p {
             color: #666;
             margin: 5px 0;
-        }}
-        .logs-controls {{
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-            display: flex;
-            gap: 15px;
-            align-items: center;
-            flex-wrap: wrap;
-        }}
-        .logs-controls label {{
-            font-size: 14px;
-            color: #666;
-        }}
-        .logs-controls select,
-        .logs-controls input {{
-            padding: 6px 12px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            font-size: 14px;
-        }}
-        .logs-controls button {{
-            padding: 6px 16px;
-            background: #2c3e50;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 14px;
-        }}
-        .logs-controls button:hover {{
-            background: #34495e;
-        }}
-        .logs-container {{
-            background: #1e1e1e;
-            color: #d4d4d4;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            max-height: 80vh;
-            overflow-y: auto;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            line-height: 1.6;
-        }}
-        .log-entry {{
-            padding: 4px 0;
-            border-bottom: 1px solid #333;
-            word-wrap: break-word;
-        }}
-        .log-entry:hover {{
-            background: #2a2a2a;
-        }}
-        .log-timestamp {{
-            color: #858585;
-            margin-right: 10px;
-        }}
-        .log-level {{
-            display: inline-block;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 11px;
-            font-weight: 600;
-            margin-right: 10px;
-            min-width: 60px;
-            text-align: center;
-        }}
-        .log-level.ERROR {{
-            background: #f44336;
-            color: white;
-        }}
-        .log-level.WARNING {{
-            background: #ff9800;
-            color: white;
-        }}
-        .log-level.INFO {{
-            background: #2196F3;
-            color: white;
-        }}
-        .log-level.DEBUG {{
-            background: #9e9e9e;
-            color: white;
-        }}
-        .log-message {{
-            color: #d4d4d4;
-        }}
-        .loading {{
-            text-align: center;
-            padding: 40px;
-            color: #666;
-        }}
-        .error {{
-            background: #f8d7da;
-            color: #721c24;
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 20px;
-        }}
-        .auto-scroll {{
-            margin-left: auto;
-        }}
-        .auto-scroll input {{
-            margin-right: 5px;
-        }}
-        .back-link {{
+        }
+        .back-link {
             display: inline-block;
             color: #2c3e50;
             text-decoration: none;
             margin-bottom: 15px;
             font-weight: 500;
-        }}
-        .back-link:hover {{
+        }
+        .back-link:hover {
             text-decoration: underline;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -4904,39 +5476,12 @@ async def get_worker_logs_page(pid: int, username: str = Depends(verify_dashboar
             </ul>
         </nav>
         
-        <div class="system-metrics" id="system-metrics">
-            <h2>System Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-item">
-                    <div class="metric-label">CPU Usage</div>
-                    <div class="metric-value" id="cpu-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="cpu-progress" style="width: 0%"></div>
-                    </div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Memory Usage</div>
-                    <div class="metric-value" id="memory-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="memory-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="memory-details">-</div>
-                </div>
-                <div class="metric-item">
-                    <div class="metric-label">Disk Usage</div>
-                    <div class="metric-value" id="disk-percent">-</div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" id="disk-progress" style="width: 0%"></div>
-                    </div>
-                    <div style="font-size: 12px; color: #666; margin-top: 5px;" id="disk-details">-</div>
-                </div>
-            </div>
-        </div>
+        {system_metrics_html}
         
-        <a href="/monitor/worker/{pid}/page" class="back-link">← Back to Worker {pid} Details</a>
+        <a href="/monitor/worker/__PID__/page" class="back-link">← Back to Worker __PID__ Details</a>
         
         <div class="worker-info" id="worker-info">
-            <h2>Worker Process {pid}</h2>
+            <h2>Worker Process __PID__</h2>
             <p id="process-info">Loading process information...</p>
         </div>
         
@@ -4975,188 +5520,153 @@ async def get_worker_logs_page(pid: int, username: str = Depends(verify_dashboar
         <div id="logs-container" class="logs-container loading">Loading logs...</div>
     </div>
     
+    <script src="{common_js_url}"></script>
     <script>
-        const pid = {pid};
-        let autoRefreshInterval = null;
+        const pid = __PID__;
+        let stopAutoRefresh = null;
+        let lastLogsBody = null;  // Response body currently rendered in logs-container
+        let logsRequestSeq = 0;  // Bumped per fetchLogs call; only the latest call may render
         
-        function formatLogEntry(log) {{
+        function formatLogEntry(log) {
             const timestamp = log.timestamp || '';
             const level = (log.level || 'INFO').toUpperCase();
             const message = log.message || '';
-            const module = log.module ? `[${{log.module}}]` : '';
+            const module = log.module ? `[${log.module}]` : '';
             
             return `
                 <div class="log-entry">
-                    <span class="log-timestamp">${{timestamp}}</span>
-                    <span class="log-level ${{level}}">${{level}}</span>
-                    ${{module ? `<span style="color: #858585;">${{module}}</span>` : ''}}
-                    <span class="log-message">${{escapeHtml(message)}}</span>
+                    <span class="log-timestamp">${escapeHtml(timestamp)}</span>
+                    <span class="log-level ${escapeHtml(level)}">${escapeHtml(level)}</span>
+                    ${module ? `<span style="color: #858585;">${escapeHtml(module)}</span>` : ''}
+                    <span class="log-message">${escapeHtml(message)}</span>
                 </div>
             `;
-        }}
-        
-        function escapeHtml(text) {{
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }}
+        }
         
-        async function fetchWorkerInfo() {{
-            try {{
-                const response = await fetch(`/monitor/worker/${{pid}}`);
+        async function fetchWorkerInfo() {
+            try {
+                const response = await fetch(`/monitor/worker/${pid}`);
                 const data = await response.json();
                 
-                if (data.error) {{
+                if (data.error) {
                     document.getElementById('process-info').textContent = 
                         'Error: ' + data.error;
                     return;
-                }}
+                }
                 
                 document.getElementById('process-info').innerHTML = 
-                    `Process: <strong>${{data.name || 'N/A'}}</strong> | ` +
-                    `Status: <strong>${{data.status || 'N/A'}}</strong> | ` +
-                    `Uptime: <strong>${{formatUptime(data.uptime_seconds || 0)}}</strong>`;
-            }} catch (error) {{
+                    `Process: <strong>${escapeHtml(data.name || 'N/A')}</strong> | ` +
+                    `Status: <strong>${escapeHtml(data.status || 'N/A')}</strong> | ` +
+                    `Uptime: <strong>${formatUptime(data.uptime_seconds || 0)}</strong>`;
+            } catch (error) {
                 document.getElementById('process-info').textContent = 
                     'Error loading process info: ' + error.message;
-            }}
-        }}
+            }
+        }
         
-        function formatUptime(seconds) {{
-            const days = Math.floor(seconds / 86400);
-            const hours = Math.floor((seconds % 86400) / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            const secs = seconds % 60;
-            
-            if (days > 0) return `${{days}}d ${{hours}}h ${{minutes}}m`;
-            if (hours > 0) return `${{hours}}h ${{minutes}}m`;
-            if (minutes > 0) return `${{minutes}}m ${{secs}}s`;
-            return `${{secs}}s`;
-        }}
-        
-        async function fetchLogs() {{
-            try {{
+        async function fetchLogs(signal) {
+            const request = ++logsRequestSeq;
+            try {
                 const limit = document.getElementById('limit-select').value;
                 const level = document.getElementById('level-select').value;
-                const params = new URLSearchParams({{ limit }});
+                const params = new URLSearchParams({ limit });
                 if (level) params.append('level', level);
                 
-                const response = await fetch(`/monitor/worker/${{pid}}/logs?${{params}}`, {{
-                    credentials: 'same-origin'
-                }});
+                const response = await fetch(`/monitor/worker/${pid}/logs?${params}`, {
+                    credentials: 'same-origin',
+                    signal
+                });
                 
-                if (!response.ok) {{
-                    throw new Error(`HTTP ${{response.status}}: ${{response.statusText}}`);
-                }}
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                }
                 
                 const contentType = response.headers.get('content-type');
-                if (!contentType || !contentType.includes('application/json')) {{
+                if (!contentType || !contentType.includes('application/json')) {
                     throw new Error('Server returned non-JSON response. Authentication may have failed.');
-                }}
+                }
                 
-                const data = await response.json();
+                // Auto-refresh mostly returns the same entries; keep the rendered ones then
+                const body = await response.text();
+                // A manual refresh or filter change started a newer fetch; its result wins
+                if (request !== logsRequestSeq) return;
+                if (body === lastLogsBody) {
+                    document.getElementById('error-container').innerHTML = '';
+                    return;
+                }
+                const data = JSON.parse(body);
+                lastLogsBody = body;
                 
-                if (data.error) {{
+                if (data.error) {
                     document.getElementById('logs-container').innerHTML = 
-                        '<div class="error">Error: ' + data.error + '</div>';
+                        '<div class="error">Error: ' + escapeHtml(data.error) + '</div>';
                     document.getElementById('error-container').innerHTML = '';
                     return;
-                }}
+                }
                 
-                if (data.logs.length === 0) {{
+                if (data.logs.length === 0) {
                     document.getElementById('logs-container').innerHTML = 
                         '<div class="loading">No logs found for this worker</div>';
                     document.getElementById('error-container').innerHTML = '';
                     return;
-                }}
+                }
                 
                 let html = '';
-                data.logs.forEach(log => {{
+                data.logs.forEach(log => {
                     html += formatLogEntry(log);
-                }});
+                });
                 
                 document.getElementById('logs-container').innerHTML = html;
                 document.getElementById('error-container').innerHTML = '';
                 
                 // Auto-scroll to bottom if enabled
-                if (document.getElementById('auto-scroll').checked) {{
+                if (document.getElementById('auto-scroll').checked) {
                     const container = document.getElementById('logs-container');
                     container.scrollTop = container.scrollHeight;
-                }}
-            }} catch (error) {{
+                }
+            } catch (error) {
+                if (request !== logsRequestSeq) return;
+                lastLogsBody = null;
                 document.getElementById('logs-container').innerHTML = 
-                    '<div class="error">Error fetching logs: ' + error.message + '</div>';
+                    '<div class="error">Error fetching logs: ' + escapeHtml(error.message) + '</div>';
                 document.getElementById('error-container').innerHTML = '';
-            }}
-        }}
+            }
+        }
         
-        function toggleAutoRefresh() {{
+        function toggleAutoRefresh() {
             const checkbox = document.getElementById('auto-refresh');
-            if (checkbox.checked) {{
-                autoRefreshInterval = setInterval(fetchLogs, 5000);
-            }} else {{
-                if (autoRefreshInterval) {{
-                    clearInterval(autoRefreshInterval);
-                    autoRefreshInterval = null;
-                }}
-            }}
-        }}
+            if (checkbox.checked) {
+                if (!stopAutoRefresh) {
+                    stopAutoRefresh = startPolling(fetchLogs, 5000);
+                }
+            } else if (stopAutoRefresh) {
+                stopAutoRefresh();
+                stopAutoRefresh = null;
+            }
+        }
         
         document.getElementById('auto-refresh').addEventListener('change', toggleAutoRefresh);
         
-        async function fetchSystemMetrics() {{
-            try {{
-                const response = await fetch('/monitor/stats');
-                const data = await response.json();
-                
-                if (data.system) {{
-                    const cpuPercent = data.system.cpu_percent;
-                    const memPercent = data.system.memory_percent;
-                    
-                    document.getElementById('cpu-percent').textContent = cpuPercent.toFixed(1) + '%';
-                    const cpuProgress = document.getElementById('cpu-progress');
-                    cpuProgress.style.width = cpuPercent + '%';
-                    cpuProgress.className = 'progress-fill' + 
-                        (cpuPercent > 80 ? ' danger' : cpuPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    const memProgress = document.getElementById('memory-progress');
-                    memProgress.style.width = memPercent + '%';
-                    memProgress.className = 'progress-fill' + 
-                        (memPercent > 80 ? ' danger' : memPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('memory-details').textContent = 
-                        data.system.memory_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.memory_total_gb.toFixed(2) + ' GB';
-                    
-                    const diskPercent = data.system.disk_percent;
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    const diskProgress = document.getElementById('disk-progress');
-                    diskProgress.style.width = diskPercent + '%';
-                    diskProgress.className = 'progress-fill' + 
-                        (diskPercent > 80 ? ' danger' : diskPercent > 60 ? ' warning' : '');
-                    
-                    document.getElementById('disk-details').textContent = 
-                        data.system.disk_used_gb.toFixed(2) + ' GB / ' + 
-                        data.system.disk_total_gb.toFixed(2) + ' GB';
-                }}
-            }} catch (error) {{
-                // Silently fail - don't break the page if system metrics fail
-            }}
-        }}
-        
         // Initial load
-        fetchSystemMetrics();
         fetchWorkerInfo();
         fetchLogs();
         
-        // Auto-refresh system metrics every 0.5 seconds (matching dashboard)
-        setInterval(() => {{
-            fetchSystemMetrics();
-        }}, 500);
+        // System metrics are pushed over the stats stream (polled every 0.5 seconds without EventSource)
+        startStream('/monitor/stats', updateSystemMetrics, 500);
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+""").replace("{logs_css_url}", LOGS_CSS_URL)
+_WORKER_LOGS_PAGE_PARTS = _page_template_parts(_WORKER_LOGS_PAGE_HTML, "__PID__")
+
+
+@functools.lru_cache(maxsize=WORKER_DETAIL_PAGE_CACHE_SIZE)
+def _worker_logs_page(pid: int) -> _PageBodies:
+    """Render and compress the worker logs page for a PID (cached per PID)."""
+    return _build_page_bodies(str(pid).encode("utf-8").join(_WORKER_LOGS_PAGE_PARTS))
+
+@router.get("/worker/{pid}/logs/page", response_class=HTMLResponse)
+async def get_worker_logs_page(pid: int, request: Request, username: str = Depends(verify_dashboard_credentials)):
+    """HTML page for viewing worker-specific logs."""
+    return _page_response(request, _worker_logs_page(pid))
 
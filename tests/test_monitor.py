@@ -0,0 +1,244 @@
+"""Tests for monitoring helpers."""
+import asyncio
+import base64
+import subprocess
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.main import app
+from app.routes import monitor
+from app.routes.monitor import _extract_journalctl_log_level, _get_snapshot, _tail_file
+
+
+def test_tail_file_returns_last_lines(tmp_path):
+    """Test reading the last N lines of a log file."""
+    log_file = tmp_path / "app.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(1000)))
+    
+    assert _tail_file(log_file, 3) == ["line 997", "line 998", "line 999"]
+    assert len(_tail_file(log_file, 5000)) == 1000
+
+
+def test_snapshot_is_built_once_for_concurrent_callers():
+    """Test that concurrent requests for a snapshot share one build."""
+    builds = []
+    
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": len(builds)}
+    
+    async def fetch_concurrently():
+        return await asyncio.gather(*(_get_snapshot("test-snapshot", build) for _ in range(5)))
+    
+    results = asyncio.run(fetch_concurrently())
+    
+    assert len(builds) == 1
+    assert all(body == b'{"value":1}' for _, body in results)
+
+
+def test_prepared_page_response_is_reused_across_requests():
+    """Test that a shared page Response serves every request unchanged."""
+    client = TestClient(app)
+    
+    first = client.get("/monitor/logout", headers={"Accept-Encoding": "identity"})
+    second = client.get("/monitor/logout", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/monitor/logout", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get("/monitor/logout", headers={"If-None-Match": first.headers["etag"]})
+    
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first.headers == second.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.content == first.content  # httpx decodes the gzip body
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_snapshot_endpoint_revalidates_with_etag(monkeypatch):
+    """Test that a polled JSON endpoint answers a matching If-None-Match with 304."""
+    # Keep both requests on the same snapshot however slow the run is
+    monkeypatch.setattr(monitor, "SNAPSHOT_TTL", 60)
+    client = TestClient(app)
+    
+    first = client.get("/monitor/stats")
+    revalidated = client.get("/monitor/stats", headers={"If-None-Match": first.headers["etag"]})
+    
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == first.headers["etag"]
+
+
+def test_journalctl_level_keyword_scan_covers_whole_message():
+    """Test that an error keyword late in a message outranks earlier level words."""
+    line = (
+        "2026-01-04T12:00:00+0000 info 6 host frl-python-api[123]: fetched info for account 42 "
+        "from upstream service cache layer ok; then upstream raised error 500"
+    )
+    
+    assert _extract_journalctl_log_level(line) == "ERROR"
+
+
+def _fake_journalctl(monkeypatch, grep_result):
+    """Replace journalctl with a stub; --grep runs get grep_result, plain runs a tail."""
+    calls = []
+    
+    async def fake_exec(cmd, timeout=monitor.JOURNALCTL_TIMEOUT):
+        calls.append(cmd)
+        if "--grep" not in cmd:
+            return subprocess.CompletedProcess(cmd, 0, "tail\n", "")
+        if isinstance(grep_result, Exception):
+            raise grep_result
+        return subprocess.CompletedProcess(cmd, *grep_result)
+    
+    monkeypatch.setattr(monitor, "_exec_journalctl", fake_exec)
+    return calls
+
+
+def test_journalctl_grep_without_matches_is_empty_result(monkeypatch):
+    """Test that journalctl's silent exit 1 for no matches means no lines, not an error."""
+    calls = _fake_journalctl(monkeypatch, (1, "", ""))
+    
+    result = asyncio.run(monitor._run_journalctl(["journalctl"], "ERROR"))
+    
+    assert (result.returncode, result.stdout) == (0, "")
+    assert len(calls) == 1
+
+
+def test_journalctl_grep_falls_back_without_pcre2(monkeypatch):
+    """Test that a journalctl built without pattern support reruns without --grep."""
+    calls = _fake_journalctl(monkeypatch, (1, "", "Compiled without pattern matching support"))
+    
+    result = asyncio.run(monitor._run_journalctl(["journalctl"], "ERROR"))
+    
+    assert result.stdout == "tail\n"
+    assert calls == [["journalctl", "--grep", "err"], ["journalctl"]]
+
+
+def test_journalctl_grep_error_is_passed_through(monkeypatch):
+    """Test that other journalctl failures reach the caller unchanged."""
+    calls = _fake_journalctl(monkeypatch, (1, "", "Failed to open journal: Permission denied"))
+    
+    result = asyncio.run(monitor._run_journalctl(["journalctl"], "ERROR"))
+    
+    assert result.returncode == 1
+    assert "Permission denied" in result.stderr
+    assert len(calls) == 1
+
+
+def test_journalctl_grep_timeout_falls_back_to_tail(monkeypatch):
+    """Test that a --grep scan that runs too long is replaced by the plain tail."""
+    calls = _fake_journalctl(monkeypatch, asyncio.TimeoutError())
+    
+    result = asyncio.run(monitor._run_journalctl(["journalctl"], "DEBUG"))
+    
+    assert result.stdout == "tail\n"
+    assert calls == [["journalctl", "--grep", "debug"], ["journalctl"]]
+
+
+def test_log_details_reads_journalctl_off_the_event_loop(monkeypatch, tmp_path):
+    """Test that the log hash lookup in journalctl mode keeps the event loop responsive."""
+    line = "2026-01-04T12:00:00+0000 host frl-python-api[7]: ERROR - upstream failed"
+    journalctl = tmp_path / "journalctl"
+    journalctl.write_text(f"#!/bin/sh\nsleep 0.5\necho '{line}'\n")
+    journalctl.chmod(0o755)
+    monkeypatch.setattr(monitor, "USE_JOURNALCTL", True)
+    monkeypatch.setattr(monitor, "JOURNALCTL_PATH", str(journalctl))
+    log_hash = monitor._log_hash_digest(line[:19], line[20:], None).hex()
+    
+    async def lookup_while_ticking():
+        ticks = 0
+        lookup = asyncio.create_task(monitor.get_log_details(log_hash))
+        while not lookup.done():
+            await asyncio.sleep(0.05)
+            ticks += 1
+        return lookup.result(), ticks
+    
+    result, ticks = asyncio.run(lookup_while_ticking())
+    
+    assert result["message"] == line[20:]
+    assert result["source"] == "journalctl"
+    assert ticks >= 5  # The loop kept running while journalctl was busy
+
+
+def test_explicit_gzip_outranks_wildcard_in_accept_encoding():
+    """Test that an explicit gzip entry wins over "*" wherever each appears."""
+    client = TestClient(app)
+    
+    allowed = client.get("/monitor/logout", headers={"Accept-Encoding": "*;q=0, gzip"})
+    refused = client.get("/monitor/logout", headers={"Accept-Encoding": "gzip;q=0.0, *"})
+    
+    assert allowed.headers.get("content-encoding") == "gzip"
+    assert "content-encoding" not in refused.headers
+
+
+def _basic_auth_request(username, password):
+    """Build a bare request carrying HTTP Basic credentials."""
+    token = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return Request({"type": "http", "headers": [(b"authorization", f"Basic {token}".encode())]})
+
+
+def _stub_dashboard_validation(monkeypatch, now):
+    """Start with an empty auth cache, a fixed clock and a counting validator (password "secret")."""
+    checks = []
+    
+    def validate(username, password):
+        checks.append(username)
+        return password == "secret"
+    
+    monkeypatch.setattr("app.services.auth.validate_dashboard_credentials", validate)
+    monkeypatch.setitem(monitor._auth_cache, "entries", {})
+    monkeypatch.setattr(monitor.time, "time", lambda: now[0])
+    return checks
+
+
+def test_auth_cache_never_stores_failed_logins(monkeypatch):
+    """Test that a wrong password is rejected every time and never cached."""
+    checks = _stub_dashboard_validation(monkeypatch, [1000.0])
+    
+    for _ in range(2):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(monitor.verify_dashboard_credentials(_basic_auth_request("admin", "wrong")))
+        assert error.value.status_code == 401
+    
+    assert checks == ["admin", "admin"]
+    assert monitor._auth_cache["entries"] == {}
+
+
+def test_auth_cache_entry_expires_after_ttl(monkeypatch):
+    """Test that a cached login is revalidated once AUTH_CACHE_TTL has passed."""
+    now = [1000.0]
+    checks = _stub_dashboard_validation(monkeypatch, now)
+    
+    def login():
+        return asyncio.run(monitor.verify_dashboard_credentials(_basic_auth_request("admin", "secret")))
+    
+    assert login() == "admin"
+    now[0] += monitor.AUTH_CACHE_TTL - 1
+    assert login() == "admin"
+    assert len(checks) == 1  # Served from the cache
+    
+    now[0] += 1
+    assert login() == "admin"
+    assert len(checks) == 2  # Expired, validated again
+
+
+def test_auth_cache_is_bounded(monkeypatch):
+    """Test that the auth cache keeps at most AUTH_CACHE_MAXSIZE entries, evicting the oldest."""
+    checks = _stub_dashboard_validation(monkeypatch, [1000.0])
+    monkeypatch.setattr(monitor, "AUTH_CACHE_MAXSIZE", 4)
+    
+    for i in range(6):
+        asyncio.run(monitor.verify_dashboard_credentials(_basic_auth_request(f"user{i}", "secret")))
+    
+    assert len(monitor._auth_cache["entries"]) == 4
+    # The newest login is still cached; the oldest was evicted and must validate again
+    asyncio.run(monitor.verify_dashboard_credentials(_basic_auth_request("user5", "secret")))
+    asyncio.run(monitor.verify_dashboard_credentials(_basic_auth_request("user0", "secret")))
+    assert checks[6:] == ["user0"]
+    assert len(monitor._auth_cache["entries"]) == 4